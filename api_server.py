@@ -1,10 +1,32 @@
+import logging
 from fastapi import FastAPI, Query, BackgroundTasks
+from config.browser_server import BrowserServer
+from config.config import ScraperConfig
 from playwright_scrapers.scrapers.gelbeseiten.scraper import GelbeseitenScraper
 from playwright_scrapers.scrapers.googlemaps.scraper import GoogleMapsScraper
 from utils.db import get_all_raw_companies
 from apis.bundesanzeiger import BundesanzeigerScraper
 
 app = FastAPI()
+logger = logging.getLogger(__name__)
+
+# One Chromium shared by all requests instead of a cold launch per request
+warm_browser = BrowserServer()
+
+
+@app.on_event("startup")
+def start_warm_browser():
+    if ScraperConfig.BROWSER_ENDPOINT:
+        return
+    try:
+        ScraperConfig.BROWSER_ENDPOINT = warm_browser.start()
+    except Exception as e:
+        logger.warning(f"Warm browser unavailable, scrapers will launch their own: {e}")
+
+
+@app.on_event("shutdown")
+def stop_warm_browser():
+    warm_browser.stop()
 
 
 @app.get("/scrape/gelbeseiten")
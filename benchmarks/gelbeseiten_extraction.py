@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Gelbeseiten first-page extraction benchmark.
+
+Compares the per-page latency of the old extraction, which walks
+ElementHandles with several CDP round trips per entry, with the current one,
+which takes one page.content() round trip and parses it in Python.
+
+Usage:
+  python benchmarks/gelbeseiten_extraction.py --query friseur --location berlin
+  python benchmarks/gelbeseiten_extraction.py --html saved_results_page.html
+"""
+
+import argparse
+import base64
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.browser import BrowserManager
+from scrapers.gelbeseiten.config import GelbeseitenConfig
+from scrapers.gelbeseiten.parser import (
+    format_address,
+    parse_entries,
+    search_query_from_url,
+)
+
+
+def extract_with_handles(page):
+    """The previous implementation: one or more round trips per field per entry."""
+    selectors = GelbeseitenConfig.SELECTORS
+    results = []
+    for entry in page.query_selector_all(selectors["company_article"]):
+        name = entry.query_selector(selectors["company_name"]).text_content()
+        url_container = entry.query_selector(selectors["company_website"])
+        url_encoded = (
+            url_container.get_attribute("data-webseitelink") if url_container else None
+        )
+        address_elem = entry.query_selector(selectors["company_address"])
+        phone_elem = entry.query_selector(selectors["company_phone"])
+        results.append(
+            {
+                "company_name": name.strip(),
+                "company_website": (
+                    base64.b64decode(url_encoded).decode("utf-8") if url_encoded else ""
+                ),
+                "address": (
+                    format_address(address_elem.text_content()) if address_elem else ""
+                ),
+                "phone": phone_elem.text_content().strip() if phone_elem else "",
+                "search_query": search_query_from_url(page.url),
+            }
+        )
+    return results
+
+
+def extract_with_content(page):
+    """The current implementation: one round trip, parsed in-process."""
+    return parse_entries(page.content(), search_query_from_url(page.url))
+
+
+def measure(extract, page, runs: int):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        entries = extract(page)
+        timings.append((time.perf_counter() - started) * 1000)
+    return len(entries), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark first-page extraction")
+    parser.add_argument("--query", type=str, default="friseur")
+    parser.add_argument("--location", type=str, default="berlin")
+    parser.add_argument("--html", type=str, help="Saved result page instead of live")
+    parser.add_argument("--runs", "-n", type=int, default=20)
+    args = parser.parse_args()
+
+    with BrowserManager(browser_endpoint="") as browser:
+        page = browser.get_page()
+        if args.html:
+            with open(args.html, encoding="utf-8") as f:
+                page.set_content(f.read())
+        else:
+            page.goto(f"{GelbeseitenConfig.BASE_URL}/{args.query}/{args.location}")
+            page.wait_for_selector(GelbeseitenConfig.SELECTORS["company_article"])
+
+        print(
+            f"{'method':<10} {'entries':>7} {'avg ms':>8} {'min ms':>8} {'max ms':>8}"
+        )
+        for name, extract in (
+            ("handles", extract_with_handles),
+            ("content", extract_with_content),
+        ):
+            count, timings = measure(extract, page, args.runs)
+            print(
+                f"{name:<10} {count:>7} {statistics.mean(timings):>8.1f} "
+                f"{min(timings):>8.1f} {max(timings):>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import questionary
 from typing import List
 from config.base_cli import ScraperCLI
@@ -20,6 +21,14 @@ def get_available_scrapers() -> List[ScraperCLI]:
 
 def main():
     """Main CLI entry point - handles action selection only."""
+    parser = argparse.ArgumentParser(description="Scrapers CLI")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run of the same query and location from its checkpoint",
+    )
+    args = parser.parse_args()
+
     print("Scrapers CLI")
     print("=" * 50)
 
@@ -50,7 +59,7 @@ def main():
 
     # Execute the selected scraper
     try:
-        selected.execute()
+        selected.execute(resume=args.resume)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
     except Exception as e:
@@ -0,0 +1,373 @@
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from .browser import RotationStats, build_context_options, stealth_init_scripts
+from .browser_server import is_endpoint_alive
+from .config import ScraperConfig
+from .memory_watchdog import MemoryWatchdog
+from .proxy_pool import ProxyPool, ProxyState, reserve_slots, wait_for_slot_async
+from .rate_limiter import AdaptiveRateLimiter, RateLimiter
+from .resource_blocker import ResourceBlocker
+from .storage_state import StorageStateCache
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolSlot:
+    """A context/page pair that AsyncBrowserManager leases to one coroutine."""
+
+    def __init__(self, slot_id: int):
+        self.slot_id = slot_id
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.request_count = 0
+        # Background task building the next context/page pair
+        self.standby: Optional[asyncio.Task] = None
+
+
+class AsyncBrowserManager:
+    """Asyncio counterpart of BrowserManager that leases pages from a bounded pool.
+
+    One Chromium instance serves ``pool_size`` contexts. Each context is
+    rotated every ``CONTEXT_REFRESH_INTERVAL`` leases, like
+    ``BrowserManager.get_page`` does for its single page. When the memory
+    watchdog asks for a recycle, new leases wait until the leased pages are
+    returned, then the browser is relaunched.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        proxy: Optional[str] = None,
+        pool_size: int = ScraperConfig.PAGE_POOL_SIZE,
+        resource_blocker: Optional[ResourceBlocker] = None,
+        browser_endpoint: Optional[str] = None,
+        storage_domain: Optional[str] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        target_domain: Optional[str] = None,
+        memory_watchdog: Optional[MemoryWatchdog] = None,
+    ):
+        self.proxy = proxy
+        self.resource_blocker = resource_blocker
+        self.storage_domain = storage_domain
+        self.storage_cache = StorageStateCache()
+        # When set, each slot's context gets the healthiest proxy, so the pool
+        # spreads across exit IPs and each is rate limited on its own
+        self.proxy_pool = proxy_pool
+        self._context_proxies: Dict[BrowserContext, ProxyState] = {}
+        self.browser_endpoint = (
+            ScraperConfig.BROWSER_ENDPOINT
+            if browser_endpoint is None
+            else browser_endpoint
+        )
+        self.pool_size = max(1, pool_size)
+        # Pass an AdaptiveRateLimiter to let the target's responses steer the rate.
+        # With a pool, the domain gets the pool's budget (see ProxyPool).
+        self.rate_limiter = rate_limiter or RateLimiter(
+            proxy_pool.domain_requests_per_minute if proxy_pool else requests_per_minute
+        )
+        # Domain the rate limit is tracked under (see rate_limiter.domain_key)
+        self.target_domain = target_domain
+        # Recycles the browser when its memory or page count grows too large
+        self.memory_watchdog = memory_watchdog or MemoryWatchdog()
+        # Reason for a recycle that waits for the leased pages to come back
+        self._recycle_reason: Optional[str] = None
+        self._recycle_lock = asyncio.Lock()
+        self._active_leases = 0
+        self._no_leases = asyncio.Event()
+        self._no_leases.set()
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._slots: List[_PoolSlot] = []
+        self._free_slots: Optional[asyncio.Queue] = None
+        self.prewarm = ScraperConfig.PREWARM_CONTEXTS
+        self.rotation_stats = RotationStats()
+        self._background: Set[asyncio.Task] = set()
+
+    async def start(self) -> "AsyncBrowserManager":
+        """Launch the browser and fill the slot pool."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self._launch_browser()
+        self._free_slots = asyncio.Queue()
+        self._slots = [_PoolSlot(slot_id) for slot_id in range(self.pool_size)]
+        for slot in self._slots:
+            self._free_slots.put_nowait(slot)
+        logger.info(f"Started async browser with a pool of {self.pool_size} pages")
+        return self
+
+    async def _launch_browser(self) -> Browser:
+        """Attach to the warm browser server if reachable, else launch Chromium."""
+        if await asyncio.to_thread(is_endpoint_alive, self.browser_endpoint):
+            try:
+                browser = await self.playwright.chromium.connect_over_cdp(
+                    self.browser_endpoint
+                )
+                logger.info(f"Attached to warm browser at {self.browser_endpoint}")
+                return browser
+            except Exception as e:
+                logger.warning(
+                    f"Could not attach to {self.browser_endpoint}: {e}. "
+                    "Launching a local browser."
+                )
+        return await self.playwright.chromium.launch(headless=ScraperConfig.HEADLESS)
+
+    async def _create_context(self) -> BrowserContext:
+        """Create a new browser context with rotated user agent."""
+        proxy_state = self.proxy_pool.acquire() if self.proxy_pool else None
+        options = build_context_options(proxy_state.url if proxy_state else self.proxy)
+        storage_state = self.storage_cache.load(self.storage_domain)
+        if storage_state:
+            options["storage_state"] = storage_state
+        context = await self.browser.new_context(**options)
+        logger.info(f"Created new context with user agent: {options['user_agent']}")
+        if self.resource_blocker and self.resource_blocker.enabled:
+            await context.route("**/*", self.resource_blocker.handle_route_async)
+            context.on("response", self.resource_blocker.record_response)
+        for script in stealth_init_scripts():
+            await context.add_init_script(script)
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.attach(context)
+        if proxy_state:
+            self.proxy_pool.attach(context, proxy_state, self.resource_blocker)
+            self._context_proxies[context] = proxy_state
+            logger.info(f"Context routed through proxy {proxy_state.label}")
+        return context
+
+    async def _open_context_page(self) -> Tuple[BrowserContext, Page]:
+        context = await self._create_context()
+        return context, await context.new_page()
+
+    def _run_in_background(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _close_quietly(self, context: BrowserContext, save_state: bool = True):
+        if save_state:
+            await self.storage_cache.save_async(self.storage_domain, context)
+        proxy_state = self._context_proxies.pop(context, None)
+        if proxy_state:
+            self.proxy_pool.release(proxy_state)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing retired context: {e}")
+
+    async def _take_standby(
+        self, slot: _PoolSlot
+    ) -> Optional[Tuple[BrowserContext, Page]]:
+        """Return the slot's prewarmed context/page pair, if it was built successfully."""
+        standby, slot.standby = slot.standby, None
+        if standby is None:
+            return None
+        try:
+            return await standby
+        except Exception as e:
+            logger.warning(f"Prewarming context for slot {slot.slot_id} failed: {e}")
+            return None
+
+    async def _reset_slot(self, slot: _PoolSlot):
+        """Close the slot's context so the next lease starts from scratch."""
+        standby = await self._take_standby(slot)
+        if standby:
+            await self._close_quietly(standby[0], save_state=False)
+        if slot.context:
+            await self._close_quietly(slot.context)
+        slot.context = None
+        slot.page = None
+
+    async def _prepare_slot(self, slot: _PoolSlot):
+        """Rotate the slot's context if needed and make sure it has an open page."""
+        slot.request_count += 1
+
+        proxy_state = self._context_proxies.get(slot.context)
+        if (
+            slot.context is None
+            or slot.page is None
+            or slot.page.is_closed()
+            or slot.request_count % ScraperConfig.CONTEXT_REFRESH_INTERVAL == 0
+            or (proxy_state is not None and proxy_state.is_quarantined())
+        ):
+            started = time.perf_counter()
+            rotating = slot.context is not None
+            standby = await self._take_standby(slot)
+
+            if slot.context and self.prewarm:
+                # Closing the old context does not need to block the lease
+                self._run_in_background(self._close_quietly(slot.context))
+            elif slot.context:
+                await self._close_quietly(slot.context)
+            slot.context, slot.page = standby or await self._open_context_page()
+
+            if rotating:
+                self.rotation_stats.record(
+                    time.perf_counter() - started, standby is not None
+                )
+
+        next_rotation_due = (
+            slot.request_count + 1
+        ) % ScraperConfig.CONTEXT_REFRESH_INTERVAL == 0
+        if self.prewarm and next_rotation_due and slot.standby is None:
+            slot.standby = self._run_in_background(self._open_context_page())
+
+    def _page_count(self) -> int:
+        try:
+            return sum(len(context.pages) for context in self.browser.contexts)
+        except Exception:
+            return 0
+
+    async def _recycle_browser(self, reason: str):
+        """Close every slot's context and relaunch (or reattach to) the browser.
+
+        Only called while no page is leased, so no coroutine loses its page.
+        """
+        logger.warning(f"Recycling browser: {reason}")
+        try:
+            for slot in self._slots:
+                await self._reset_slot(slot)
+            if self._background:
+                await asyncio.gather(*self._background, return_exceptions=True)
+            await self.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser for recycle: {e}")
+            for slot in self._slots:
+                slot.context = None
+                slot.page = None
+        self.browser = await self._launch_browser()
+        self.memory_watchdog.recycles += 1
+
+    async def _check_memory(self):
+        """Ask the watchdog before a slot is prepared; recycle once leases drain.
+
+        While a recycle is pending, every new lease waits here, so the pages
+        already leased are the only ones left to return.
+        """
+        if self._recycle_reason is None:
+            self._recycle_reason = self.memory_watchdog.recycle_reason(
+                self._page_count()
+            )
+        if self._recycle_reason is None:
+            return
+        async with self._recycle_lock:
+            # Another lease may have recycled while this one waited for the lock
+            if self._recycle_reason is None:
+                return
+            await self._no_leases.wait()
+            reason, self._recycle_reason = self._recycle_reason, None
+            await self._recycle_browser(reason)
+
+    async def save_storage_state(
+        self, context: BrowserContext, domain: Optional[str] = None
+    ) -> bool:
+        """Persist a leased context's storage state, e.g. right after consent."""
+        return await self.storage_cache.save_async(
+            domain or self.storage_domain, context
+        )
+
+    async def throttle(self, page: Page):
+        """Wait for the rate limit before a request from ``page``.
+
+        lease_page() calls this itself; scrapers call it before requests they
+        send from an already leased page (e.g. AJAX pagination). The page's
+        proxy limit and the domain limit are reserved together.
+        """
+        proxy_state = self._context_proxies.get(page.context)
+        await wait_for_slot_async(
+            self.rate_limiter,
+            self.target_domain,
+            proxy_state.rate_limiter if proxy_state else None,
+        )
+
+    def reserve(self, page: Page, count: int = 1) -> List[float]:
+        """Reserve ``count`` request slots for ``page`` and return each one's delay."""
+        proxy_state = self._context_proxies.get(page.context)
+        return reserve_slots(
+            self.rate_limiter,
+            self.target_domain,
+            proxy_state.rate_limiter if proxy_state else None,
+            count,
+        )
+
+    def report_success(self, count: int = 1):
+        """Tell an adaptive rate limiter ``count`` paced requests went through.
+
+        For API calls a scraper sends itself; navigations are counted by
+        AdaptiveRateLimiter.attach().
+        """
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            for _ in range(count):
+                self.rate_limiter.record_success(self.target_domain)
+
+    def report_throttle(self, reason: str):
+        """Tell an adaptive rate limiter the target signalled us to slow down."""
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.record_throttle(self.target_domain, reason)
+
+    @property
+    def current_rate(self) -> float:
+        """Requests per minute currently allowed for the target domain."""
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            return self.rate_limiter.current_rate(self.target_domain)
+        return self.rate_limiter.requests_per_minute
+
+    @asynccontextmanager
+    async def lease_page(self) -> AsyncIterator[Page]:
+        """Lease a page from the pool for the duration of the ``async with`` block.
+
+        Waits until a slot is free. If the block raises, the slot's context
+        is discarded so a broken page is never handed out again.
+        """
+        if self._free_slots is None:
+            raise RuntimeError("AsyncBrowserManager.start() has not been called")
+
+        slot = await self._free_slots.get()
+        try:
+            await self._check_memory()
+        except BaseException:
+            self._free_slots.put_nowait(slot)
+            raise
+        self._active_leases += 1
+        self._no_leases.clear()
+        try:
+            await self._prepare_slot(slot)
+            await self.throttle(slot.page)
+            yield slot.page
+        except BaseException:
+            await self._reset_slot(slot)
+            raise
+        finally:
+            self._active_leases -= 1
+            if not self._active_leases:
+                self._no_leases.set()
+            self._free_slots.put_nowait(slot)
+
+    async def close(self):
+        """Clean up resources."""
+        if self.resource_blocker:
+            self.resource_blocker.log_stats()
+        self.rotation_stats.log_summary()
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.log_rates()
+        self.memory_watchdog.sample()
+        self.memory_watchdog.log_summary()
+        for slot in self._slots:
+            await self._reset_slot(slot)
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        self.rate_limiter.close()
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
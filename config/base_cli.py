@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class ScraperCLI(ABC):
@@ -25,8 +25,12 @@ class ScraperCLI(ABC):
         """
         pass
 
-    def execute(self, params: Dict[str, Any] = None) -> bool:
-        """Execute the scraper with user-provided parameters."""
+    def execute(self, params: Dict[str, Any] = None, resume: bool = False) -> bool:
+        """Execute the scraper with user-provided parameters.
+
+        With ``resume``, scrapers that keep checkpoints continue an
+        interrupted run of the same query and location.
+        """
         print(f"\nStarting {self.name}...")
         print(f"{self.description}")
 
@@ -36,6 +40,7 @@ class ScraperCLI(ABC):
             if params is None:
                 print("❌ Operation cancelled.")
                 return False
+        params.setdefault("resume", resume)
 
         if hasattr(self, "run_scraper") and callable(getattr(self, "run_scraper")):
             try:
@@ -44,6 +49,49 @@ class ScraperCLI(ABC):
                 print(f"❌ Direct execution failed: {e}")
                 return False
 
+    def run_grid(
+        self,
+        scraper: str,
+        params: Dict[str, Any],
+        queries: List[str],
+        locations: List[str],
+        data_dir: str,
+        scraper_options: Dict[str, Any] = None,
+    ) -> bool:
+        """Run every query × location pair on a worker farm, storing unique companies.
+
+        ``scraper_options`` go to the scraper in each worker. Grid runs keep
+        no checkpoints and search each pair once, so a radius or resume
+        request is reported and ignored.
+        """
+        from config.grid_runner import GridRunner
+        from utils.sinks import create_sink
+
+        print(f"Running {len(queries)} queries × {len(locations)} locations")
+        if int(params.get("radius_meters") or 0) > 0:
+            print(
+                "⚠️ Radius tiling is not available for grids; each pair is one search"
+            )
+        if params.get("resume"):
+            print("⚠️ Grid runs keep no checkpoints; starting over instead of resuming")
+        runner = GridRunner(
+            scraper,
+            requests_per_minute=int(params.get("requests_per_minute")),
+            scraper_options=scraper_options,
+        )
+        with create_sink(
+            params.get("storage_type", "both"),
+            f"{scraper}_companies",
+            data_dir,
+            f"{scraper}_grid",
+        ) as sink:
+            count = runner.run(queries, locations, int(params["max_entries"]), sink)
+        print(
+            f"✅ Stored {count} unique entries "
+            f"({runner.deduplicator.duplicates} duplicates dropped)"
+        )
+        return count > 0
+
 
 # Keep EnricherCLI as an alias for backward compatibility
 EnricherCLI = ScraperCLI
@@ -1,13 +1,26 @@
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
 import logging
 import random
-from typing import Optional
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from .browser_server import is_endpoint_alive
 from .config import ScraperConfig
-from .rate_limiter import RateLimiter
+from .memory_watchdog import MemoryWatchdog
+from .proxy_pool import (
+    ProxyPool,
+    ProxyState,
+    proxy_settings,
+    reserve_slots,
+    wait_for_slot,
+)
+from .rate_limiter import AdaptiveRateLimiter, RateLimiter
+from .resource_blocker import ResourceBlocker
+from .storage_state import StorageStateCache
 
-# Add stealth import
-from playwright_stealth import stealth_sync
+# Stealth scripts are installed once per context as init scripts
+from playwright_stealth.stealth import StealthConfig
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +29,84 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def build_context_options(proxy: Optional[str] = None) -> Dict[str, Any]:
+    """Build the options for a new browser context with a rotated user agent.
+
+    Shared by BrowserManager and AsyncBrowserManager so both hand out
+    identically configured contexts.
+    """
+    return {
+        "user_agent": random.choice(ScraperConfig.USER_AGENTS),
+        "viewport": {
+            "width": ScraperConfig.VIEWPORT_WIDTH,
+            "height": ScraperConfig.VIEWPORT_HEIGHT,
+        },
+        "proxy": proxy_settings(proxy),
+        "extra_http_headers": ScraperConfig.BROWSER_HEADERS,
+        "locale": "de-DE",
+        "geolocation": {"longitude": 13.4050, "latitude": 52.5200},  # Berlin
+        "permissions": ["geolocation"],
+    }
+
+
+_stealth_scripts: Optional[List[str]] = None
+
+
+def stealth_init_scripts() -> List[str]:
+    """Return the playwright-stealth scripts to install on every new context."""
+    global _stealth_scripts
+    if _stealth_scripts is None:
+        _stealth_scripts = list(StealthConfig().enabled_scripts)
+    return _stealth_scripts
+
+
+class RotationStats:
+    """Tracks how long context rotation blocks get_page()/lease_page().
+
+    ``prepare_seconds`` is time spent building a standby context on the
+    caller's path ahead of the rotation (the sync manager does this inline).
+    It counts as blocking, so prewarming is not credited with cost it only
+    moved to an earlier call.
+    """
+
+    def __init__(self):
+        self.rotations = 0
+        self.prewarmed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.prepare_seconds = 0.0
+
+    def record(self, seconds: float, prewarmed: bool, prepare_seconds: float = 0.0):
+        self.rotations += 1
+        self.prewarmed += int(prewarmed)
+        self.total_seconds += seconds + prepare_seconds
+        self.prepare_seconds += prepare_seconds
+        self.max_seconds = max(self.max_seconds, seconds + prepare_seconds)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "rotations": self.rotations,
+            "prewarmed": self.prewarmed,
+            "avg_ms": (
+                self.total_seconds / self.rotations * 1000 if self.rotations else 0.0
+            ),
+            "max_ms": self.max_seconds * 1000,
+            "total_ms": self.total_seconds * 1000,
+            "prepare_ms": self.prepare_seconds * 1000,
+        }
+
+    def log_summary(self):
+        if not self.rotations:
+            return
+        summary = self.summary()
+        logger.info(
+            f"Context rotation: {summary['rotations']} rotations "
+            f"({summary['prewarmed']} prewarmed), "
+            f"avg {summary['avg_ms']:.1f} ms, max {summary['max_ms']:.1f} ms "
+            f"({summary['prepare_ms']:.1f} ms of it building standby contexts)"
+        )
+
+
 class BrowserManager:
     """Manages Playwright browser with rate limiting and user agent rotation."""
 
@@ -23,65 +114,288 @@ class BrowserManager:
         self,
         requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
         proxy: Optional[str] = None,
+        resource_blocker: Optional[ResourceBlocker] = None,
+        browser_endpoint: Optional[str] = None,
+        storage_domain: Optional[str] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        target_domain: Optional[str] = None,
+        memory_watchdog: Optional[MemoryWatchdog] = None,
     ):
         self.proxy = proxy
-        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.resource_blocker = resource_blocker
+        # Domain whose cookies/localStorage are restored into new contexts
+        self.storage_domain = storage_domain
+        self.storage_cache = StorageStateCache()
+        # When set, each context gets the healthiest proxy instead of ``proxy``
+        self.proxy_pool = proxy_pool
+        self._context_proxies: Dict[BrowserContext, ProxyState] = {}
+        # Pass "" to force a local launch even if BROWSER_ENDPOINT is configured
+        self.browser_endpoint = (
+            ScraperConfig.BROWSER_ENDPOINT
+            if browser_endpoint is None
+            else browser_endpoint
+        )
+        # Pass an AdaptiveRateLimiter to let the target's responses steer the rate.
+        # With a pool, the domain gets the pool's budget (see ProxyPool).
+        self.rate_limiter = rate_limiter or RateLimiter(
+            proxy_pool.domain_requests_per_minute if proxy_pool else requests_per_minute
+        )
+        # Domain the rate limit is tracked under (see rate_limiter.domain_key)
+        self.target_domain = target_domain
+        # Recycles the browser when its memory or page count grows too large
+        self.memory_watchdog = memory_watchdog or MemoryWatchdog()
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=ScraperConfig.HEADLESS)
+        self.browser = self._launch_browser()
         self.context = None
         self.page = None
         self.request_count = 0
+        self.prewarm = ScraperConfig.PREWARM_CONTEXTS
+        self.rotation_stats = RotationStats()
+        # Next context/page pair, prepared before the rotation that needs it
+        self._standby: Optional[Tuple[BrowserContext, Page]] = None
+        # How long building the standby blocked the get_page() call before
+        self._standby_seconds = 0.0
+        # Contexts swapped out but not yet closed
+        self._retired: List[BrowserContext] = []
+
+    def _launch_browser(self) -> Browser:
+        """Attach to the warm browser server if reachable, else launch Chromium."""
+        if is_endpoint_alive(self.browser_endpoint):
+            try:
+                browser = self.playwright.chromium.connect_over_cdp(
+                    self.browser_endpoint
+                )
+                logger.info(f"Attached to warm browser at {self.browser_endpoint}")
+                return browser
+            except Exception as e:
+                logger.warning(
+                    f"Could not attach to {self.browser_endpoint}: {e}. "
+                    "Launching a local browser."
+                )
+        return self.playwright.chromium.launch(headless=ScraperConfig.HEADLESS)
 
     def _create_context(self) -> BrowserContext:
         """Create a new browser context with rotated user agent and stealth."""
-        user_agent = random.choice(ScraperConfig.USER_AGENTS)
-        context = self.browser.new_context(
-            user_agent=user_agent,
-            viewport={
-                "width": ScraperConfig.VIEWPORT_WIDTH,
-                "height": ScraperConfig.VIEWPORT_HEIGHT,
-            },
-            proxy=self.proxy,
-            extra_http_headers=ScraperConfig.BROWSER_HEADERS,
-            locale="de-DE",
-            geolocation={"longitude": 13.4050, "latitude": 52.5200},  # Berlin
-            permissions=["geolocation"],
-        )
-        logger.info(f"Created new context with user agent: {user_agent}")
-        # Apply stealth to the context's page
-        page = context.new_page()
-        stealth_sync(page)
-        # Close the page after applying stealth, will be reopened in get_page
-        page.close()
+        proxy_state = self.proxy_pool.acquire() if self.proxy_pool else None
+        options = build_context_options(proxy_state.url if proxy_state else self.proxy)
+        storage_state = self.storage_cache.load(self.storage_domain)
+        if storage_state:
+            options["storage_state"] = storage_state
+        context = self.browser.new_context(**options)
+        logger.info(f"Created new context with user agent: {options['user_agent']}")
+        if self.resource_blocker and self.resource_blocker.enabled:
+            context.route("**/*", self.resource_blocker.handle_route)
+            context.on("response", self.resource_blocker.record_response)
+        for script in stealth_init_scripts():
+            context.add_init_script(script)
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.attach(context)
+        if proxy_state:
+            self.proxy_pool.attach(context, proxy_state, self.resource_blocker)
+            self._context_proxies[context] = proxy_state
+            logger.info(f"Context routed through proxy {proxy_state.label}")
         return context
 
+    def _close_context(self, context: BrowserContext):
+        """Close a context and release its proxy back to the pool."""
+        proxy_state = self._context_proxies.pop(context, None)
+        if proxy_state:
+            self.proxy_pool.release(proxy_state)
+        context.close()
+
+    @property
+    def current_proxy(self) -> Optional[ProxyState]:
+        return self._context_proxies.get(self.context)
+
+    def _open_context_page(self) -> Tuple[BrowserContext, Page]:
+        context = self._create_context()
+        return context, context.new_page()
+
+    def _prepare_rotation(self):
+        """Close retired contexts and build the standby context ahead of time.
+
+        Runs inline, right before rate limiting. When the rate limit is what
+        paces the run, the work overlaps with time get_page() would otherwise
+        spend sleeping. When it is not, the cost only moves to the call before
+        the rotation, and RotationStats counts it there.
+        """
+        while self._retired:
+            context = self._retired.pop()
+            self.storage_cache.save(self.storage_domain, context)
+            try:
+                self._close_context(context)
+            except Exception as e:
+                logger.warning(f"Error closing retired context: {e}")
+
+        next_rotation_due = (
+            self.request_count + 1
+        ) % ScraperConfig.CONTEXT_REFRESH_INTERVAL == 0
+        if self.prewarm and next_rotation_due and self._standby is None:
+            started = time.perf_counter()
+            self._standby = self._open_context_page()
+            self._standby_seconds = time.perf_counter() - started
+
+    def _page_count(self) -> int:
+        try:
+            return sum(len(context.pages) for context in self.browser.contexts)
+        except Exception:
+            return 0
+
+    def _close_contexts(self):
+        """Close the standby, retired and current contexts."""
+        if self._standby:
+            self._retired.append(self._standby[0])
+            self._standby = None
+        for context in self._retired:
+            try:
+                self._close_context(context)
+            except Exception as e:
+                logger.warning(f"Error closing retired context: {e}")
+        self._retired = []
+        if self.context:
+            self.storage_cache.save(self.storage_domain, self.context)
+            self._close_context(self.context)
+        self.context = None
+        self.page = None
+
+    def _recycle_browser(self, reason: str):
+        """Close every context and relaunch (or reattach to) the browser.
+
+        For a browser attached over CDP closing the contexts frees their
+        renderers; the warm browser process itself keeps running.
+        """
+        logger.warning(f"Recycling browser: {reason}")
+        try:
+            self._close_contexts()
+            self.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser for recycle: {e}")
+            self.context = None
+            self.page = None
+        self.browser = self._launch_browser()
+        self.memory_watchdog.recycles += 1
+
     def get_page(self) -> Page:
-        """Get or create a page, rotating context if needed."""
+        """Get or create a page, rotating context if needed.
+
+        Recycles the whole browser first if the memory watchdog says it has
+        grown too large; the caller just gets a page from a fresh browser.
+        """
         self.request_count += 1
 
+        reason = self.memory_watchdog.recycle_reason(self._page_count())
+        if reason:
+            self._recycle_browser(reason)
+
         # Check if we need to refresh the context
+        proxy_state = self.current_proxy
         if (
             self.context is None
             or self.page is None
             or self.request_count % ScraperConfig.CONTEXT_REFRESH_INTERVAL == 0
+            or (proxy_state is not None and proxy_state.is_quarantined())
         ):
+            started = time.perf_counter()
+            rotating = self.context is not None
+            prewarmed = self._standby is not None
 
-            # Close existing context if any
             if self.context:
-                self.context.close()
+                if self.prewarm:
+                    self._retired.append(self.context)
+                else:
+                    self.storage_cache.save(self.storage_domain, self.context)
+                    self._close_context(self.context)
+
+            if self._standby:
+                self.context, self.page = self._standby
+                self._standby = None
+            else:
+                self.context, self.page = self._open_context_page()
 
-            # Create new context and page
-            self.context = self._create_context()
-            self.page = self.context.new_page()
+            if rotating:
+                self.rotation_stats.record(
+                    time.perf_counter() - started,
+                    prewarmed,
+                    self._standby_seconds if prewarmed else 0.0,
+                )
 
-        # Apply rate limiting
-        self.rate_limiter.wait()
+        self._prepare_rotation()
+        self.throttle()
         return self.page
 
+    def throttle(self):
+        """Wait for the rate limit before a request.
+
+        get_page() calls this itself; scrapers call it before requests they
+        send from an already open page (e.g. AJAX pagination). With a proxy
+        pool, the exit IP's limit and the domain limit are reserved together
+        and the request waits for the later of the two.
+        """
+        proxy_state = self.current_proxy
+        wait_for_slot(
+            self.rate_limiter,
+            self.target_domain,
+            proxy_state.rate_limiter if proxy_state else None,
+        )
+
+    def reserve(self, count: int = 1) -> List[float]:
+        """Reserve ``count`` request slots at once and return each one's delay.
+
+        For requests dispatched together (e.g. from one page.evaluate) that
+        must still be spaced out by the rate limit.
+        """
+        proxy_state = self.current_proxy
+        return reserve_slots(
+            self.rate_limiter,
+            self.target_domain,
+            proxy_state.rate_limiter if proxy_state else None,
+            count,
+        )
+
+    def report_success(self, count: int = 1):
+        """Tell an adaptive rate limiter ``count`` paced requests went through.
+
+        For API calls a scraper sends itself; navigations are counted by
+        AdaptiveRateLimiter.attach().
+        """
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            for _ in range(count):
+                self.rate_limiter.record_success(self.target_domain)
+
+    def report_throttle(self, reason: str):
+        """Tell an adaptive rate limiter the target signalled us to slow down."""
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.record_throttle(self.target_domain, reason)
+
+    @property
+    def current_rate(self) -> float:
+        """Requests per minute currently allowed for the target domain."""
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            return self.rate_limiter.current_rate(self.target_domain)
+        return self.rate_limiter.requests_per_minute
+
+    def save_storage_state(self, domain: Optional[str] = None) -> bool:
+        """Persist the current context's storage state, e.g. right after consent."""
+        return self.storage_cache.save(domain or self.storage_domain, self.context)
+
     def close(self):
-        """Clean up resources."""
-        if self.context:
-            self.context.close()
+        """Clean up resources.
+
+        For a browser attached over CDP this only disconnects; the warm
+        browser keeps running for the next caller.
+        """
+        if self.resource_blocker:
+            self.resource_blocker.log_stats()
+        self.rotation_stats.log_summary()
+        if self.proxy_pool:
+            logger.info(f"Proxy pool stats: {self.proxy_pool.stats()}")
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            self.rate_limiter.log_rates()
+        self.memory_watchdog.sample()
+        self.memory_watchdog.log_summary()
+        self._close_contexts()
+        self.rate_limiter.close()
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -92,3 +406,28 @@ class BrowserManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+@contextmanager
+def browser_session(
+    browser: Optional[BrowserManager] = None,
+    requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+    proxy: Optional[str] = None,
+    manager_options: Optional[Callable[[], Dict]] = None,
+    **manager_kwargs,
+) -> Iterator[BrowserManager]:
+    """Yield ``browser`` if one is given, otherwise a BrowserManager owned by the block.
+
+    Lets scrapers run on a browser owned by the caller (e.g. a worker
+    process) without closing it when the scrape finishes. Extra keyword
+    arguments are passed to the BrowserManager created here, as are the
+    ones ``manager_options`` returns. It is only called when a manager is
+    created, so a caller's browser does not cost a rate limiter or proxy pool.
+    """
+    if browser is not None:
+        yield browser
+        return
+    if manager_options:
+        manager_kwargs = {**manager_options(), **manager_kwargs}
+    with BrowserManager(requests_per_minute, proxy, **manager_kwargs) as own_browser:
+        yield own_browser
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Warm browser server - keeps one Chromium running between scraper invocations.
+
+BrowserManager and AsyncBrowserManager attach to it over CDP when
+ScraperConfig.BROWSER_ENDPOINT (env: BROWSER_ENDPOINT) points at it, and fall
+back to launching a local browser when it is unreachable.
+
+Usage:
+  python -m config.browser_server --port 9222
+  export BROWSER_ENDPOINT=http://127.0.0.1:9222
+"""
+
+import argparse
+import logging
+import shutil
+import subprocess
+import tempfile
+import time
+import urllib.request
+from typing import Optional
+
+from .config import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+def is_endpoint_alive(endpoint: Optional[str], timeout: float = 1.0) -> bool:
+    """Return True if a CDP endpoint answers on /json/version."""
+    if not endpoint:
+        return False
+    try:
+        with urllib.request.urlopen(
+            f"{endpoint.rstrip('/')}/json/version", timeout=timeout
+        ) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+class BrowserServer:
+    """Runs a Chromium process with remote debugging enabled."""
+
+    def __init__(
+        self,
+        port: int = ScraperConfig.BROWSER_SERVER_PORT,
+        headless: bool = ScraperConfig.HEADLESS,
+    ):
+        self.port = port
+        self.headless = headless
+        self.process: Optional[subprocess.Popen] = None
+        self.user_data_dir: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _executable_path(self) -> str:
+        # Imported lazily: only needed to locate the Chromium Playwright installed.
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            return playwright.chromium.executable_path
+
+    def start(self, timeout: float = 15.0) -> str:
+        """Launch Chromium and return its CDP endpoint once it accepts connections."""
+        if is_endpoint_alive(self.endpoint):
+            logger.info(f"Reusing browser already listening on {self.endpoint}")
+            return self.endpoint
+
+        self.user_data_dir = tempfile.mkdtemp(prefix="warm-browser-")
+        args = [
+            self._executable_path(),
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+            f"--user-data-dir={self.user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if self.headless:
+            args.append("--headless=new")
+
+        self.process = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if is_endpoint_alive(self.endpoint):
+                logger.info(f"Warm browser listening on {self.endpoint}")
+                return self.endpoint
+            if self.process.poll() is not None:
+                break
+            time.sleep(0.2)
+
+        self.stop()
+        raise RuntimeError(f"Browser server did not come up on {self.endpoint}")
+
+    def stop(self):
+        """Terminate the Chromium process and remove its profile directory."""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+            self.user_data_dir = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    """CLI entry point: run a warm browser until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Keep a Chromium instance running for scrapers to attach to"
+    )
+    parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=ScraperConfig.BROWSER_SERVER_PORT,
+        help=f"Remote debugging port (default: {ScraperConfig.BROWSER_SERVER_PORT})",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    with BrowserServer(port=args.port) as server:
+        print(f"Warm browser ready. export BROWSER_ENDPOINT={server.endpoint}")
+        try:
+            while server.process and server.process.poll() is None:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\nStopping warm browser...")
+
+
+if __name__ == "__main__":
+    main()
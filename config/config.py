@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+import os
+from typing import Dict, List, Optional
 
 
 class ScraperConfig:
@@ -9,22 +10,83 @@ class ScraperConfig:
 
     # Rate limiting
     DEFAULT_REQUESTS_PER_MINUTE = 30
+    # Requests allowed back to back before pacing kicks in. None allows a
+    # minute's worth (requests_per_minute), as the old one-minute window did;
+    # 1 spaces every request evenly.
+    RATE_LIMIT_BURST: Optional[int] = None
+
+    # Adaptive (AIMD) rate control per target domain, starting at the chosen rate.
+    # Off by default: it may raise the rate up to ADAPTIVE_MAX_FACTOR times.
+    ADAPTIVE_RATE_LIMIT = False
+    ADAPTIVE_MIN_REQUESTS_PER_MINUTE = 2
+    ADAPTIVE_MAX_FACTOR = 3  # Never exceed this multiple of the chosen rate
+    ADAPTIVE_INCREASE = 1.0  # requests/minute gained per minute of healthy traffic
+    ADAPTIVE_DECREASE = 0.5  # Rate multiplier on 429/503, CAPTCHA or timeout
+
+    # Share the rate limit between processes (see config/shared_rate_limiter.py),
+    # e.g. RATE_LIMIT_BACKEND="sqlite:///.rate_limits.db" or "redis://localhost:6379/0"
+    RATE_LIMIT_BACKEND: Optional[str] = os.environ.get("RATE_LIMIT_BACKEND")
+    RATE_LIMIT_DB = ".rate_limits.db"
 
     # Delays
     MIN_DELAY = 2  # seconds
     MAX_DELAY = 5  # seconds
 
+    # Plain HTTP fetching (see config/http_client.py)
+    HTTP_POOL_SIZE = 10  # Keep-alive connections per host
+    HTTP_TIMEOUT = 10  # seconds
+    MIN_STATIC_TEXT_LENGTH = 200  # Less visible text than this means JS rendering
+
     # Browser settings
     VIEWPORT_WIDTH = 1920
     VIEWPORT_HEIGHT = 1080
     HEADLESS = True  # Set to False to see the browser window
 
+    # Warm browser server (see config/browser_server.py). When set, browser
+    # managers attach over CDP instead of launching Chromium themselves.
+    BROWSER_ENDPOINT: Optional[str] = os.environ.get("BROWSER_ENDPOINT")
+    BROWSER_SERVER_PORT = 9222
+
     # Context management
     CONTEXT_REFRESH_INTERVAL = 5  # Create new context every N requests
     CLEAR_COOKIES_ON_REFRESH = True  # Whether to clear cookies when refreshing context
+    PREWARM_CONTEXTS = True  # Build the next context before the rotation needs it
+
+    # Memory watchdog (see config/memory_watchdog.py): recycle the browser
+    # when its processes use more RSS than this or too many pages are open
+    BROWSER_MEMORY_LIMIT_MB = 1500
+    BROWSER_MAX_PAGES = 20
+    MEMORY_CHECK_INTERVAL = 5  # Sample process memory every N get_page() calls
+
+    # Storage state cache (cookies/localStorage per target domain)
+    STORAGE_STATE_DIR = ".storage_state"
+    STORAGE_STATE_TTL = 24 * 3600  # seconds
+
+    # Job checkpoints (see utils/checkpoint.py) for resuming interrupted runs
+    CHECKPOINT_DIR = ".checkpoints"
+    CHECKPOINT_INTERVAL = 10  # Save the checkpoint every N records
+
+    # Async page pool
+    PAGE_POOL_SIZE = 4  # Concurrent pages leased by AsyncBrowserManager
+
+    # Worker farm
+    WORKER_PROCESSES = os.cpu_count() or 1  # Browser worker processes
 
     DEFAULT_PROXY: Optional[str] = None
 
+    # Proxy pool (see config/proxy_pool.py), e.g. PROXIES="http://u:p@host1:8080,http://host2:8080"
+    PROXIES: List[str] = [
+        proxy.strip()
+        for proxy in os.environ.get("PROXIES", "").split(",")
+        if proxy.strip()
+    ]
+    PROXY_FAILURE_THRESHOLD = 3  # Consecutive failures before quarantine
+    PROXY_QUARANTINE_SECONDS = 300
+    PROXY_MAX_LATENCY = 10.0  # seconds, average time to first byte
+    # With a pool, requests per minute are per proxy and the target domain gets
+    # their sum; set this to cap the domain at a fixed budget instead
+    DOMAIN_REQUESTS_PER_MINUTE: Optional[int] = None
+
     # Common user agents to rotate through
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
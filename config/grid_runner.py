@@ -0,0 +1,238 @@
+import argparse
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .config import ScraperConfig
+from .worker_farm import SCRAPER_CLASSES, WorkerFarm
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+def read_terms(value: Union[str, Iterable[str]]) -> List[str]:
+    """Read search terms from a list, a comma-separated string or a file.
+
+    Files hold one term per line; blank lines and ``#`` comments are skipped.
+    Duplicates are dropped, order is kept.
+    """
+    if isinstance(value, str):
+        if os.path.isfile(value):
+            with open(value, encoding="utf-8") as f:
+                terms = [line.split("#", 1)[0] for line in f]
+        else:
+            terms = value.split(",")
+    else:
+        terms = list(value)
+    return list(dict.fromkeys(term.strip() for term in terms if term.strip()))
+
+
+def expand_grid(
+    scraper: str,
+    queries: Iterable[str],
+    locations: Iterable[str],
+    max_entries: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """One job per (query, location) pair, grouped by location."""
+    queries = list(queries)
+    return [
+        {
+            "scraper": scraper,
+            "query": query,
+            "location": location,
+            "max_entries": max_entries,
+        }
+        for location in locations
+        for query in queries
+    ]
+
+
+def _normalize(value: Optional[str]) -> str:
+    return _NON_ALNUM_RE.sub(" ", (value or "").lower()).strip()
+
+
+def company_key(record: Dict) -> Tuple[str, ...]:
+    """Identity of a company across queries.
+
+    Google Maps records are keyed by place key; everything else by source,
+    name and address, ignoring case and punctuation.
+    """
+    key = (record.get("metadata") or {}).get("place_key")
+    if key:
+        return ("place", key)
+    return (
+        record.get("source", ""),
+        _normalize(record.get("company_name")),
+        _normalize(record.get("address")),
+    )
+
+
+class Deduplicator:
+    """Remembers the companies already passed on and drops repeats."""
+
+    def __init__(self):
+        self.seen = set()
+        self.duplicates = 0
+
+    def is_new(self, record: Dict) -> bool:
+        key = company_key(record)
+        if key in self.seen:
+            self.duplicates += 1
+            return False
+        self.seen.add(key)
+        return True
+
+    def filter(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        return (record for record in records if self.is_new(record))
+
+
+class GridRunner:
+    """Runs a scraper over every query × location pair on a WorkerFarm.
+
+    Jobs are spread across the farm's worker processes. Companies found by
+    several queries or neighbouring locations are passed on only once, before
+    they reach storage. ``scraper_options`` are passed on to the scraper in
+    every worker (see WorkerFarm).
+
+    Every pair is a single search: radius tiling and checkpoints are not
+    supported here, so grid runs cannot be resumed.
+    """
+
+    def __init__(
+        self,
+        scraper: str,
+        workers: int = ScraperConfig.WORKER_PROCESSES,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        proxy: Optional[str] = None,
+        scraper_options: Optional[Dict[str, Any]] = None,
+    ):
+        if scraper not in SCRAPER_CLASSES:
+            raise ValueError(
+                f"Unknown scraper '{scraper}'. Available: {', '.join(SCRAPER_CLASSES)}"
+            )
+        self.scraper = scraper
+        self.farm = WorkerFarm(
+            workers, requests_per_minute, proxy, {scraper: scraper_options or {}}
+        )
+        self.deduplicator = Deduplicator()
+
+    def iter_results(
+        self,
+        queries: Iterable[str],
+        locations: Iterable[str],
+        max_entries: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Yield the unique records of all jobs as they finish."""
+        jobs = expand_grid(self.scraper, queries, locations, max_entries)
+        logger.info(f"Running {len(jobs)} {self.scraper} jobs")
+        for done, (job, results) in enumerate(self.farm.iter_job_results(jobs), 1):
+            duplicates = self.deduplicator.duplicates
+            yield from self.deduplicator.filter(results)
+            logger.info(
+                f"[{done}/{len(jobs)}] '{job['query']}' in '{job['location']}': "
+                f"{len(results)} entries, "
+                f"{self.deduplicator.duplicates - duplicates} duplicates dropped"
+            )
+        if self.farm.failed_jobs:
+            logger.error(
+                f"{len(self.farm.failed_jobs)} jobs failed: "
+                + ", ".join(
+                    f"'{job['query']}' in '{job['location']}'"
+                    for job in self.farm.failed_jobs
+                )
+            )
+
+    def run(self, queries, locations, max_entries=None, sink=None) -> int:
+        """Run the grid, writing unique records to ``sink``. Returns their number."""
+        count = 0
+        for record in self.iter_results(queries, locations, max_entries):
+            if sink is not None:
+                sink.write(record)
+            count += 1
+        logger.info(
+            f"Grid finished: {count} unique companies, "
+            f"{self.deduplicator.duplicates} duplicates dropped"
+        )
+        return count
+
+
+def main():
+    """CLI entry point: scrape a query × location grid into the scraper's storage."""
+    from utils.sinks import create_sink
+
+    parser = argparse.ArgumentParser(
+        description="Run a scraper over every combination of queries and locations"
+    )
+    parser.add_argument("--scraper", "-s", choices=list(SCRAPER_CLASSES), required=True)
+    parser.add_argument(
+        "--queries",
+        "-q",
+        required=True,
+        help="Comma-separated search terms or a file with one per line",
+    )
+    parser.add_argument(
+        "--locations",
+        "-l",
+        required=True,
+        help="Comma-separated locations or a file with one per line",
+    )
+    parser.add_argument("--max-entries", "-m", type=int, default=None)
+    parser.add_argument(
+        "--workers", "-w", type=int, default=ScraperConfig.WORKER_PROCESSES
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        "-r",
+        type=int,
+        default=ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        help="Total budget shared by all workers",
+    )
+    parser.add_argument(
+        "--storage", choices=["database", "json", "both"], default="json"
+    )
+    parser.add_argument(
+        "--place-index",
+        help="SQLite file of places scraped before, skipped again (googlemaps only)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "scrapers",
+        args.scraper,
+        "data",
+    )
+    scraper_options = {}
+    if args.place_index:
+        if args.scraper != "googlemaps":
+            parser.error("--place-index only works with the googlemaps scraper")
+        from scrapers.googlemaps.places import PlaceIndex
+
+        scraper_options["place_index"] = PlaceIndex(args.place_index)
+    runner = GridRunner(
+        args.scraper,
+        args.workers,
+        args.requests_per_minute,
+        scraper_options=scraper_options,
+    )
+    with create_sink(
+        args.storage, f"{args.scraper}_companies", data_dir, f"{args.scraper}_grid"
+    ) as sink:
+        count = runner.run(
+            read_terms(args.queries), read_terms(args.locations), args.max_entries, sink
+        )
+    if "place_index" in scraper_options:
+        scraper_options["place_index"].close()
+    print(
+        f"✅ Stored {count} unique companies "
+        f"({runner.deduplicator.duplicates} duplicates dropped)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import logging
+import random
+import re
+from collections import Counter
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .browser import BrowserManager
+from .config import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+# Phrases pages show when their content is rendered client-side only
+JS_REQUIRED_MARKERS = [
+    "enable javascript",
+    "javascript is required",
+    "javascript aktivieren",
+    "aktivieren sie javascript",
+    "you need to enable javascript",
+    '<div id="root"></div>',
+    '<div id="app"></div>',
+]
+
+# Status codes where a real browser will not get a different answer
+FINAL_STATUSES = {404, 410}
+
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style|noscript)\b.*?</\1>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def create_session(
+    proxy: Optional[str] = None,
+    pool_size: int = ScraperConfig.HTTP_POOL_SIZE,
+) -> requests.Session:
+    """Create a keep-alive requests session with browser-like headers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(ScraperConfig.BROWSER_HEADERS)
+    # requests only decodes brotli when the brotli package is installed
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.headers["User-Agent"] = random.choice(ScraperConfig.USER_AGENTS)
+    if proxy:
+        session.proxies = {"http": proxy, "https": proxy}
+    return session
+
+
+def visible_text_length(html: str) -> int:
+    """Rough length of the text a user would see, without parsing the DOM."""
+    text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", html))
+    return len(" ".join(text.split()))
+
+
+def needs_javascript(html: str) -> bool:
+    """Guess whether a page only renders its content with JavaScript."""
+    if not html or not html.strip():
+        return True
+    lowered = html.lower()
+    if any(marker in lowered for marker in JS_REQUIRED_MARKERS):
+        return True
+    return visible_text_length(html) < ScraperConfig.MIN_STATIC_TEXT_LENGTH
+
+
+class FetchResult:
+    """A fetched page and how it was obtained ("http" or "browser")."""
+
+    def __init__(self, url: str, html: str, status: int, via: str):
+        self.url = url
+        self.html = html
+        self.status = status
+        self.via = via
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+class HybridFetcher:
+    """Fetches pages over pooled HTTP first and escalates to a browser only if needed.
+
+    The BrowserManager is launched lazily on the first page that needs
+    JavaScript, so runs over static sites never start Chromium.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        timeout: float = ScraperConfig.HTTP_TIMEOUT,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+    ):
+        self.proxy = proxy
+        self.timeout = timeout
+        self.requests_per_minute = requests_per_minute
+        self.session = create_session(proxy)
+        self.stats = Counter()
+        self._browser: Optional[BrowserManager] = None
+        # URL the browser page was last sent to, so a screenshot is never
+        # taken of another URL's page
+        self.browser_url: Optional[str] = None
+
+    @property
+    def browser(self) -> BrowserManager:
+        if self._browser is None:
+            logger.info("Launching browser for pages that need JavaScript")
+            self._browser = BrowserManager(self.requests_per_minute, self.proxy)
+        return self._browser
+
+    def fetch_http(self, url: str) -> Optional[FetchResult]:
+        """Fetch ``url`` over HTTP. Returns None when a browser is needed instead."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+        if response.status_code in FINAL_STATUSES:
+            self.stats["http"] += 1
+            return FetchResult(response.url, "", response.status_code, "http")
+        content_type = response.headers.get("content-type", "")
+        if not response.ok or "html" not in content_type:
+            return None
+        if needs_javascript(response.text):
+            logger.debug(f"{url} needs JavaScript rendering")
+            return None
+
+        self.stats["http"] += 1
+        return FetchResult(response.url, response.text, response.status_code, "http")
+
+    def fetch_with_browser(self, url: str, timeout: int = 10000) -> FetchResult:
+        page = self.browser.get_page()
+        self.browser_url = url
+        response = page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+        self.stats["browser"] += 1
+        return FetchResult(
+            page.url, page.content(), response.status if response else 0, "browser"
+        )
+
+    def fetch(self, url: str) -> FetchResult:
+        """Fetch ``url`` over HTTP, falling back to the browser."""
+        return self.fetch_http(url) or self.fetch_with_browser(url)
+
+    def probe(self, url: str) -> bool:
+        """Return True if ``url`` exists and serves HTML."""
+        try:
+            response = self.session.get(url, timeout=self.timeout, stream=True)
+            response.close()
+        except requests.RequestException:
+            return False
+        return response.ok and "html" in response.headers.get("content-type", "")
+
+    def screenshot(self, path: str, url: str) -> bool:
+        """Screenshot the browser page if it was last sent to ``url``.
+
+        Returns False when ``url`` was fetched over HTTP, since the browser
+        page then still shows an earlier, unrelated URL.
+        """
+        if self._browser is None or self._browser.page is None:
+            return False
+        if self.browser_url != url:
+            return False
+        self._browser.page.screenshot(path=path)
+        return True
+
+    def close(self):
+        logger.info(
+            f"Fetched {self.stats['http']} pages over HTTP, "
+            f"{self.stats['browser']} with the browser"
+        )
+        self.session.close()
+        if self._browser:
+            self._browser.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
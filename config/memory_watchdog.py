@@ -0,0 +1,99 @@
+import logging
+from typing import List, Optional
+
+import psutil
+
+from .config import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+# Process names of Playwright's Chromium builds (full and headless shell)
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+def _is_browser_process(process: psutil.Process) -> bool:
+    try:
+        name = process.name().lower()
+    except psutil.Error:
+        return False
+    return any(browser_name in name for browser_name in BROWSER_PROCESS_NAMES)
+
+
+def browser_processes(root_pid: Optional[int] = None) -> List[psutil.Process]:
+    """Chromium processes started below ``root_pid`` (default: this process)."""
+    try:
+        children = psutil.Process(root_pid).children(recursive=True)
+    except psutil.Error:
+        return []
+    return [process for process in children if _is_browser_process(process)]
+
+
+def browser_memory_mb(root_pid: Optional[int] = None) -> float:
+    """Summed RSS of the browser, GPU and renderer processes in MB."""
+    total = 0
+    for process in browser_processes(root_pid):
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            # Renderers come and go while we iterate
+            continue
+    return total / (1024 * 1024)
+
+
+class MemoryWatchdog:
+    """Watches browser memory and open pages and decides when to recycle.
+
+    Memory is the RSS of the Chromium processes below this Python process,
+    so it is only measured for locally launched browsers. A browser attached
+    over CDP is watched by its page count alone.
+    """
+
+    def __init__(
+        self,
+        memory_limit_mb: float = ScraperConfig.BROWSER_MEMORY_LIMIT_MB,
+        max_pages: int = ScraperConfig.BROWSER_MAX_PAGES,
+        check_interval: int = ScraperConfig.MEMORY_CHECK_INTERVAL,
+    ):
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.check_interval = max(1, check_interval)
+        self.last_mb = 0.0
+        self.peak_mb = 0.0
+        self.job_peak_mb = 0.0
+        self.recycles = 0
+        self._checks = 0
+
+    def sample(self) -> float:
+        """Measure browser memory now and update the peaks."""
+        self.last_mb = browser_memory_mb()
+        self.peak_mb = max(self.peak_mb, self.last_mb)
+        self.job_peak_mb = max(self.job_peak_mb, self.last_mb)
+        return self.last_mb
+
+    def recycle_reason(self, page_count: int) -> Optional[str]:
+        """Return why the browser should be recycled, or None if it is healthy.
+
+        Memory is sampled every ``check_interval`` calls; the page count is
+        checked on every call since it costs nothing.
+        """
+        if self.max_pages and page_count > self.max_pages:
+            return f"{page_count} open pages"
+        self._checks += 1
+        if self._checks % self.check_interval:
+            return None
+        memory_mb = self.sample()
+        if self.memory_limit_mb and memory_mb > self.memory_limit_mb:
+            return f"browser memory {memory_mb:.0f} MB"
+        return None
+
+    def reset_job_peak(self) -> float:
+        """Return the peak since the last reset and start a new job window."""
+        peak = max(self.job_peak_mb, self.sample())
+        self.job_peak_mb = self.last_mb
+        return peak
+
+    def log_summary(self):
+        logger.info(
+            f"Browser memory: peak {self.peak_mb:.0f} MB, "
+            f"{self.recycles} recycles"
+        )
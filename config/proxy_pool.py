@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from .config import ScraperConfig
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean the exit IP is throttled or blocked
+BLOCK_STATUSES = {403, 407, 429, 503}
+
+# Only navigations and API calls say something about proxy health
+SCORED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+# Requests the page itself cancelled (e.g. by navigating away)
+CANCELLED_FAILURES = {"net::ERR_ABORTED"}
+
+
+def proxy_settings(proxy) -> Optional[Dict[str, str]]:
+    """Convert a proxy URL into Playwright's proxy dict, splitting out credentials."""
+    if not proxy:
+        return None
+    if isinstance(proxy, dict):
+        return proxy
+
+    parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    server = f"{parts.scheme}://{parts.hostname}"
+    if parts.port:
+        server += f":{parts.port}"
+    settings = {"server": server}
+    if parts.username:
+        settings["username"] = parts.username
+        settings["password"] = parts.password or ""
+    return settings
+
+
+def reserve_slots(
+    rate_limiter: RateLimiter,
+    key,
+    proxy_limiter: Optional[RateLimiter] = None,
+    count: int = 1,
+) -> List[float]:
+    """Reserve ``count`` slots under the domain limit and, if given, the proxy's own.
+
+    Both buckets are reserved together and each delay is the later of the
+    two, so a request waits for whichever limit is tighter, not for both
+    in turn.
+    """
+    delays = []
+    for _ in range(count):
+        delay = rate_limiter.reserve(key)
+        if proxy_limiter is not None:
+            delay = max(delay, proxy_limiter.reserve())
+        delays.append(delay)
+    return delays
+
+
+def _log_slot_wait(delay: float, key):
+    if delay >= 1:
+        target = f" for {key}" if key is not None else ""
+        logger.info(f"Rate limit reached{target}. Waiting {delay:.2f} seconds...")
+
+
+def wait_for_slot(
+    rate_limiter: RateLimiter, key, proxy_limiter: Optional[RateLimiter] = None
+):
+    """Block until a request may go out under both limits (see reserve_slots)."""
+    delay = reserve_slots(rate_limiter, key, proxy_limiter)[0]
+    if delay > 0:
+        _log_slot_wait(delay, key)
+        time.sleep(delay)
+
+
+async def wait_for_slot_async(
+    rate_limiter: RateLimiter, key, proxy_limiter: Optional[RateLimiter] = None
+):
+    """Like wait_for_slot(), but sleeps without blocking the event loop."""
+    delay = reserve_slots(rate_limiter, key, proxy_limiter)[0]
+    if delay > 0:
+        _log_slot_wait(delay, key)
+        await asyncio.sleep(delay)
+
+
+class ProxyState:
+    """Health and rate limiting for one proxy of a ProxyPool."""
+
+    def __init__(
+        self,
+        url: str,
+        requests_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.url = url
+        self.clock = clock
+        self.rate_limiter = RateLimiter(requests_per_minute, clock=clock)
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency = None  # exponentially weighted, seconds
+        self.quarantined_until = 0.0
+        self.in_use = 0
+
+    @property
+    def label(self) -> str:
+        return proxy_settings(self.url)["server"]
+
+    def is_quarantined(self, now: Optional[float] = None) -> bool:
+        return (self.clock() if now is None else now) < self.quarantined_until
+
+    def score(self) -> float:
+        """Higher is healthier: smoothed success rate divided by latency."""
+        success_rate = (self.successes + 1) / (self.successes + self.failures + 2)
+        latency = self.latency if self.latency is not None else 1.0
+        return success_rate / (1.0 + latency)
+
+
+class ProxyPool:
+    """Picks the healthiest proxy for each new browser context.
+
+    Proxies are scored from the responses seen through them (success rate and
+    latency). A proxy is quarantined for ``quarantine_seconds`` after a block
+    response (403/407/429/503), after ``failure_threshold`` consecutive
+    failures, or when its average latency exceeds ``max_latency``.
+
+    Each proxy has its own RateLimiter at ``requests_per_minute``; that is
+    the limit requests through it are paced by. The domain as a whole gets
+    ``domain_requests_per_minute``, by default the proxies' rates added up,
+    so every proxy adds its share of throughput. Quarantined proxies are not
+    handed out, so only healthy ones actually use their share.
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        failure_threshold: int = ScraperConfig.PROXY_FAILURE_THRESHOLD,
+        quarantine_seconds: float = ScraperConfig.PROXY_QUARANTINE_SECONDS,
+        max_latency: float = ScraperConfig.PROXY_MAX_LATENCY,
+        domain_requests_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.clock = clock
+        self.requests_per_minute = requests_per_minute
+        self.proxies: List[ProxyState] = [
+            ProxyState(url, requests_per_minute, clock) for url in proxies
+        ]
+        if not self.proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.domain_requests_per_minute = domain_requests_per_minute or (
+            requests_per_minute * len(self.proxies)
+        )
+        self.failure_threshold = failure_threshold
+        self.quarantine_seconds = quarantine_seconds
+        self.max_latency = max_latency
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config=None,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+    ) -> Optional["ProxyPool"]:
+        """Build a pool from ``config.PROXIES`` or ScraperConfig.PROXIES, if any.
+
+        ``requests_per_minute`` is the rate of each proxy. The domain budget
+        is ``DOMAIN_REQUESTS_PER_MINUTE`` when set, else that rate times the
+        number of proxies.
+        """
+        proxies = getattr(config, "PROXIES", None) or ScraperConfig.PROXIES
+        if not proxies:
+            return None
+        return cls(
+            proxies,
+            requests_per_minute,
+            domain_requests_per_minute=getattr(
+                config,
+                "DOMAIN_REQUESTS_PER_MINUTE",
+                ScraperConfig.DOMAIN_REQUESTS_PER_MINUTE,
+            ),
+        )
+
+    def acquire(self) -> ProxyState:
+        """Return the healthiest proxy that is not quarantined and mark it in use.
+
+        If every proxy is quarantined, the one released soonest is used.
+        """
+        with self._lock:
+            now = self.clock()
+            available = [p for p in self.proxies if not p.is_quarantined(now)]
+            if available:
+                proxy = max(available, key=lambda p: (p.score(), -p.in_use))
+            else:
+                proxy = min(self.proxies, key=lambda p: p.quarantined_until)
+                logger.warning(
+                    f"All proxies quarantined, using {proxy.label} "
+                    f"({proxy.quarantined_until - now:.0f}s left)"
+                )
+            proxy.in_use += 1
+            return proxy
+
+    def release(self, proxy: ProxyState):
+        with self._lock:
+            proxy.in_use = max(0, proxy.in_use - 1)
+
+    def _quarantine(self, proxy: ProxyState, reason: str):
+        proxy.quarantined_until = self.clock() + self.quarantine_seconds
+        proxy.consecutive_failures = 0
+        logger.warning(
+            f"Quarantining proxy {proxy.label} for {self.quarantine_seconds:.0f}s: {reason}"
+        )
+
+    def report_success(self, proxy: ProxyState, latency: Optional[float] = None):
+        with self._lock:
+            proxy.successes += 1
+            proxy.consecutive_failures = 0
+            if latency is not None:
+                proxy.latency = (
+                    latency
+                    if proxy.latency is None
+                    else 0.8 * proxy.latency + 0.2 * latency
+                )
+                if proxy.successes >= 3 and proxy.latency > self.max_latency:
+                    self._quarantine(proxy, f"average latency {proxy.latency:.1f}s")
+
+    def report_failure(self, proxy: ProxyState, blocked: bool = False):
+        with self._lock:
+            proxy.failures += 1
+            proxy.consecutive_failures += 1
+            if blocked:
+                self._quarantine(proxy, "blocked by target")
+            elif proxy.consecutive_failures >= self.failure_threshold:
+                self._quarantine(
+                    proxy, f"{proxy.consecutive_failures} consecutive failures"
+                )
+
+    def attach(self, context, proxy: ProxyState, resource_blocker=None):
+        """Score ``proxy`` from the responses of a browser context.
+
+        Requests aborted by ``resource_blocker`` or cancelled by the page
+        are not held against the proxy.
+        """
+
+        def on_response(response):
+            request = response.request
+            if request.resource_type not in SCORED_RESOURCE_TYPES:
+                return
+            if response.status in BLOCK_STATUSES:
+                self.report_failure(proxy, blocked=True)
+                return
+            timing = request.timing or {}
+            response_start = timing.get("responseStart", -1)
+            latency = response_start / 1000 if response_start > 0 else None
+            self.report_success(proxy, latency)
+
+        def on_request_failed(request):
+            if request.resource_type not in SCORED_RESOURCE_TYPES:
+                return
+            if resource_blocker is not None and resource_blocker.aborted(request):
+                return
+            if request.failure in CANCELLED_FAILURES:
+                return
+            self.report_failure(proxy)
+
+        context.on("response", on_response)
+        context.on("requestfailed", on_request_failed)
+
+    def stats(self) -> List[Dict[str, object]]:
+        with self._lock:
+            now = self.clock()
+            return [
+                {
+                    "proxy": p.label,
+                    "successes": p.successes,
+                    "failures": p.failures,
+                    "latency": p.latency,
+                    "score": round(p.score(), 3),
+                    "quarantined": p.is_quarantined(now),
+                }
+                for p in self.proxies
+            ]
@@ -1,32 +1,291 @@
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List
+import threading
 import time
+from typing import Callable, Dict, Hashable, Optional
+from urllib.parse import urlsplit
+
+from .config import ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# Idle buckets are dropped once this many keys are tracked
+MAX_IDLE_BUCKETS = 1024
+
+# Responses that mean the target wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+# Only navigations and API calls count as requests to the target
+RATED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+# URL fragments of CAPTCHA / "unusual traffic" interstitials
+CAPTCHA_URL_MARKERS = ("/sorry/", "captcha", "challenge")
+
+# Public suffixes with two labels, so "shop.example.co.uk" is keyed as
+# "example.co.uk" rather than every .co.uk site sharing one "co.uk" bucket.
+# Not the full public suffix list, just the common country registries.
+MULTI_LABEL_SUFFIXES = frozenset(
+    {
+        "co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "ltd.uk", "plc.uk",
+        "co.at", "or.at", "ac.at", "gv.at",
+        "com.au", "net.au", "org.au",
+        "com.br", "net.br", "org.br",
+        "co.jp", "ne.jp", "or.jp",
+        "co.nz", "co.za", "co.in", "co.il", "co.kr",
+        "com.cn", "com.hk", "com.mx", "com.ar", "com.tr", "com.pl", "com.sg",
+    }
+)
+
+
+def domain_key(url: str) -> Optional[str]:
+    """Reduce a URL to the domain its rate limit is tracked under, e.g. "gelbeseiten.de"."""
+    hostname = urlsplit(url).hostname
+    if not hostname:
+        return None
+    labels = hostname.split(".")
+    keep = 3 if ".".join(labels[-2:]) in MULTI_LABEL_SUFFIXES else 2
+    return ".".join(labels[-keep:])
+
+
+def _is_main_frame_navigation(request) -> bool:
+    """Whether ``request`` loads a page, i.e. is one the managers pace themselves."""
+    try:
+        return request.is_navigation_request() and request.frame.parent_frame is None
+    except Exception:
+        # Service worker requests have no frame
+        return False
+
+
+class TokenBucket:
+    """Token bucket that refills at ``rate`` tokens per second up to ``capacity``.
+
+    Tokens may go negative: each reservation takes a token immediately and
+    the caller waits until the bucket has paid it back, so concurrent callers
+    are queued in order without holding a lock while they sleep.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller has to wait for it."""
+        self.refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def is_idle(self, now: float) -> bool:
+        self.refill(now)
+        return self.tokens >= self.capacity
+
 
 class RateLimiter:
-    def __init__(self, requests_per_minute: int):
+    """Thread-safe token-bucket rate limiter with a blocking and an async API.
+
+    Allows ``requests_per_minute`` on average and up to ``burst`` requests
+    back to back, by default a minute's worth like the sliding window this
+    replaced (see ScraperConfig.RATE_LIMIT_BURST). Every ``key`` (e.g. a
+    domain) gets its own bucket with the same limits; ``None`` is the
+    default bucket. A non-positive
+    ``requests_per_minute`` disables limiting.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.requests_per_minute = requests_per_minute
-        self.requests: List[datetime] = []
+        if burst is None:
+            burst = ScraperConfig.RATE_LIMIT_BURST or requests_per_minute
+        self.burst = max(1, int(burst))
+        self.clock = clock
+        self._buckets: Dict[Optional[Hashable], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: Optional[Hashable], now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= MAX_IDLE_BUCKETS:
+                self._drop_idle_buckets(now)
+            bucket = TokenBucket(self._rate_per_second(key), self.burst, now)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _rate_per_second(self, key: Optional[Hashable]) -> float:
+        return self.requests_per_minute / 60
 
-    def wait(self):
+    def _drop_idle_buckets(self, now: float):
+        # A full bucket behaves exactly like a new one, so it is safe to forget
+        for key in [k for k, b in self._buckets.items() if b.is_idle(now)]:
+            del self._buckets[key]
+
+    def reserve(self, key: Optional[Hashable] = None) -> float:
+        """Reserve a request slot and return the delay in seconds before using it."""
+        if self.requests_per_minute <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            return self._bucket(key, now).reserve(now)
+
+    def _log_wait(self, delay: float, key: Optional[Hashable]):
+        if delay >= 1:
+            target = f" for {key}" if key is not None else ""
+            logger.info(f"Rate limit reached{target}. Waiting {delay:.2f} seconds...")
+
+    def wait(self, key: Optional[Hashable] = None):
         """Wait if necessary to respect the rate limit."""
-        now = datetime.now()
-        # Remove requests older than 1 minute
-        self.requests = [
-            req_time
-            for req_time in self.requests
-            if now - req_time < timedelta(minutes=1)
-        ]
-
-        if len(self.requests) >= self.requests_per_minute:
-            # Calculate how long to wait
-            oldest_request = self.requests[0]
-            wait_time = 60 - (now - oldest_request).total_seconds()
-            if wait_time > 0:
-                logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-
-        self.requests.append(now)
+        delay = self.reserve(key)
+        if delay > 0:
+            self._log_wait(delay, key)
+            time.sleep(delay)
+
+    async def wait_async(self, key: Optional[Hashable] = None):
+        """Like wait(), but sleeps without blocking the event loop."""
+        delay = self.reserve(key)
+        if delay > 0:
+            self._log_wait(delay, key)
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Release the limiter's resources; in-process buckets hold none."""
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """RateLimiter that adapts each key's rate to how the target responds (AIMD).
+
+    Every healthy paced request raises the key's rate so that it grows by
+    ``increase`` requests/minute per minute of healthy traffic, up to
+    ``max_requests_per_minute``. A throttling signal (HTTP 429/503, a CAPTCHA
+    page, a timeout or a scraper-reported empty result) multiplies the rate
+    by ``decrease``, at most once per request interval, down to
+    ``min_requests_per_minute``.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        min_requests_per_minute: float = ScraperConfig.ADAPTIVE_MIN_REQUESTS_PER_MINUTE,
+        max_requests_per_minute: Optional[float] = None,
+        increase: float = ScraperConfig.ADAPTIVE_INCREASE,
+        decrease: float = ScraperConfig.ADAPTIVE_DECREASE,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(requests_per_minute, burst, clock)
+        self.min_requests_per_minute = min(min_requests_per_minute, requests_per_minute)
+        self.max_requests_per_minute = (
+            max_requests_per_minute
+            if max_requests_per_minute is not None
+            else requests_per_minute * ScraperConfig.ADAPTIVE_MAX_FACTOR
+        )
+        self.increase = increase
+        self.decrease = decrease
+        self._rates: Dict[Optional[Hashable], float] = {}
+        self._last_decrease: Dict[Optional[Hashable], float] = {}
+
+    @classmethod
+    def from_config(
+        cls, config=None, requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE
+    ) -> Optional["AdaptiveRateLimiter"]:
+        """Build a limiter if ``config.ADAPTIVE_RATE_LIMIT`` (or ScraperConfig's) is on."""
+        enabled = getattr(config, "ADAPTIVE_RATE_LIMIT", ScraperConfig.ADAPTIVE_RATE_LIMIT)
+        if not enabled or requests_per_minute <= 0:
+            return None
+        return cls(requests_per_minute)
+
+    def _rate_per_second(self, key: Optional[Hashable]) -> float:
+        return self._rates.get(key, self.requests_per_minute) / 60
+
+    def _set_rate(self, key: Optional[Hashable], rate: float):
+        self._rates[key] = rate
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.refill(self.clock())
+            bucket.rate = rate / 60
+
+    def current_rate(self, key: Optional[Hashable] = None) -> float:
+        """Requests per minute currently allowed for ``key``."""
+        with self._lock:
+            return self._rates.get(key, self.requests_per_minute)
+
+    def rates(self) -> Dict[Optional[Hashable], float]:
+        with self._lock:
+            return dict(self._rates)
+
+    def record_success(self, key: Optional[Hashable] = None):
+        if self.requests_per_minute <= 0:
+            return
+        with self._lock:
+            rate = self._rates.get(key, self.requests_per_minute)
+            self._set_rate(key, min(self.max_requests_per_minute, rate + self.increase / rate))
+
+    def record_throttle(self, key: Optional[Hashable] = None, reason: str = ""):
+        """Back off ``key`` after a throttling signal."""
+        if self.requests_per_minute <= 0:
+            return
+        with self._lock:
+            now = self.clock()
+            rate = self._rates.get(key, self.requests_per_minute)
+            # Signals from requests already in flight belong to the same episode
+            if now - self._last_decrease.get(key, float("-inf")) < 60 / rate:
+                return
+            new_rate = max(self.min_requests_per_minute, rate * self.decrease)
+            self._last_decrease[key] = now
+            self._set_rate(key, new_rate)
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                # Give up any saved-up burst so the next request already waits
+                bucket.tokens = min(bucket.tokens, 0)
+        target = key if key is not None else "default"
+        logger.warning(
+            f"Backing off {target} to {new_rate:.1f} requests/minute ({reason or 'throttled'})"
+        )
+
+    def attach(self, context):
+        """Feed the responses of a browser context into the per-domain rates.
+
+        Any navigation or API response can signal throttling, but only
+        main-frame navigations count as successes: those are the requests the
+        managers pace. Subresources and XHRs the page sends on its own would
+        otherwise push the rate up with every page load. Scrapers report their
+        own paced API calls through the managers' report_success().
+        """
+
+        def on_response(response):
+            request = response.request
+            if request.resource_type not in RATED_RESOURCE_TYPES:
+                return
+            key = domain_key(response.url)
+            if response.status in THROTTLE_STATUSES:
+                self.record_throttle(key, f"HTTP {response.status}")
+            elif request.resource_type == "document" and any(
+                marker in response.url.lower() for marker in CAPTCHA_URL_MARKERS
+            ):
+                self.record_throttle(key, "CAPTCHA page")
+            elif response.ok and _is_main_frame_navigation(request):
+                self.record_success(key)
+
+        def on_request_failed(request):
+            if request.resource_type not in RATED_RESOURCE_TYPES:
+                return
+            error = (request.failure or "").lower()
+            if "timed_out" in error or "timeout" in error:
+                self.record_throttle(domain_key(request.url), "timeout")
+
+        context.on("response", on_response)
+        context.on("requestfailed", on_request_failed)
+
+    def log_rates(self):
+        for key, rate in self.rates().items():
+            target = key if key is not None else "default"
+            logger.info(f"Adaptive rate for {target} converged to {rate:.1f} requests/minute")
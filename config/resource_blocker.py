@@ -0,0 +1,116 @@
+import logging
+import re
+import weakref
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlocker:
+    """Aborts requests for resource types and URLs a scraper never reads.
+
+    Installed on a context via ``context.route("**/*", ...)`` by
+    BrowserManager and AsyncBrowserManager. Aborted requests are never
+    downloaded, so their size is estimated from the average size of
+    allowed responses of the same resource type. The requests it aborted are
+    remembered, so failure listeners can tell them from network errors.
+    """
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = (),
+        url_patterns: Iterable[str] = (),
+    ):
+        self.resource_types = frozenset(resource_types)
+        patterns = list(url_patterns)
+        self.url_pattern = re.compile("|".join(patterns)) if patterns else None
+        self.blocked_requests: Counter = Counter()
+        self.allowed_requests: Counter = Counter()
+        self.allowed_bytes: Counter = Counter()
+        self._aborted = weakref.WeakSet()
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ResourceBlocker"]:
+        """Build a blocker from a scraper config's BLOCKED_* settings, if any."""
+        resource_types = getattr(config, "BLOCKED_RESOURCE_TYPES", ())
+        url_patterns = getattr(config, "BLOCKED_URL_PATTERNS", ())
+        if not resource_types and not url_patterns:
+            return None
+        return cls(resource_types, url_patterns)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.resource_types or self.url_pattern)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        return bool(self.url_pattern and self.url_pattern.search(url))
+
+    def aborted(self, request) -> bool:
+        """Whether ``request`` failed because this blocker aborted it."""
+        return request in self._aborted
+
+    def handle_route(self, route):
+        """Route handler for the sync Playwright API."""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_requests[request.resource_type] += 1
+            self._aborted.add(request)
+            route.abort()
+        else:
+            route.continue_()
+
+    async def handle_route_async(self, route):
+        """Route handler for the async Playwright API."""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_requests[request.resource_type] += 1
+            self._aborted.add(request)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def record_response(self, response):
+        """Response listener that tracks transferred bytes of allowed requests."""
+        resource_type = response.request.resource_type
+        self.allowed_requests[resource_type] += 1
+        try:
+            self.allowed_bytes[resource_type] += int(
+                response.headers.get("content-length", 0)
+            )
+        except ValueError:
+            pass
+
+    def estimated_blocked_bytes(self) -> int:
+        """Estimate the bytes saved from the average size of allowed responses."""
+        if not self.allowed_requests:
+            return 0
+        overall_avg = sum(self.allowed_bytes.values()) / sum(
+            self.allowed_requests.values()
+        )
+        estimate = 0.0
+        for resource_type, count in self.blocked_requests.items():
+            seen = self.allowed_requests.get(resource_type)
+            avg = self.allowed_bytes[resource_type] / seen if seen else overall_avg
+            estimate += avg * count
+        return int(estimate)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "blocked_requests": sum(self.blocked_requests.values()),
+            "blocked_by_type": dict(self.blocked_requests),
+            "estimated_blocked_bytes": self.estimated_blocked_bytes(),
+            "allowed_requests": sum(self.allowed_requests.values()),
+            "allowed_bytes": sum(self.allowed_bytes.values()),
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(
+            f"Resource blocking: {stats['blocked_requests']} requests blocked "
+            f"(~{stats['estimated_blocked_bytes'] / 1024:.0f} KiB saved), "
+            f"{stats['allowed_requests']} allowed "
+            f"({stats['allowed_bytes'] / 1024:.0f} KiB transferred)"
+        )
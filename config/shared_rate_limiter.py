@@ -0,0 +1,190 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Hashable, Optional
+from urllib.parse import urlsplit
+
+from .config import ScraperConfig
+from .rate_limiter import AdaptiveRateLimiter, RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# GCRA in one round trip: returns how long the caller has to wait
+_REDIS_RESERVE_SCRIPT = """
+local tat = tonumber(redis.call('GET', KEYS[1]) or ARGV[1])
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+if tat < now then tat = now end
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1000)
+local delay = new_tat - burst * interval - now
+if delay < 0 then delay = 0 end
+return tostring(delay)
+"""
+
+
+def gcra_reserve(tat: Optional[float], now: float, interval: float, burst: int):
+    """Generic cell rate algorithm step: return ``(new_tat, delay)``.
+
+    ``tat`` is the theoretical arrival time of the next request. Every
+    reservation pushes it one ``interval`` further; a caller only waits once
+    it is more than ``burst`` intervals ahead of now.
+    """
+    tat = max(tat or now, now)
+    new_tat = tat + interval
+    return new_tat, max(0.0, new_tat - burst * interval - now)
+
+
+class SQLiteBackend:
+    """Shares rate limit state between processes on one machine via a SQLite file."""
+
+    def __init__(self, path: str = ScraperConfig.RATE_LIMIT_DB):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL)"
+        )
+
+    def reserve(self, key: str, now: float, interval: float, burst: int) -> float:
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, so read-modify-write is atomic
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT tat FROM rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                new_tat, delay = gcra_reserve(row[0] if row else None, now, interval, burst)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, tat) VALUES (?, ?)",
+                    (key, new_tat),
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return delay
+
+    def close(self):
+        self._connection.close()
+
+
+class RedisBackend:
+    """Shares rate limit state through Redis or any server speaking its protocol.
+
+    ``client`` only needs an ``eval(script, numkeys, *keys_and_args)`` method,
+    so a local stand-in (e.g. a Redis-compatible server or fakeredis) works.
+    """
+
+    def __init__(self, client, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "RATE_LIMIT_BACKEND points to Redis, install it with 'pip install redis'"
+            )
+        return cls(redis.Redis.from_url(url))
+
+    def reserve(self, key: str, now: float, interval: float, burst: int) -> float:
+        delay = self.client.eval(
+            _REDIS_RESERVE_SCRIPT, 1, self.prefix + key, now, interval, burst
+        )
+        if isinstance(delay, bytes):
+            delay = delay.decode()
+        return float(delay)
+
+    def close(self):
+        close = getattr(self.client, "close", None)
+        if close:
+            close()
+
+
+def backend_from_url(url: str):
+    """Create a backend from ``sqlite:///path/to.db`` or ``redis://host:port/db``."""
+    scheme = urlsplit(url).scheme
+    if scheme == "sqlite":
+        return SQLiteBackend(url[len("sqlite:///"):] or ScraperConfig.RATE_LIMIT_DB)
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisBackend.from_url(url)
+    raise ValueError(f"Unsupported rate limit backend '{url}'")
+
+
+class SharedRateLimiter(RateLimiter):
+    """RateLimiter whose budget is shared by every process using the same backend.
+
+    State lives in the backend (SQLite file or Redis) instead of in-process
+    buckets, so several scraper processes together stay within
+    ``requests_per_minute`` per key (e.g. per domain). Uses wall-clock time,
+    since monotonic clocks are not comparable across processes.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        backend,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(requests_per_minute, burst, clock)
+        self.backend = backend
+
+    def reserve(self, key: Optional[Hashable] = None) -> float:
+        if self.requests_per_minute <= 0:
+            return 0.0
+        rate = self._rate_per_second(key)
+        return self.backend.reserve(
+            "default" if key is None else str(key), self.clock(), 1 / rate, self.burst
+        )
+
+    def close(self):
+        """Close the backend connection; the shared state stays in the backend."""
+        self.backend.close()
+
+
+class SharedAdaptiveRateLimiter(SharedRateLimiter, AdaptiveRateLimiter):
+    """Shared budget whose per-key rate is still adapted from this process's responses."""
+
+    def __init__(self, requests_per_minute: int, backend, **kwargs):
+        AdaptiveRateLimiter.__init__(self, requests_per_minute, **kwargs)
+        self.clock = time.time
+        self.backend = backend
+
+
+def rate_limit_backend_url(config=None) -> Optional[str]:
+    """``config.RATE_LIMIT_BACKEND``, falling back to ScraperConfig's."""
+    return getattr(config, "RATE_LIMIT_BACKEND", None) or ScraperConfig.RATE_LIMIT_BACKEND
+
+
+def create_rate_limiter(
+    config=None, requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE
+) -> Optional[RateLimiter]:
+    """Build the rate limiter a scraper's browser managers should use.
+
+    Shared across processes when ``RATE_LIMIT_BACKEND`` is set, adaptive when
+    ``ADAPTIVE_RATE_LIMIT`` is on. Returns None for the managers' default.
+    A shared limiter holds a backend connection; the managers close it with
+    themselves.
+    """
+    adaptive = AdaptiveRateLimiter.from_config(config, requests_per_minute)
+    backend_url = rate_limit_backend_url(config)
+    if not backend_url:
+        return adaptive
+    backend = backend_from_url(backend_url)
+    logger.info(f"Sharing the rate limit through {backend_url}")
+    if adaptive:
+        return SharedAdaptiveRateLimiter(requests_per_minute, backend)
+    return SharedRateLimiter(requests_per_minute, backend)
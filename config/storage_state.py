@@ -0,0 +1,80 @@
+import logging
+import os
+import re
+import time
+from typing import Optional
+
+from .config import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+class StorageStateCache:
+    """Persists Playwright storage state (cookies, localStorage) per target domain.
+
+    Browser managers load the cached state into every new context, so consent
+    cookies and sessions survive context rotation and separate runs. States
+    older than ``ttl_seconds`` are ignored.
+    """
+
+    def __init__(
+        self,
+        directory: str = ScraperConfig.STORAGE_STATE_DIR,
+        ttl_seconds: int = ScraperConfig.STORAGE_STATE_TTL,
+    ):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def path_for(self, domain: str) -> str:
+        safe_domain = re.sub(r"[^A-Za-z0-9.-]", "_", domain)
+        return os.path.join(self.directory, f"{safe_domain}.json")
+
+    def load(self, domain: Optional[str]) -> Optional[str]:
+        """Return the path of a fresh cached state for ``domain``, if any."""
+        if not domain:
+            return None
+        path = self.path_for(domain)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > self.ttl_seconds:
+            logger.info(f"Storage state for {domain} expired ({age / 3600:.1f} h old)")
+            return None
+        return path
+
+    def _prepare_write(self, domain: str, context) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        return f"{self.path_for(domain)}.{os.getpid()}.{id(context)}.tmp"
+
+    def save(self, domain: Optional[str], context) -> bool:
+        """Write the context's storage state for ``domain`` (sync Playwright API)."""
+        if not domain or context is None:
+            return False
+        tmp_path = self._prepare_write(domain, context)
+        try:
+            context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self.path_for(domain))
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save storage state for {domain}: {e}")
+            return False
+
+    async def save_async(self, domain: Optional[str], context) -> bool:
+        """Write the context's storage state for ``domain`` (async Playwright API)."""
+        if not domain or context is None:
+            return False
+        tmp_path = self._prepare_write(domain, context)
+        try:
+            await context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self.path_for(domain))
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save storage state for {domain}: {e}")
+            return False
+
+    def clear(self, domain: str):
+        try:
+            os.remove(self.path_for(domain))
+        except OSError:
+            pass
@@ -0,0 +1,253 @@
+import importlib
+import logging
+import multiprocessing
+import queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .config import ScraperConfig
+from .shared_rate_limiter import rate_limit_backend_url
+
+logger = logging.getLogger(__name__)
+
+# Scrapers a worker can run, as "module.ClassName" so workers import lazily.
+SCRAPER_CLASSES = {
+    "gelbeseiten": "scrapers.gelbeseiten.scraper.GelbeseitenScraper",
+    "googlemaps": "scrapers.googlemaps.scraper.GoogleMapsScraper",
+}
+SCRAPER_CONFIGS = {
+    "gelbeseiten": "scrapers.gelbeseiten.config.GelbeseitenConfig",
+    "googlemaps": "scrapers.googlemaps.config.GoogleMapsConfig",
+}
+
+Job = Union[Dict[str, Any], Sequence[Any]]
+
+
+def normalize_job(job: Job) -> Dict[str, Any]:
+    """Turn a (scraper, query, location[, max_entries]) tuple into a job dict."""
+    if isinstance(job, dict):
+        normalized = dict(job)
+    else:
+        normalized = dict(zip(("scraper", "query", "location", "max_entries"), job))
+
+    if normalized.get("scraper") not in SCRAPER_CLASSES:
+        raise ValueError(
+            f"Unknown scraper '{normalized.get('scraper')}'. "
+            f"Available: {', '.join(SCRAPER_CLASSES)}"
+        )
+    normalized.setdefault("max_entries", None)
+    return normalized
+
+
+def _load(path: str):
+    module_name, class_name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_scraper_class(name: str):
+    return _load(SCRAPER_CLASSES[name])
+
+
+def load_scraper_config(name: str):
+    return _load(SCRAPER_CONFIGS[name])
+
+
+def worker_rates(
+    scraper_names: Iterable[str], requests_per_minute: int, workers: int
+) -> Dict[str, int]:
+    """Requests per minute each worker gives a browser of each scraper.
+
+    The total is split across the workers, unless the scraper's rate limit
+    is shared through a backend (its own RATE_LIMIT_BACKEND or
+    ScraperConfig's, as create_rate_limiter() reads it); then the workers
+    share one budget anyway and each is given the total.
+    """
+    return {
+        name: (
+            requests_per_minute
+            if rate_limit_backend_url(load_scraper_config(name))
+            else max(1, requests_per_minute // workers)
+        )
+        for name in scraper_names
+    }
+
+
+def _worker_main(
+    worker_id: int,
+    job_queue,
+    result_queue,
+    rates: Dict[str, int],
+    proxy: Optional[str],
+    scraper_options: Optional[Dict[str, Dict[str, Any]]] = None,
+):
+    """Worker process: run jobs until a None sentinel.
+
+    Each scraper gets its own BrowserManager, built by the scraper's
+    create_browser() so its resource blocker, storage state, proxy pool and
+    rate limiter apply. It is started on the scraper's first job and kept
+    for the rest. Each finished job carries the browser's peak memory while
+    it ran as ``peak_memory_mb``. ``rates`` maps scraper names to their
+    requests per minute (see worker_rates()), ``scraper_options`` to extra
+    keyword arguments for their constructors.
+    """
+    scraper_options = scraper_options or {}
+    scrapers = {}
+    browsers = {}
+    try:
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+            name = job["scraper"]
+            requests_per_minute = rates[name]
+            try:
+                if name not in scrapers:
+                    scrapers[name] = load_scraper_class(name)(
+                        proxy=proxy, **scraper_options.get(name, {})
+                    )
+                if name not in browsers:
+                    browsers[name] = scrapers[name].create_browser(requests_per_minute)
+            except Exception as e:
+                logger.error(
+                    f"Worker {worker_id} could not start a {name} browser: {e}"
+                )
+                job["peak_memory_mb"] = 0.0
+                result_queue.put((worker_id, job, [], repr(e)))
+                continue
+
+            browser = browsers[name]
+            try:
+                results = scrapers[name].scrape(
+                    query=job["query"],
+                    location=job["location"],
+                    max_entries=job["max_entries"],
+                    requests_per_minute=requests_per_minute,
+                    browser=browser,
+                )
+                error = None
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed on {job}: {e}")
+                results, error = [], repr(e)
+            job["peak_memory_mb"] = round(browser.memory_watchdog.reset_job_peak(), 1)
+            result_queue.put((worker_id, job, results, error))
+    finally:
+        for browser in browsers.values():
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning(f"Worker {worker_id} could not close its browser: {e}")
+        for scraper in scrapers.values():
+            place_index = getattr(scraper, "place_index", None)
+            if place_index is not None:
+                place_index.close()
+        result_queue.put((worker_id, None, None, None))
+
+
+class WorkerFarm:
+    """Shards scrape jobs across worker processes that each own a browser.
+
+    Jobs are pulled from a shared queue, so faster workers pick up more
+    work. ``requests_per_minute`` is the total budget. It is split evenly
+    across the workers, unless the scraper's RATE_LIMIT_BACKEND shares one
+    budget between processes anyway; then every worker is given the total.
+
+    ``scraper_options`` maps scraper names to extra constructor arguments,
+    e.g. ``{"googlemaps": {"place_index": PlaceIndex(path)}}``. They are
+    pickled into every worker.
+    """
+
+    def __init__(
+        self,
+        workers: int = ScraperConfig.WORKER_PROCESSES,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        proxy: Optional[str] = None,
+        scraper_options: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.workers = max(1, workers)
+        self.requests_per_minute = requests_per_minute
+        self.proxy = proxy
+        self.scraper_options = scraper_options or {}
+        self.failed_jobs: List[Dict[str, Any]] = []
+
+    def iter_job_results(self, jobs: Iterable[Job]) -> Iterator[tuple]:
+        """Yield ``(job, results)`` for every finished job, in completion order."""
+        jobs = [normalize_job(job) for job in jobs]
+        if not jobs:
+            return
+
+        workers = min(self.workers, len(jobs))
+        rates = worker_rates(
+            {job["scraper"] for job in jobs}, self.requests_per_minute, workers
+        )
+        ctx = multiprocessing.get_context("spawn")
+        job_queue = ctx.Queue()
+        result_queue = ctx.Queue()
+
+        for job in jobs:
+            job_queue.put(job)
+        for _ in range(workers):
+            job_queue.put(None)
+
+        processes = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    job_queue,
+                    result_queue,
+                    rates,
+                    self.proxy,
+                    self.scraper_options,
+                ),
+                daemon=True,
+            )
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        logger.info(
+            f"Started {workers} workers for {len(jobs)} jobs "
+            f"(requests/minute each: {rates})"
+        )
+
+        pending = len(jobs)
+        finished_workers = set()
+        try:
+            while pending and len(finished_workers) < workers:
+                try:
+                    worker_id, job, results, error = result_queue.get(timeout=1)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        break
+                    continue
+
+                if job is None:
+                    finished_workers.add(worker_id)
+                    continue
+
+                pending -= 1
+                if error:
+                    self.failed_jobs.append(job)
+                    continue
+                logger.info(
+                    f"Worker {worker_id} finished {job['scraper']} "
+                    f"'{job['query']}' in '{job['location']}': {len(results)} entries, "
+                    f"peak browser memory {job['peak_memory_mb']:.0f} MB"
+                )
+                yield job, results
+
+            if pending:
+                logger.error(f"All workers exited with {pending} jobs unfinished")
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+    def iter_results(self, jobs: Iterable[Job]) -> Iterator[Dict]:
+        """Yield the records of all jobs as one stream."""
+        for _, results in self.iter_job_results(jobs):
+            yield from results
+
+    def run(self, jobs: Iterable[Job]) -> List[Dict]:
+        """Run all jobs and return the merged records."""
+        return list(self.iter_results(jobs))
@@ -0,0 +1,117 @@
+"""Helpers for Gelbeseiten's ``ajaxsuche`` pagination endpoint.
+
+Shared by the browser engine (requests sent from the page) and the HTTP
+engine (requests sent from a requests session).
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from .config import GelbeseitenConfig
+from .parser import parse_entries
+
+logger = logging.getLogger(__name__)
+
+AJAX_PATH = "/ajaxsuche"
+
+# Sent by the site's own "load more" button
+AJAX_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+
+def build_form_data(query: str, location: str, position: int, batch_size: int):
+    """Build the form data for an ajaxsuche batch request."""
+    return {
+        "umkreis": "-1",
+        "verwandt": "false",
+        "WAS": query,
+        "WO": location,
+        "position": str(position),
+        "startIndex": str(position),
+        "anzahl": str(batch_size),
+    }
+
+
+def batch_offsets(start: int, end: int) -> List[Tuple[int, int]]:
+    """(position, batch size) of every ajaxsuche request needed for entries start..end."""
+    step = GelbeseitenConfig.ENTRIES_PER_REQUEST
+    return [
+        (position, min(step, end - position)) for position in range(start, end, step)
+    ]
+
+
+class OrderedBatches:
+    """Collects ajaxsuche batches by offset and releases their entries in order.
+
+    Batches may arrive out of order (concurrent windows, retries); entries
+    are only released once every earlier offset has arrived, so callers can
+    stream results without reordering them.
+    """
+
+    def __init__(self, offsets: List[Tuple[int, int]]):
+        self.offsets = list(offsets)
+        self._entries: Dict[int, List[Dict]] = {}
+        self._next = 0
+        self.received = 0
+
+    def add(self, position: int, entries: List[Dict]):
+        self._entries[position] = entries
+        self.received += 1
+
+    def pop_ready(self) -> List[Dict]:
+        """Entries of the batches that are complete up to the first gap."""
+        ready = []
+        while (
+            self._next < len(self.offsets)
+            and self.offsets[self._next][0] in self._entries
+        ):
+            ready.extend(self._entries.pop(self.offsets[self._next][0]))
+            self._next += 1
+        return ready
+
+    def pop_remaining(self) -> List[Dict]:
+        """Entries of all batches left, in order, logging the gaps given up on."""
+        remaining_offsets = self.offsets[self._next :]
+        missing = [
+            position
+            for position, _ in remaining_offsets
+            if position not in self._entries
+        ]
+        if missing:
+            logger.error(f"Giving up on batches at positions {missing}")
+        remaining = []
+        for position, _ in remaining_offsets:
+            remaining.extend(self._entries.pop(position, []))
+        self._next = len(self.offsets)
+        return remaining
+
+
+def collect_batches(
+    window: List[Tuple[int, int]],
+    responses: List[Optional[Dict]],
+    search_query: str,
+    total_available: int,
+    batches: OrderedBatches,
+) -> List[Tuple[int, int]]:
+    """Parse a window's responses into ``batches`` and return the offsets to retry.
+
+    Each response is ``{"html": ...}`` or ``{"error": ...}``. An error, a
+    missing payload or an empty batch before the end of the result list
+    counts as a gap.
+    """
+    failed = []
+    for (position, size), response in zip(window, responses):
+        html = response.get("html") if response else None
+        entries = parse_entries(html, search_query) if html is not None else []
+        if entries or position >= total_available:
+            batches.add(position, entries)
+        else:
+            logger.warning(
+                f"Batch at position {position} failed: "
+                f"{(response or {}).get('error', 'empty response')}"
+            )
+            failed.append((position, size))
+    return failed
@@ -5,10 +5,11 @@ import questionary
 import json
 from typing import Dict, Any
 from config.base_cli import ScraperCLI
+from config.grid_runner import read_terms
 from scrapers.gelbeseiten.scraper import GelbeseitenScraper
 from scrapers.gelbeseiten.config import GelbeseitenConfig
-from utils.db import DatabaseManager
-from utils.store_data_json_helper import store_data_as_json
+from utils.checkpoint import Checkpoint
+from utils.sinks import create_sink, jsonl_path
 
 
 class GelbeseitenCLI(ScraperCLI):
@@ -66,31 +67,54 @@ class GelbeseitenCLI(ScraperCLI):
                 proxy=GelbeseitenConfig.PROXY,
             )
 
-            # Execute scraping
-            results = scraper.scrape(
-                query=params["query"],
-                location=params["location"],
-                max_entries=int(params["max_entries"]),
-                requests_per_minute=int(params.get("requests_per_minute")),
+            storage_type = params.get("storage_type", "both")
+            data_dir = os.path.join(os.path.dirname(__file__), "data")
+            queries = read_terms(params["query"])
+            locations = read_terms(params["location"])
+            if not queries or not locations:
+                print("❌ No search term or location given")
+                return False
+            if len(queries) > 1 or len(locations) > 1:
+                return self.run_grid(
+                    "gelbeseiten", params, queries, locations, data_dir
+                )
+            query, location = queries[0], locations[0]
+            checkpoint = Checkpoint.open(
+                "gelbeseiten",
+                query,
+                location,
+                jsonl_path(data_dir, "gelbeseiten"),
+                resume=params.get("resume", False),
+            )
+            if checkpoint.resumed:
+                print(f"Resuming after {checkpoint.count} entries")
+            sink = create_sink(
+                storage_type,
+                "gelbeseiten_companies",
+                data_dir,
+                "gelbeseiten",
+                checkpoint.output_path,
             )
 
-            if not results:
+            # Records are stored as they are scraped and the checkpoint follows
+            # them, so a crashed run can continue with --resume
+            with sink, checkpoint:
+                for record in scraper.iter_scrape(
+                    query=query,
+                    location=location,
+                    max_entries=int(params["max_entries"]),
+                    requests_per_minute=int(params.get("requests_per_minute")),
+                    start_position=checkpoint.count,
+                ):
+                    sink.write(record)
+                    checkpoint.add(record)
+            count = checkpoint.count
+
+            if not count:
                 print("❌ No results found")
                 return False
 
-            # Store results based on user preference
-            storage_type = params.get("storage_type", "both")
-            if storage_type in ("database", "both"):
-                print(f"Storing {len(results)} entries in database...")
-                db = DatabaseManager()
-                for result in results:
-                    db.store_data("gelbeseiten_companies", result)
-                print(f"✅ Stored {len(results)} entries in database")
-            if storage_type in ("json", "both"):
-                data_dir = os.path.join(os.path.dirname(__file__), "data")
-
-                store_data_as_json(results, data_dir, "gelbeseiten")
-
+            print(f"✅ Stored {count} entries ({storage_type})")
             return True
 
         except Exception as e:
@@ -2,11 +2,43 @@ class GelbeseitenConfig:
     BASE_URL = "https://www.gelbeseiten.de"
 
     PROXY = None
+    # Proxy pool for this scraper; falls back to ScraperConfig.PROXIES when empty
+    PROXIES = []
+
+    # Domain the (adaptive) rate limit is tracked under
+    TARGET_DOMAIN = "gelbeseiten.de"
+
+    # "browser" always uses Playwright; "http" scrapes with plain requests (see
+    # http_engine.py) and only falls back to the browser if that fails. The HTTP
+    # engine paces itself with the rate limiter and proxy pool of the browser
+    # manager passed in, or with ones shared by the scraper instance.
+    ENGINE = "browser"
+
+    ENTRIES_PER_REQUEST = 10  # Gelbeseiten only allows 10 entries per request
+
+    # Fetch all ajaxsuche offsets in concurrent windows instead of one by one
+    PARALLEL_PAGINATION = True
+    PAGINATION_CONCURRENCY = 5  # Requests in flight per window
+    PAGINATION_RETRIES = 2  # Extra attempts for failed or empty batches
+
+    # Requests aborted by the browser (Playwright resource types / URL regexes).
+    # Listings are read from the DOM and ajaxsuche, so media and trackers are never needed.
+    BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+    BLOCKED_URL_PATTERNS = [
+        r"google-analytics\.com",
+        r"googletagmanager\.com",
+        r"doubleclick\.net",
+        r"googlesyndication\.com",
+        r"adsystem",
+        r"criteo",
+        r"hotjar",
+        r"facebook\.(net|com)/tr",
+    ]
 
     # Input parameters ("Name", "Label")
     INPUT_PARAMS = [
-        ("query", "Search term"),
-        ("location", "Location"),
+        ("query", "Search term(s), comma-separated or a file"),
+        ("location", "Location(s), comma-separated or a file"),
         ("max_entries", "Maximum entries"),
         ("requests_per_minute", "Requests per minute"),
     ]
@@ -0,0 +1,162 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from config.config import ScraperConfig
+from config.http_client import create_session
+from config.proxy_pool import wait_for_slot
+from config.rate_limiter import AdaptiveRateLimiter, RateLimiter, THROTTLE_STATUSES
+from .ajax import (
+    AJAX_HEADERS,
+    AJAX_PATH,
+    OrderedBatches,
+    batch_offsets,
+    build_form_data,
+    collect_batches,
+)
+from .config import GelbeseitenConfig
+from .parser import parse_entries, parse_total_count, search_query_from_url
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserRequired(Exception):
+    """The HTTP engine could not load the listing and the browser has to take over."""
+
+
+class GelbeseitenHttpEngine:
+    """Scrapes Gelbeseiten with plain HTTP requests, without starting a browser.
+
+    The result page is fetched with a GET and further entries are POSTed to
+    ajaxsuche like the page's "load more" button does, on one keep-alive
+    session that keeps the site's cookies. Records are identical to the
+    browser engine's. Raises BrowserRequired when the listing cannot be
+    loaded this way (e.g. a block or consent wall).
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        requests_per_minute: int = ScraperConfig.DEFAULT_REQUESTS_PER_MINUTE,
+        rate_limiter: Optional[RateLimiter] = None,
+        proxy_rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.session = create_session(
+            proxy, pool_size=GelbeseitenConfig.PAGINATION_CONCURRENCY
+        )
+        self.rate_limiter = rate_limiter or RateLimiter(requests_per_minute)
+        # Limit of the exit IP when the proxy comes from a ProxyPool
+        self.proxy_rate_limiter = proxy_rate_limiter
+        self.timeout = ScraperConfig.HTTP_TIMEOUT
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        wait_for_slot(
+            self.rate_limiter, GelbeseitenConfig.TARGET_DOMAIN, self.proxy_rate_limiter
+        )
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        if isinstance(self.rate_limiter, AdaptiveRateLimiter):
+            if response.status_code in THROTTLE_STATUSES:
+                self.rate_limiter.record_throttle(
+                    GelbeseitenConfig.TARGET_DOMAIN, f"HTTP {response.status_code}"
+                )
+            elif response.ok:
+                self.rate_limiter.record_success(GelbeseitenConfig.TARGET_DOMAIN)
+        return response
+
+    def fetch_first_page(self, query: str, location: str) -> Tuple[str, str]:
+        """GET the result page and return its final URL and HTML."""
+        url = f"{GelbeseitenConfig.BASE_URL}/{query}/{location}"
+        logger.info(f"Loading initial page over HTTP: {url}")
+        try:
+            response = self._request("GET", url)
+        except requests.RequestException as e:
+            raise BrowserRequired(f"GET {url} failed: {e}")
+        if not response.ok:
+            raise BrowserRequired(f"GET {url} returned HTTP {response.status_code}")
+        return response.url, response.text
+
+    def fetch_batch(self, query: str, location: str, position: int, size: int) -> Dict:
+        """POST one ajaxsuche batch. Returns ``{"html": ...}`` or ``{"error": ...}``."""
+        try:
+            response = self._request(
+                "POST",
+                GelbeseitenConfig.BASE_URL + AJAX_PATH,
+                data=build_form_data(query, location, position, size),
+                headers=AJAX_HEADERS,
+            )
+            response.raise_for_status()
+            return {"html": response.json().get("html")}
+        except (requests.RequestException, ValueError) as e:
+            return {"error": str(e)}
+
+    def iter_scrape(
+        self,
+        query: str,
+        location: str,
+        max_entries: Optional[int] = None,
+        start_position: int = 0,
+    ) -> Iterator[Dict]:
+        """Yield records as soon as the first page and each batch are parsed.
+
+        ``start_position`` skips the records a previous run already yielded.
+        """
+        page_url, html = self.fetch_first_page(query, location)
+        total_available = parse_total_count(html)
+        if total_available is None:
+            raise BrowserRequired("No result count on the page (blocked or changed?)")
+        logger.info(f"Total available entries found: {total_available}")
+
+        if max_entries is None or max_entries < 0:
+            max_entries = total_available
+        search_query = search_query_from_url(page_url)
+        initial_results = parse_entries(html, search_query)[:max_entries]
+        logger.info(f"Extracted {len(initial_results)} initial entries")
+        yield from initial_results[start_position:]
+
+        offsets = batch_offsets(
+            max(len(initial_results), start_position),
+            min(max_entries, total_available),
+        )
+        batches = OrderedBatches(offsets)
+        pending = offsets
+        window_size = GelbeseitenConfig.PAGINATION_CONCURRENCY
+        with ThreadPoolExecutor(window_size) as executor:
+            for attempt in range(GelbeseitenConfig.PAGINATION_RETRIES + 1):
+                if not pending:
+                    break
+                if attempt:
+                    logger.info(f"Retrying {len(pending)} failed batches")
+                failed = []
+                for start in range(0, len(pending), window_size):
+                    window = pending[start : start + window_size]
+                    responses = list(
+                        executor.map(
+                            lambda offset: self.fetch_batch(query, location, *offset),
+                            window,
+                        )
+                    )
+                    failed.extend(
+                        collect_batches(
+                            window, responses, search_query, total_available, batches
+                        )
+                    )
+                    yield from batches.pop_ready()
+                pending = failed
+        yield from batches.pop_remaining()
+        logger.info(f"Fetched {batches.received}/{len(offsets)} batches")
+
+    def scrape(
+        self, query: str, location: str, max_entries: Optional[int] = None
+    ) -> List[Dict]:
+        return list(self.iter_scrape(query, location, max_entries))
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,92 @@
+"""In-process parsing of Gelbeseiten listing HTML.
+
+Parses ``ajaxsuche`` batches (and full result pages) with selectolax instead
+of evaluating JavaScript in the browser once per entry.
+"""
+
+import base64
+import binascii
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from .config import GelbeseitenConfig
+
+logger = logging.getLogger(__name__)
+
+
+def search_query_from_url(url: str) -> str:
+    """Search term of a result page URL like https://www.gelbeseiten.de/friseur/berlin."""
+    return url.split("/")[-2].capitalize()
+
+
+def format_address(address_text: str) -> str:
+    """Reduce the address block to "street, postal code city"."""
+    address_lines = [line.strip() for line in address_text.splitlines() if line.strip()]
+    address_parts = []
+    if len(address_lines) > 0:
+        address_parts.append(address_lines[0])
+    if len(address_lines) > 1:
+        postal_location = address_lines[1].split(",")[0].strip()
+        address_parts.append(postal_location)
+    address = ", ".join(address_parts)
+    return address.replace(",,", ",").replace(", ,", ",").strip()
+
+
+def decode_website(encoded: Optional[str]) -> str:
+    """Decode the base64 ``data-webseitelink`` attribute into the company URL."""
+    if not encoded:
+        return ""
+    try:
+        return base64.b64decode(encoded).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        logger.debug(f"Could not decode website link {encoded!r}: {e}")
+        return ""
+
+
+def _text(entry: LexborNode, selector: str) -> Optional[str]:
+    node = entry.css_first(selector)
+    return node.text(deep=True, separator="", strip=False) if node else None
+
+
+def parse_total_count(html: str) -> Optional[int]:
+    """Number of results announced in ``#loadMoreGesamtzahl``, if present."""
+    node = LexborHTMLParser(html).css_first("#loadMoreGesamtzahl")
+    try:
+        return int(node.text(strip=True)) if node else None
+    except ValueError:
+        return None
+
+
+def parse_entry(entry: LexborNode, search_query: str) -> Dict:
+    """Build a company record from one ``article`` node."""
+    selectors = GelbeseitenConfig.SELECTORS
+    website = entry.css_first(selectors["company_website"])
+    address = _text(entry, selectors["company_address"])
+    return {
+        "metadata": {
+            "search_query": search_query,
+            "datetime": datetime.now().isoformat(),
+        },
+        "company_name": (_text(entry, selectors["company_name"]) or "").strip(),
+        "company_website": decode_website(
+            website.attributes.get("data-webseitelink") if website else None
+        ),
+        "address": format_address(address) if address else "",
+        "phone": (_text(entry, selectors["company_phone"]) or "").strip(),
+        "source": "gelbeseiten.de",
+    }
+
+
+def parse_entries(html: str, search_query: str) -> List[Dict]:
+    """Parse every company article in ``html`` (an ajaxsuche fragment or full page)."""
+    entries = LexborHTMLParser(html).css(GelbeseitenConfig.SELECTORS["company_article"])
+    results = []
+    for idx, entry in enumerate(entries, 1):
+        try:
+            results.append(parse_entry(entry, search_query))
+        except Exception as e:
+            logger.error(f"Error processing entry {idx}/{len(entries)}: {e}")
+    return results
@@ -1,10 +1,18 @@
-from datetime import datetime
 import logging
-import base64
-from typing import List, Dict, Optional
-
-from config.browser import BrowserManager
+import asyncio
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from config.async_browser import AsyncBrowserManager
+from config.browser import BrowserManager, browser_session
+from config.config import ScraperConfig
+from config.proxy_pool import ProxyPool
+from config.rate_limiter import RateLimiter
+from config.resource_blocker import ResourceBlocker
+from config.shared_rate_limiter import create_rate_limiter
+from .ajax import OrderedBatches, batch_offsets, build_form_data, collect_batches
 from .config import GelbeseitenConfig
+from .http_engine import BrowserRequired, GelbeseitenHttpEngine
+from .parser import parse_entries, parse_total_count, search_query_from_url
 
 # TODO: Stop processing further entries once max_entries is reached
 
@@ -15,11 +23,146 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Posts the ajaxsuche form from inside the page and returns the JSON payload.
+_FETCH_AJAX_JS = """async ([formData, baseUrl]) => {
+    const response = await fetch(baseUrl + '/ajaxsuche', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Accept': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest'
+        },
+        body: new URLSearchParams(formData)
+    });
+    return await response.json();
+}"""
+
+# Posts several ajaxsuche forms concurrently, each after its rate limit delay.
+# Failures are returned per request instead of failing the whole window.
+_FETCH_AJAX_WINDOW_JS = """async ([requests, baseUrl]) => {
+    const fetchOne = async ({formData, delay}) => {
+        if (delay > 0) {
+            await new Promise(resolve => setTimeout(resolve, delay * 1000));
+        }
+        const response = await fetch(baseUrl + '/ajaxsuche', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Accept': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            body: new URLSearchParams(formData)
+        });
+        if (!response.ok) {
+            throw new Error('HTTP ' + response.status);
+        }
+        return await response.json();
+    };
+    const settled = await Promise.allSettled(requests.map(fetchOne));
+    return settled.map(result => result.status === 'fulfilled'
+        ? {html: result.value && result.value.html}
+        : {error: String(result.reason)});
+}"""
+
+
 class GelbeseitenScraper:
     """Scraper for Gelbeseiten.de business listings."""
 
     def __init__(self, proxy: Optional[str] = None):
         self.proxy = proxy
+        # HTTP engine rate limiters by requests per minute, shared by concurrent jobs
+        self._http_rate_limiters: Dict[int, RateLimiter] = {}
+        self._http_proxy_pools: Dict[int, Optional[ProxyPool]] = {}
+
+    def _manager_options(self, requests_per_minute) -> Dict:
+        """Keyword arguments for the browser managers this scraper starts.
+
+        With a proxy pool, ``requests_per_minute`` is each proxy's rate and
+        the domain limiter gets the pool's budget.
+        """
+        proxy_pool = ProxyPool.from_config(GelbeseitenConfig, requests_per_minute)
+        return {
+            "resource_blocker": ResourceBlocker.from_config(GelbeseitenConfig),
+            "proxy_pool": proxy_pool,
+            "rate_limiter": create_rate_limiter(
+                GelbeseitenConfig,
+                (
+                    proxy_pool.domain_requests_per_minute
+                    if proxy_pool
+                    else requests_per_minute
+                ),
+            ),
+            "target_domain": GelbeseitenConfig.TARGET_DOMAIN,
+        }
+
+    def create_browser(self, requests_per_minute=30) -> BrowserManager:
+        """A BrowserManager set up like the ones this scraper starts itself.
+
+        For callers that own the browser across jobs (e.g. worker processes).
+        """
+        return BrowserManager(
+            requests_per_minute,
+            self.proxy,
+            **self._manager_options(requests_per_minute),
+        )
+
+    def _http_pacing(self, requests_per_minute, browser=None):
+        """Rate limiter and proxy pool for the HTTP engine.
+
+        A browser manager passed by the caller (worker farm, grid runner)
+        already carries the job's limiter and proxy pool, so they are
+        shared with it. Otherwise one of each is kept per rate, so
+        concurrent jobs of this scraper share the budget and proxy scores.
+        """
+        if browser is not None:
+            return browser.rate_limiter, browser.proxy_pool
+        if requests_per_minute not in self._http_proxy_pools:
+            self._http_proxy_pools[requests_per_minute] = ProxyPool.from_config(
+                GelbeseitenConfig, requests_per_minute
+            )
+        proxy_pool = self._http_proxy_pools[requests_per_minute]
+        rate_limiter = self._http_rate_limiters.get(requests_per_minute)
+        if rate_limiter is None:
+            domain_rpm = (
+                proxy_pool.domain_requests_per_minute
+                if proxy_pool
+                else requests_per_minute
+            )
+            rate_limiter = self._http_rate_limiters.setdefault(
+                requests_per_minute,
+                create_rate_limiter(GelbeseitenConfig, domain_rpm)
+                or RateLimiter(domain_rpm),
+            )
+        return rate_limiter, proxy_pool
+
+    def _iter_scrape_http(
+        self,
+        query,
+        location,
+        max_entries,
+        requests_per_minute,
+        start_position=0,
+        browser=None,
+    ) -> Iterator[Dict]:
+        """Scrape with the HTTP engine; raises BrowserRequired if it cannot."""
+        rate_limiter, proxy_pool = self._http_pacing(requests_per_minute, browser)
+        proxy_state = proxy_pool.acquire() if proxy_pool else None
+        if proxy_state:
+            proxy = proxy_state.url
+        else:
+            proxy = browser.proxy if browser is not None else self.proxy
+        try:
+            with GelbeseitenHttpEngine(
+                proxy,
+                rate_limiter=rate_limiter,
+                proxy_rate_limiter=proxy_state.rate_limiter if proxy_state else None,
+            ) as engine:
+                yield from engine.iter_scrape(
+                    query, location, max_entries, start_position
+                )
+        finally:
+            if proxy_state:
+                proxy_pool.release(proxy_state)
 
     def scrape(
         self,
@@ -27,13 +170,55 @@ class GelbeseitenScraper:
         location: str = GelbeseitenConfig.DEFAULT_VALUES["location"],
         max_entries: Optional[int] = None,
         requests_per_minute=30,
+        browser: Optional[BrowserManager] = None,
     ) -> List[Dict]:
-        """Scrape business listings from Gelbeseiten.de."""
+        """Scrape business listings from Gelbeseiten.de.
+
+        Pass ``browser`` to reuse a BrowserManager owned by the caller;
+        otherwise one is launched and closed for this call.
+        """
+        return list(
+            self.iter_scrape(query, location, max_entries, requests_per_minute, browser)
+        )
+
+    def iter_scrape(
+        self,
+        query: str = GelbeseitenConfig.DEFAULT_VALUES["query"],
+        location: str = GelbeseitenConfig.DEFAULT_VALUES["location"],
+        max_entries: Optional[int] = None,
+        requests_per_minute=30,
+        browser: Optional[BrowserManager] = None,
+        start_position: int = 0,
+    ) -> Iterator[Dict]:
+        """Like scrape(), but yields each record as soon as its batch is parsed.
+
+        Records are yielded in result list order, so a run that stopped after
+        N records resumes with ``start_position=N``.
+        """
+        if GelbeseitenConfig.ENGINE == "http":
+            try:
+                yield from self._iter_scrape_http(
+                    query,
+                    location,
+                    max_entries,
+                    requests_per_minute,
+                    start_position,
+                    browser,
+                )
+                return
+            except BrowserRequired as e:
+                logger.warning(f"HTTP engine failed ({e}), falling back to the browser")
+
         base_url = GelbeseitenConfig.BASE_URL
         url = f"{base_url}/{query}/{location}"
-        results = []
-
-        with BrowserManager(requests_per_minute, self.proxy) as browser:
+        collected = 0
+
+        with browser_session(
+            browser,
+            requests_per_minute,
+            self.proxy,
+            manager_options=lambda: self._manager_options(requests_per_minute),
+        ) as browser:
             page = browser.get_page()
 
             # Load initial page
@@ -45,30 +230,22 @@ class GelbeseitenScraper:
             page.wait_for_selector(GelbeseitenConfig.SELECTORS["company_article"])
             page.wait_for_selector("#loadMoreGesamtzahl")
 
-            # Get initial entries count
-            initial_entries = len(
-                page.query_selector_all(GelbeseitenConfig.SELECTORS["company_article"])
-            )
-            logger.info(f"Initial entries loaded: {initial_entries}")
+            # One round trip for the whole first page, parsed in-process
+            html = page.content()
+            total_available = parse_total_count(html)
+            if total_available is None:
+                logger.error("Could not parse total entries count")
+                return
+            logger.info(f"Total available entries found: {total_available}")
 
-            # Get total available entries from #loadMoreGesamtzahl
-            total_count_text = page.evaluate(
-                '() => document.querySelector("#loadMoreGesamtzahl").textContent'
-            )
-            try:
-                total_available = int(total_count_text.strip())
-                logger.info(f"Total available entries found: {total_available}")
-
-                # If max_entries is None or negative, use total_available
-                if max_entries is None or max_entries < 0:
-                    max_entries = total_available
-                    logger.info(f"Will fetch all {max_entries} available entries")
-            except (ValueError, AttributeError) as e:
-                logger.error(f"Could not parse total entries count: {e}")
-                return results
+            # If max_entries is None or negative, use total_available
+            if max_entries is None or max_entries < 0:
+                max_entries = total_available
+                logger.info(f"Will fetch all {max_entries} available entries")
 
             # First extract initial entries
-            initial_results = self._extract_entries(page)
+            initial_results = self._extract_entries_from_html(page, html)
+            logger.info(f"Initial entries loaded: {len(initial_results)}")
 
             if max_entries is not None and len(initial_results) > max_entries:
                 initial_results = initial_results[:max_entries]
@@ -76,232 +253,404 @@ class GelbeseitenScraper:
                     f"Limited initial results to {max_entries} entries as requested"
                 )
 
-            results.extend(initial_results)
+            yield from initial_results[start_position:]
+            collected += len(initial_results[start_position:])
             logger.info(f"Extracted {len(initial_results)} initial entries")
 
             # Calculate how many additional entries we need
-            remaining_entries = max_entries - len(initial_results)
-            current_position = len(initial_results)
-            ENTRIES_PER_REQUEST = 10  # Gelbeseiten only allows 10 entries per request
+            current_position = max(len(initial_results), start_position)
+            remaining_entries = max_entries - current_position
+
+            if GelbeseitenConfig.PARALLEL_PAGINATION and remaining_entries > 0:
+                for record in self._iter_offsets(
+                    browser,
+                    page,
+                    query,
+                    location,
+                    batch_offsets(current_position, max_entries),
+                    total_available,
+                ):
+                    collected += 1
+                    yield record
+                remaining_entries = 0
 
             # Load more entries in batches
             while remaining_entries > 0:
                 # Calculate entries to fetch in this batch
-                batch_size = min(ENTRIES_PER_REQUEST, remaining_entries)
+                batch_size = min(
+                    GelbeseitenConfig.ENTRIES_PER_REQUEST, remaining_entries
+                )
 
                 # Prepare form data for the batch request
-                form_data = {
-                    "umkreis": "-1",
-                    "verwandt": "false",
-                    "WAS": query,
-                    "WO": location,
-                    "position": str(current_position),
-                    "startIndex": str(current_position),
-                    "anzahl": str(batch_size),
-                }
+                form_data = build_form_data(
+                    query, location, current_position, batch_size
+                )
 
                 logger.info(
                     f"Requesting batch of {batch_size} entries starting from position {current_position}"
                 )
 
+                browser.throttle()
                 response = self._fetch_ajax_html(page, form_data, base_url)
                 if response and "html" in response:
                     try:
                         new_entries = self._extract_entries_from_html(
-                            page, response["html"], current_position
+                            page, response["html"]
                         )
                         logger.info(f"Received {len(new_entries)} new entries")
-
-                        if len(new_entries) == 0:
-                            logger.info("No more entries available")
-                            break
-
-                        results.extend(new_entries)
-                        logger.info(f"Processed entries {len(results)}/{max_entries}")
-
-                        # Update counters
-                        current_position += len(new_entries)
-                        remaining_entries -= len(new_entries)
-
                     except Exception as e:
                         logger.error(f"Error processing HTML response: {e}")
                         break
+
+                    if len(new_entries) == 0:
+                        if current_position < total_available:
+                            # An empty batch before the end is how throttling shows up
+                            browser.report_throttle("empty ajaxsuche response")
+                        logger.info("No more entries available")
+                        break
+
+                    browser.report_success()
+                    yield from new_entries
+                    collected += len(new_entries)
+                    logger.info(f"Processed entries {collected}/{max_entries}")
+
+                    # Update counters
+                    current_position += len(new_entries)
+                    remaining_entries -= len(new_entries)
                 else:
+                    browser.report_throttle("invalid ajaxsuche response")
                     logger.error("Invalid response format")
                     break
 
-            logger.info(f"Finished scraping. Total entries collected: {len(results)}")
-            return results
+            logger.info(f"Finished scraping. Total entries collected: {collected}")
 
-    def _fetch_ajax_html(self, page, form_data, base_url):
-        """Send AJAX POST request and return the JSON response."""
-        return page.evaluate(
-            """async ([formData, baseUrl]) => {
-                const response = await fetch(baseUrl + '/ajaxsuche', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                        'Accept': 'application/json',
-                        'X-Requested-With': 'XMLHttpRequest'
-                    },
-                    body: new URLSearchParams(formData)
-                });
-                return await response.json();
-            }""",
-            [form_data, base_url],
-        )
+    def scrape_many(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_entries: Optional[int] = None,
+        requests_per_minute=30,
+        concurrency: int = ScraperConfig.PAGE_POOL_SIZE,
+    ) -> List[Dict]:
+        """Scrape several (query, location) pairs concurrently in one browser.
 
-    def _extract_entries_from_html(self, page, html_string, current_position):
-        """Extract company entries from AJAX-loaded HTML."""
-        entry_html_list = page.evaluate(
-            """({html, selector}) => {
-                const temp = document.createElement('div');
-                temp.innerHTML = html;
-                return Array.from(temp.querySelectorAll(selector)).map(e => e.outerHTML);
-            }""",
-            {
-                "html": html_string,
-                "selector": GelbeseitenConfig.SELECTORS["company_article"],
-            },
+        Each job runs on its own page leased from an AsyncBrowserManager
+        pool. Results are returned in job order.
+        """
+        return asyncio.run(
+            self._scrape_many(jobs, max_entries, requests_per_minute, concurrency)
         )
-        search_query = page.url.split("/")[-2].capitalize()
-        location = page.url.split("/")[-1].capitalize()
+
+    async def _scrape_many(self, jobs, max_entries, requests_per_minute, concurrency):
+        if GelbeseitenConfig.ENGINE == "http":
+            # No shared browser: a job only starts one if the HTTP engine fails
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run(query, location):
+                async with semaphore:
+                    return await self.scrape_async(
+                        query,
+                        location,
+                        max_entries,
+                        requests_per_minute=requests_per_minute,
+                    )
+
+            job_results = await asyncio.gather(
+                *[run(query, location) for query, location in jobs],
+                return_exceptions=True,
+            )
+        else:
+            async with AsyncBrowserManager(
+                requests_per_minute,
+                self.proxy,
+                pool_size=concurrency,
+                **self._manager_options(requests_per_minute),
+            ) as browser:
+                job_results = await asyncio.gather(
+                    *[
+                        self.scrape_async(query, location, max_entries, browser=browser)
+                        for query, location in jobs
+                    ],
+                    return_exceptions=True,
+                )
+
+        results = []
+        for (query, location), job_result in zip(jobs, job_results):
+            if isinstance(job_result, Exception):
+                logger.error(f"Scraping {query} in {location} failed: {job_result}")
+                continue
+            results.extend(job_result)
+        return results
+
+    async def scrape_async(
+        self,
+        query: str = GelbeseitenConfig.DEFAULT_VALUES["query"],
+        location: str = GelbeseitenConfig.DEFAULT_VALUES["location"],
+        max_entries: Optional[int] = None,
+        browser: Optional[AsyncBrowserManager] = None,
+        requests_per_minute=30,
+    ) -> List[Dict]:
+        """Async variant of scrape() running on a page leased from ``browser``.
+
+        If no browser is given, a single-page AsyncBrowserManager is started
+        for this call. With the HTTP engine the browser is only used as a
+        fallback.
+        """
         return [
-            self._extract_company_from_html(
-                page, entry_html, idx, current_position, search_query, location
+            record
+            async for record in self.aiter_scrape(
+                query, location, max_entries, browser, requests_per_minute
             )
-            for idx, entry_html in enumerate(entry_html_list, 1)
         ]
 
-    def _extract_company_from_html(
-        self, page, entry_html, idx, current_position, search_query, location
-    ):
-        """Extract a single company from an HTML string using Playwright JS evaluation."""
-        return page.evaluate(
-            """(args) => {
-                const { entryHtml, idx, currentPosition, search_query, location, selectors } = args;
-                const temp = document.createElement('div');
-                temp.innerHTML = entryHtml;
-                const entry = temp.firstElementChild;
-                let name = '';
-                let url_decoded = '';
-                let address = '';
-                let phone = '';
-                try {
-                    name = entry.querySelector(selectors.company_name).textContent.trim();
-                } catch {}
-                try {
-                    const url_container = entry.querySelector(selectors.company_website);
-                    if (url_container) {
-                        const url_encoded = url_container.getAttribute('data-webseitelink');
-                        url_decoded = url_encoded ? atob(url_encoded) : '';
-                    }
-                } catch {}
-                try {
-                    const address_elem = entry.querySelector(selectors.company_address);
-                    if (address_elem) {
-                        const address_lines = address_elem.textContent.split('\\n').map(l => l.trim()).filter(Boolean);
-                        let address_parts = [];
-                        if (address_lines.length > 0) {
-                            address_parts.push(address_lines[0]);
-                        }
-                        if (address_lines.length > 1) {
-                            const postal_location = address_lines[1].split(',')[0].trim();
-                            address_parts.push(postal_location);
-                        }
-                        address = address_parts.join(', ').replace(',,', ',').replace(', ,', ',').trim();
-                    }
-                } catch {}
-                try {
-                    const phone_elem = entry.querySelector(selectors.company_phone);
-                    phone = phone_elem ? phone_elem.textContent.trim() : '';
-                } catch {}
-                return {
-                    company_name: name,
-                    search_query,
-                    url: url_decoded,
-                    address,
-                    phone,
-                    source: "gelbeseiten.de",
-                };
-            }""",
-            {
-                "entryHtml": entry_html,
-                "idx": idx,
-                "currentPosition": current_position,
-                "search_query": search_query,
-                "location": location,
-                "selectors": GelbeseitenConfig.SELECTORS,
-            },
-        )
-
-    def _extract_entries(self, page) -> List[Dict]:
-        """Extract business entries from the current page."""
-        results = []
-        entries = page.query_selector_all(
-            GelbeseitenConfig.SELECTORS["company_article"]
+    async def aiter_scrape(
+        self,
+        query: str = GelbeseitenConfig.DEFAULT_VALUES["query"],
+        location: str = GelbeseitenConfig.DEFAULT_VALUES["location"],
+        max_entries: Optional[int] = None,
+        browser: Optional[AsyncBrowserManager] = None,
+        requests_per_minute=30,
+        start_position: int = 0,
+    ) -> AsyncIterator[Dict]:
+        """Like scrape_async(), but yields each record as soon as its batch is parsed."""
+        if GelbeseitenConfig.ENGINE == "http":
+            try:
+                async for record in self._aiter_scrape_http(
+                    query,
+                    location,
+                    max_entries,
+                    requests_per_minute,
+                    start_position,
+                    browser,
+                ):
+                    yield record
+                return
+            except BrowserRequired as e:
+                logger.warning(f"HTTP engine failed ({e}), falling back to the browser")
+
+        if browser is None:
+            async with AsyncBrowserManager(
+                requests_per_minute,
+                self.proxy,
+                pool_size=1,
+                **self._manager_options(requests_per_minute),
+            ) as own_browser:
+                async for record in self._aiter_scrape_browser(
+                    query, location, max_entries, own_browser, start_position
+                ):
+                    yield record
+            return
+        async for record in self._aiter_scrape_browser(
+            query, location, max_entries, browser, start_position
+        ):
+            yield record
+
+    async def _aiter_scrape_http(
+        self,
+        query,
+        location,
+        max_entries,
+        requests_per_minute,
+        start_position=0,
+        browser=None,
+    ) -> AsyncIterator[Dict]:
+        """Run the blocking HTTP engine in a worker thread, one record at a time."""
+        records = self._iter_scrape_http(
+            query, location, max_entries, requests_per_minute, start_position, browser
         )
-        total_entries = len(entries)
-        logger.info(f"Found {total_entries} entries to process")
+        done = object()
+        try:
+            while True:
+                record = await asyncio.to_thread(next, records, done)
+                if record is done:
+                    return
+                yield record
+        finally:
+            records.close()
+
+    async def _aiter_scrape_browser(
+        self,
+        query,
+        location,
+        max_entries,
+        browser: AsyncBrowserManager,
+        start_position: int = 0,
+    ) -> AsyncIterator[Dict]:
+        base_url = GelbeseitenConfig.BASE_URL
+        url = f"{base_url}/{query}/{location}"
+        collected = 0
 
-        for idx, entry in enumerate(entries, 1):
-            try:
-                name = entry.query_selector(
-                    GelbeseitenConfig.SELECTORS["company_name"]
-                ).text_content()
+        async with browser.lease_page() as page:
+            logger.info(f"Loading initial page: {url}")
+            await page.goto(url)
+
+            await page.wait_for_selector(GelbeseitenConfig.SELECTORS["company_article"])
+            await page.wait_for_selector("#loadMoreGesamtzahl")
+
+            html = await page.content()
+            total_available = parse_total_count(html)
+            if total_available is None:
+                logger.error(f"Could not parse total entries count for {url}")
+                return
+            logger.info(f"Total available entries for {url}: {total_available}")
+            if max_entries is None or max_entries < 0:
+                max_entries = total_available
+
+            initial_results = self._extract_entries_from_html(page, html)[:max_entries]
+            for record in initial_results[start_position:]:
+                yield record
+            collected += len(initial_results[start_position:])
+
+            current_position = max(len(initial_results), start_position)
+            remaining_entries = max_entries - current_position
+
+            if GelbeseitenConfig.PARALLEL_PAGINATION and remaining_entries > 0:
+                async for record in self._aiter_offsets(
+                    browser,
+                    page,
+                    query,
+                    location,
+                    batch_offsets(current_position, max_entries),
+                    total_available,
+                ):
+                    collected += 1
+                    yield record
+                remaining_entries = 0
 
-                url_container = entry.query_selector(
-                    GelbeseitenConfig.SELECTORS["company_website"]
+            while remaining_entries > 0:
+                batch_size = min(
+                    GelbeseitenConfig.ENTRIES_PER_REQUEST, remaining_entries
                 )
+                form_data = build_form_data(
+                    query, location, current_position, batch_size
+                )
+                await browser.throttle(page)
+                response = await page.evaluate(_FETCH_AJAX_JS, [form_data, base_url])
+                if not response or "html" not in response:
+                    browser.report_throttle("invalid ajaxsuche response")
+                    logger.error("Invalid response format")
+                    break
 
-                if url_container:
-                    url_encoded = url_container.get_attribute("data-webseitelink")
-                    url_decoded = base64.b64decode(url_encoded).decode("utf-8")
-                else:
-                    url_decoded = ""
+                try:
+                    new_entries = self._extract_entries_from_html(
+                        page, response["html"]
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing HTML response: {e}")
+                    break
 
-                address_elem = entry.query_selector(
-                    GelbeseitenConfig.SELECTORS["company_address"]
-                )
-                if address_elem:
-                    address_lines = [
-                        line.strip()
-                        for line in address_elem.text_content().splitlines()
-                        if line.strip()
-                    ]
-                    address_parts = []
-                    if len(address_lines) > 0:
-                        address_parts.append(address_lines[0])
-                    if len(address_lines) > 1:
-                        postal_location = address_lines[1].split(",")[0].strip()
-                        address_parts.append(postal_location)
-                    address = ", ".join(address_parts)
-                    address = address.replace(",,", ",").replace(", ,", ",").strip()
-                else:
-                    address = ""
+                if len(new_entries) == 0:
+                    if current_position < total_available:
+                        browser.report_throttle("empty ajaxsuche response")
+                    logger.info("No more entries available")
+                    break
 
-                # Extract phone number
-                phone_elem = entry.query_selector(
-                    GelbeseitenConfig.SELECTORS["company_phone"]
-                )
-                phone = phone_elem.text_content().strip() if phone_elem else ""
-
-                company = {
-                    "metadata": {
-                        "search_query": page.url.split("/")[-2].capitalize(),
-                        "datetime": datetime.now().isoformat(),
-                    },
-                    "company_name": name.strip(),
-                    "company_website": url_decoded,
-                    "address": address,
-                    "phone": phone,
-                    "source": "gelbeseiten.de",
-                }
-                results.append(company)
+                browser.report_success()
+                for record in new_entries:
+                    yield record
+                collected += len(new_entries)
+                logger.info(f"Processed entries {collected}/{max_entries} for {url}")
+                current_position += len(new_entries)
+                remaining_entries -= len(new_entries)
+
+        logger.info(f"Finished scraping {url}. Total entries collected: {collected}")
+
+    def _window_requests(self, query, location, window, delays) -> List[Dict]:
+        return [
+            {
+                "formData": build_form_data(query, location, position, size),
+                "delay": delay,
+            }
+            for (position, size), delay in zip(window, delays)
+        ]
+
+    def _iter_offsets(
+        self, browser, page, query, location, offsets, total_available
+    ) -> Iterator[Dict]:
+        """Fetch all ajaxsuche offsets in concurrent windows and yield entries in order.
+
+        Each window of ``PAGINATION_CONCURRENCY`` requests is sent from the
+        page at once; the rate limiter hands out a start delay per request,
+        so the burst stays within the limit. Failed offsets are retried up
+        to ``PAGINATION_RETRIES`` times.
+        """
+        batches = OrderedBatches(offsets)
+        pending = list(offsets)
+        window_size = GelbeseitenConfig.PAGINATION_CONCURRENCY
+        for attempt in range(GelbeseitenConfig.PAGINATION_RETRIES + 1):
+            if not pending:
+                break
+            if attempt:
                 logger.info(
-                    f"Processed entry {idx}/{total_entries}: {company['company_name']}"
+                    f"Retrying {len(pending)} failed batches (attempt {attempt})"
+                )
+            failed = []
+            for start in range(0, len(pending), window_size):
+                window = pending[start : start + window_size]
+                requests = self._window_requests(
+                    query, location, window, browser.reserve(len(window))
+                )
+                responses = page.evaluate(
+                    _FETCH_AJAX_WINDOW_JS, [requests, GelbeseitenConfig.BASE_URL]
+                )
+                window_failed = collect_batches(
+                    window,
+                    responses,
+                    search_query_from_url(page.url),
+                    total_available,
+                    batches,
+                )
+                browser.report_success(len(window) - len(window_failed))
+                failed.extend(window_failed)
+                logger.info(f"Fetched {batches.received}/{len(offsets)} batches")
+                yield from batches.pop_ready()
+            if failed:
+                browser.report_throttle(f"{len(failed)} ajaxsuche batches failed")
+            pending = failed
+        yield from batches.pop_remaining()
+
+    async def _aiter_offsets(
+        self, browser, page, query, location, offsets, total_available
+    ) -> AsyncIterator[Dict]:
+        """Async variant of _iter_offsets()."""
+        batches = OrderedBatches(offsets)
+        pending = list(offsets)
+        window_size = GelbeseitenConfig.PAGINATION_CONCURRENCY
+        for attempt in range(GelbeseitenConfig.PAGINATION_RETRIES + 1):
+            if not pending:
+                break
+            failed = []
+            for start in range(0, len(pending), window_size):
+                window = pending[start : start + window_size]
+                requests = self._window_requests(
+                    query, location, window, browser.reserve(page, len(window))
+                )
+                responses = await page.evaluate(
+                    _FETCH_AJAX_WINDOW_JS, [requests, GelbeseitenConfig.BASE_URL]
                 )
-            except Exception as e:
-                logger.error(f"Error processing entry {idx}/{total_entries}: {e}")
+                window_failed = collect_batches(
+                    window,
+                    responses,
+                    search_query_from_url(page.url),
+                    total_available,
+                    batches,
+                )
+                browser.report_success(len(window) - len(window_failed))
+                failed.extend(window_failed)
+                for record in batches.pop_ready():
+                    yield record
+            if failed:
+                browser.report_throttle(f"{len(failed)} ajaxsuche batches failed")
+            pending = failed
+        for record in batches.pop_remaining():
+            yield record
 
-        return results
+    def _fetch_ajax_html(self, page, form_data, base_url):
+        """Send AJAX POST request and return the JSON response."""
+        return page.evaluate(_FETCH_AJAX_JS, [form_data, base_url])
+
+    def _extract_entries_from_html(self, page, html_string) -> List[Dict]:
+        """Extract company entries from AJAX-loaded HTML.
+
+        Parsed in-process, so a batch costs no extra round trips to the browser.
+        """
+        return parse_entries(html_string, search_query_from_url(page.url))
@@ -1,12 +1,15 @@
+import asyncio
 import sys
 import os
 import questionary
 from typing import Dict, Any
 from config.base_cli import ScraperCLI
+from config.grid_runner import read_terms
 from scrapers.googlemaps.config import GoogleMapsConfig
+from scrapers.googlemaps.places import PlaceIndex
 from scrapers.googlemaps.scraper import GoogleMapsScraper
-from utils.db import DatabaseManager
-from utils.store_data_json_helper import store_data_as_json
+from utils.checkpoint import Checkpoint
+from utils.sinks import create_sink, jsonl_path
 
 
 class GoogleMapsCLI(ScraperCLI):
@@ -52,6 +55,39 @@ class GoogleMapsCLI(ScraperCLI):
 
         return params
 
+    async def _stream(
+        self,
+        scraper,
+        query,
+        location,
+        max_entries,
+        requests_per_minute,
+        radius_meters,
+        sink,
+        checkpoint,
+    ):
+        """Store records as the async scraper's detail tabs deliver them."""
+        if radius_meters > 0:
+            records = scraper.aiter_scrape_tiled(
+                query,
+                location,
+                radius_meters,
+                max_entries,
+                requests_per_minute=requests_per_minute,
+                skip=checkpoint.seen,
+            )
+        else:
+            records = scraper.aiter_scrape(
+                query,
+                location,
+                max_entries,
+                requests_per_minute=requests_per_minute,
+                skip=checkpoint.seen,
+            )
+        async for record in records:
+            sink.write(record)
+            checkpoint.add(record, record["metadata"]["place_key"])
+
     def run_scraper(self, params: Dict[str, Any]) -> bool:
         """Run the Google Maps scraper with the provided parameters."""
         try:
@@ -59,28 +95,68 @@ class GoogleMapsCLI(ScraperCLI):
             print(f"Query: {params['query']}")
             print(f"Location: {params['location']}")
 
-            scraper = GoogleMapsScraper()
-
-            results = scraper.scrape(
-                query=params["query"],
-                location=params["location"],
-                max_entries=int(params["max_entries"]),
-                requests_per_minute=int(params.get("requests_per_minute")),
+            scraper = GoogleMapsScraper(
+                place_index=PlaceIndex.from_config(GoogleMapsConfig)
             )
 
-            print(f"\nScraping completed. Total entries scraped: {len(results)}")
-
             storage_type = params.get("storage_type", "both")
+            data_dir = os.path.join(os.path.dirname(__file__), "data")
+            queries = read_terms(params["query"])
+            locations = read_terms(params["location"])
+            if not queries or not locations:
+                print("❌ No search term or location given")
+                return False
+            if len(queries) > 1 or len(locations) > 1:
+                # Workers reopen the index file; this process only closes it
+                options = {}
+                if scraper.place_index is not None:
+                    options["place_index"] = scraper.place_index
+                stored = self.run_grid(
+                    "googlemaps", params, queries, locations, data_dir, options
+                )
+                if scraper.place_index is not None:
+                    scraper.place_index.close()
+                return stored
+            query, location = queries[0], locations[0]
+            checkpoint = Checkpoint.open(
+                "googlemaps",
+                query,
+                location,
+                jsonl_path(data_dir, "googlemaps"),
+                resume=params.get("resume", False),
+            )
+            if checkpoint.resumed:
+                print(f"Resuming after {checkpoint.count} entries")
+            sink = create_sink(
+                storage_type,
+                "googlemaps_companies",
+                data_dir,
+                "googlemaps",
+                checkpoint.output_path,
+            )
 
-            if storage_type in ("database", "both"):
-                db = DatabaseManager()
-                for result in results:
-                    db.store_data("googlemaps_companies", result)
-                print(f"✅ Stored {len(results)} entries in database")
-
-            if storage_type in ("json", "both"):
-                data_dir = os.path.join(os.path.dirname(__file__), "data")
-                store_data_as_json(results, data_dir, "googlemaps")
+            max_entries = int(params["max_entries"])
+            # Records are stored as they are scraped and the checkpoint follows
+            # them, so a crashed run can continue with --resume
+            with sink, checkpoint:
+                if not max_entries or checkpoint.count < max_entries:
+                    asyncio.run(
+                        self._stream(
+                            scraper,
+                            query,
+                            location,
+                            max_entries and max_entries - checkpoint.count,
+                            int(params.get("requests_per_minute")),
+                            int(params.get("radius_meters") or 0),
+                            sink,
+                            checkpoint,
+                        )
+                    )
+            count = checkpoint.count
+            if scraper.place_index is not None:
+                scraper.place_index.close()
+
+            print(f"\nScraping completed. Total entries scraped: {count}")
 
             return True
 
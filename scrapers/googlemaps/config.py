@@ -2,11 +2,57 @@ class GoogleMapsConfig:
     BASE_URL = "https://www.google.com/maps"
 
     PROXY = None
+    # Proxy pool for this scraper; falls back to ScraperConfig.PROXIES when empty
+    PROXIES = []
+
+    # Cookies (incl. consent) for this domain are cached between contexts and runs
+    STORAGE_DOMAIN = "google.com"
+
+    # Domain the (adaptive) rate limit is tracked under
+    TARGET_DOMAIN = "google.com"
+
+    # Reusable tabs reading business details concurrently (async scraper)
+    DETAIL_TABS = 4
+
+    # "network" builds records from the search responses the results feed is
+    # loaded from (see payload.py) and opens details pages only for businesses
+    # missing PAYLOAD_REQUIRED_FIELDS; "details" opens every details page.
+    # Field names are the payload's ("url" is the company website).
+    EXTRACTION_MODE = "network"
+    PAYLOAD_REQUIRED_FIELDS = ["name", "address", "phone", "url"]
+    SEARCH_RESPONSE_PATTERN = r"/search\?.*tbm=map"
+
+    # After a scroll, the feed is waited on until it shows more cards, its
+    # end-of-list marker appears or no search request has run for
+    # FEED_IDLE_MS; FEED_WAIT_TIMEOUT_MS caps the wait (see feed.py)
+    FEED_WAIT_TIMEOUT_MS = 10000
+    FEED_IDLE_MS = 1500
+    END_OF_LIST_TEXTS = [
+        "Sie haben das Ende der Liste erreicht.",
+        "You've reached the end of the list.",
+    ]
+    # How long the consent dialog may take to go away after accepting
+    CONSENT_TIMEOUT_MS = 10000
+
+    # Requests aborted by the browser (Playwright resource types / URL regexes).
+    # Map tiles, photos and logging pings are never read by the scraper.
+    BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+    BLOCKED_URL_PATTERNS = [
+        r"google\.com/maps/vt",
+        r"/gen_204",
+        r"/log\?format=json",
+        r"googletagmanager\.com",
+        r"doubleclick\.net",
+    ]
 
     INPUT_PARAMS = [
-        ("query", "Search term"),
-        ("location", "Location"),
+        ("query", "Search term(s), comma-separated or a file"),
+        ("location", "Location(s), comma-separated or a file"),
         ("max_entries", "Maximum entries"),
+        (
+            "radius_meters",
+            "Radius in meters to tile around the location (0 = single search)",
+        ),
         ("requests_per_minute", "Requests per minute"),
     ]
 
@@ -14,9 +60,26 @@ class GoogleMapsConfig:
         "query": "restaurant",
         "location": "berlin",
         "max_entries": 30,
+        "radius_meters": 0,
         "requests_per_minute": 30,
     }
 
+    # SQLite index of places scraped in earlier runs (see places.py), e.g.
+    # ".known_places.db". Known places are skipped before any page is opened.
+    PLACE_INDEX_DB = None
+
+    # Defaults of main.py
+    DEFAULT_QUERY = DEFAULT_VALUES["query"]
+    DEFAULT_LOCATION = DEFAULT_VALUES["location"]
+    REQUESTS_PER_MINUTE = DEFAULT_VALUES["requests_per_minute"]
+
+    # Tiled search (see tiling.py): the area within the radius around the
+    # location's center is split into TILE_STEP_METERS cells, each searched in
+    # its own viewport at TILE_ZOOM. A radius of 0 runs one text search.
+    DEFAULT_RADIUS_METERS = 0
+    TILE_STEP_METERS = 1500
+    TILE_ZOOM = 15
+
     OUTPUT_FIELDS = [
         "metadata",
         "company_name",
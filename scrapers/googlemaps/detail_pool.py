@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from .config import GoogleMapsConfig
+
+logger = logging.getLogger(__name__)
+
+
+class DetailTabPool:
+    """A fixed set of reusable tabs that read business details concurrently.
+
+    Each tab navigates from one place URL to the next instead of being
+    opened and closed per business. A failing business only costs its own
+    result; a crashed tab is replaced with a fresh one.
+    """
+
+    def __init__(self, browser, context: BrowserContext, size: int, details_js: str):
+        self.browser = browser
+        self.context = context
+        self.size = max(1, size)
+        self.details_js = details_js
+        # One permit per tab: held while a tab is in use or being opened
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._tabs: List[Page] = []
+
+    async def _acquire(self) -> Page:
+        await self._slots.acquire()
+        if not self._idle.empty():
+            return self._idle.get_nowait()
+        try:
+            tab = await self.context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._tabs.append(tab)
+        return tab
+
+    async def _release(self, tab: Page, broken: bool):
+        """Return ``tab`` to the pool, or drop it so its slot opens a fresh one."""
+        try:
+            if not broken:
+                self._idle.put_nowait(tab)
+                return
+            if tab in self._tabs:
+                self._tabs.remove(tab)
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        finally:
+            self._slots.release()
+
+    async def extract(self, href: str) -> Optional[Dict]:
+        """Open ``href`` in a free tab and read its details; None on failure."""
+        tab = await self._acquire()
+        broken = False
+        try:
+            await self.browser.throttle(tab)
+            await tab.goto(href, timeout=20000)
+            await tab.wait_for_selector(
+                GoogleMapsConfig.SELECTORS["main"], timeout=10000
+            )
+            return await tab.evaluate(self.details_js, GoogleMapsConfig.SELECTORS)
+        except Exception as e:
+            logger.warning(f"Failed to read details page {href}: {e}")
+            broken = tab.is_closed()
+            return None
+        finally:
+            await self._release(tab, broken)
+
+    async def close(self):
+        for tab in self._tabs:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        self._tabs.clear()
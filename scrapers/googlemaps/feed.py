@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+from .config import GoogleMapsConfig
+
+logger = logging.getLogger(__name__)
+
+# Resolves once the feed shows more cards than before or its end-of-list
+# marker; re-evaluated on DOM mutations instead of on a timer.
+_FEED_CHANGED_JS = """(args) => {
+    const count = document.querySelectorAll(args.card).length;
+    if (count > args.previous) {
+        return {count, end: false};
+    }
+    const feed = document.querySelector(args.feed);
+    const last = feed && feed.lastElementChild;
+    const text = last ? last.textContent || '' : '';
+    if (args.endTexts.some((marker) => text.includes(marker))) {
+        return {count, end: true};
+    }
+    return null;
+}"""
+
+_SEARCH_REQUEST_RE = re.compile(GoogleMapsConfig.SEARCH_RESPONSE_PATTERN)
+
+
+def _feed_args(previous: int) -> Dict:
+    return {
+        "card": GoogleMapsConfig.SELECTORS["card"],
+        "feed": GoogleMapsConfig.SELECTORS["results_feed"],
+        "endTexts": GoogleMapsConfig.END_OF_LIST_TEXTS,
+        "previous": previous,
+    }
+
+
+class WaitStats:
+    """Splits a scrape's wall time into waiting for the page and working."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.waits += 1
+        self.wait_seconds += seconds
+
+    def summary(self) -> Dict[str, float]:
+        total = time.perf_counter() - self.started
+        return {
+            "waits": self.waits,
+            "wait_s": self.wait_seconds,
+            "work_s": max(0.0, total - self.wait_seconds),
+            "total_s": total,
+        }
+
+    def log_summary(self, label: str):
+        summary = self.summary()
+        logger.info(
+            f"{label}: waited {summary['wait_s']:.1f}s for the page in "
+            f"{summary['waits']} waits, worked {summary['work_s']:.1f}s "
+            f"({summary['total_s']:.1f}s total)"
+        )
+
+
+class FeedRequests:
+    """Tracks the results feed's search requests in flight on a page.
+
+    The feed counts as idle once none has been in flight for a while; when
+    a scroll triggers no request at all, it is idle from the scroll on.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.last_activity = time.monotonic()
+        self._changed: Optional[asyncio.Event] = None
+
+    def attach(self, page):
+        page.on("request", self._started)
+        page.on("requestfinished", self._finished)
+        page.on("requestfailed", self._finished)
+
+    def detach(self, page):
+        page.remove_listener("request", self._started)
+        page.remove_listener("requestfinished", self._finished)
+        page.remove_listener("requestfailed", self._finished)
+
+    def touch(self):
+        self.last_activity = time.monotonic()
+        if self._changed is not None:
+            self._changed.set()
+
+    def _started(self, request):
+        if _SEARCH_REQUEST_RE.search(request.url):
+            self.in_flight += 1
+            self.touch()
+
+    def _finished(self, request):
+        if _SEARCH_REQUEST_RE.search(request.url):
+            self.in_flight = max(0, self.in_flight - 1)
+            self.touch()
+
+    def quiet_for(self) -> float:
+        """Seconds since the last feed request finished (0 while one is running)."""
+        if self.in_flight:
+            return 0.0
+        return time.monotonic() - self.last_activity
+
+    async def wait_idle(self, seconds: float):
+        """Return once no feed request has been running for ``seconds``."""
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        while True:
+            remaining = seconds - self.quiet_for()
+            if remaining <= 0:
+                return
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+
+def wait_for_feed(
+    page, previous: int, requests: FeedRequests, stats: WaitStats
+) -> Tuple[int, bool]:
+    """Wait after a scroll until the feed grew, ended or went idle.
+
+    Returns the card count and whether the feed has no more cards. Gives up
+    after FEED_WAIT_TIMEOUT_MS.
+    """
+    started = time.perf_counter()
+    timeout = GoogleMapsConfig.FEED_WAIT_TIMEOUT_MS / 1000
+    idle = GoogleMapsConfig.FEED_IDLE_MS / 1000
+    try:
+        while True:
+            remaining = timeout - (time.perf_counter() - started)
+            if remaining <= 0:
+                logger.info("Timed out waiting for new cards.")
+                return previous, True
+            # Event handlers of the sync API only run inside Playwright calls,
+            # so the idle check happens between idle-sized DOM waits
+            try:
+                handle = page.wait_for_function(
+                    _FEED_CHANGED_JS,
+                    arg=_feed_args(previous),
+                    polling="mutation",
+                    timeout=min(idle, remaining) * 1000,
+                )
+            except Exception:
+                if requests.quiet_for() >= idle:
+                    logger.info("Feed went idle without new cards.")
+                    return previous, True
+                continue
+            state = handle.json_value()
+            if state["end"]:
+                logger.info("Reached the end of the results list.")
+            return state["count"], state["end"]
+    finally:
+        stats.record(time.perf_counter() - started)
+
+
+async def wait_for_feed_async(
+    page, previous: int, requests: FeedRequests, stats: WaitStats
+) -> Tuple[int, bool]:
+    """Async wait_for_feed(): races the DOM condition against feed idleness."""
+    started = time.perf_counter()
+    changed = asyncio.ensure_future(
+        page.wait_for_function(
+            _FEED_CHANGED_JS,
+            arg=_feed_args(previous),
+            polling="mutation",
+            timeout=GoogleMapsConfig.FEED_WAIT_TIMEOUT_MS,
+        )
+    )
+    idle = asyncio.ensure_future(
+        requests.wait_idle(GoogleMapsConfig.FEED_IDLE_MS / 1000)
+    )
+    try:
+        await asyncio.wait(
+            (changed, idle),
+            timeout=GoogleMapsConfig.FEED_WAIT_TIMEOUT_MS / 1000,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if changed.done() and changed.exception() is None:
+            state = await changed.result().json_value()
+            if state["end"]:
+                logger.info("Reached the end of the results list.")
+            return state["count"], state["end"]
+        if idle.done():
+            logger.info("Feed went idle without new cards.")
+        else:
+            logger.info("Timed out waiting for new cards.")
+        return previous, True
+    finally:
+        for future in (changed, idle):
+            future.cancel()
+        await asyncio.gather(changed, idle, return_exceptions=True)
+        stats.record(time.perf_counter() - started)
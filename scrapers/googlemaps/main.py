@@ -7,6 +7,7 @@ It provides a CLI interface for data extraction.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
@@ -19,6 +20,9 @@ sys.path.append(
 
 from scrapers.googlemaps.scraper import GoogleMapsScraper
 from scrapers.googlemaps.config import GoogleMapsConfig
+from scrapers.googlemaps.places import PlaceIndex
+from utils.checkpoint import Checkpoint
+from utils.sinks import JsonlSink, jsonl_path, read_jsonl
 
 # Configure logging
 logging.basicConfig(
@@ -34,16 +38,40 @@ def cli_scrape(args):
             f"CLI Scrape: {args.query} in {args.location} (radius: {args.radius_meters}m)"
         )
 
-        scraper = GoogleMapsScraper(
-            requests_per_minute=args.requests_per_minute, proxy=args.proxy
+        place_index = PlaceIndex(args.place_index) if args.place_index else None
+        scraper = GoogleMapsScraper(proxy=args.proxy, place_index=place_index)
+
+        # Stream into this job's own JSONL file, tracked by a checkpoint so
+        # --resume can continue it; the results are read back from it below
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+        checkpoint = Checkpoint.open(
+            "googlemaps",
+            args.query,
+            args.location,
+            jsonl_path(data_dir, "googlemaps", args.query, args.location),
+            resume=args.resume,
         )
 
-        results = scraper.scrape(
-            query=args.query,
-            location=args.location,
-            radius_meters=args.radius_meters,
-            max_entries=args.max_entries,
-        )
+        async def stream(sink):
+            # A radius splits the area into tiles searched separately
+            records = scraper.aiter_scrape_tiled(
+                args.query,
+                args.location,
+                args.radius_meters,
+                args.max_entries and args.max_entries - checkpoint.count,
+                requests_per_minute=args.requests_per_minute,
+                skip=checkpoint.seen,
+            )
+            async for record in records:
+                sink.write(record)
+                checkpoint.add(record, record["metadata"]["place_key"])
+
+        with JsonlSink(checkpoint.output_path) as sink, checkpoint:
+            if not args.max_entries or checkpoint.count < args.max_entries:
+                asyncio.run(stream(sink))
+        results = read_jsonl(checkpoint.output_path)
+        if place_index is not None:
+            place_index.close()
 
         # Save results
         if args.output:
@@ -64,7 +92,7 @@ def cli_scrape(args):
             print("\n📋 Results:")
             for i, business in enumerate(results, 1):
                 print(
-                    f"{i}. {business.get('name', 'N/A')} - {business.get('address', 'N/A')}"
+                    f"{i}. {business.get('company_name', 'N/A')} - {business.get('address', 'N/A')}"
                 )
 
         return results
@@ -114,7 +142,10 @@ Examples:
         "-rad",
         type=int,
         default=GoogleMapsConfig.DEFAULT_RADIUS_METERS,
-        help=f"Search radius in meters (default: {GoogleMapsConfig.DEFAULT_RADIUS_METERS})",
+        help=(
+            "Tile the area within this radius around the location, 0 for a "
+            f"single search (default: {GoogleMapsConfig.DEFAULT_RADIUS_METERS})"
+        ),
     )
     parser.add_argument(
         "--requests-per-minute",
@@ -126,6 +157,17 @@ Examples:
     parser.add_argument(
         "--proxy", "-p", type=str, default=None, help="Proxy server URL (optional)"
     )
+    parser.add_argument(
+        "--place-index",
+        type=str,
+        default=GoogleMapsConfig.PLACE_INDEX_DB,
+        help="SQLite file of places scraped before; known places are skipped",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run of the same query and location",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -0,0 +1,127 @@
+"""Parse business records out of the JSON payloads Google Maps loads its results from.
+
+The results feed is filled from ``/search?tbm=map`` responses (and, for the
+first page, from ``APP_INITIALIZATION_STATE`` in the HTML). Both are deeply
+nested arrays behind an XSSI prefix. Places are found by shape rather than
+by a fixed path, so a moved wrapper array does not break parsing; the field
+offsets inside a place entry are the ones Maps has used for years.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+XSSI_PREFIX = ")]}'"
+
+_APP_STATE_RE = re.compile(
+    r"window\.APP_INITIALIZATION_STATE\s*=\s*(\[.*?\]);\s*window\.", re.DOTALL
+)
+_FEATURE_ID_RE = re.compile(r"^0x[0-9a-f]+:0x[0-9a-f]+$")
+_HREF_FEATURE_ID_RE = re.compile(r"!1s(0x[0-9a-f]+:0x[0-9a-f]+)")
+_HREF_PLACE_ID_RE = re.compile(r"!19s([A-Za-z0-9_-]+)")
+
+
+def _get(data: Any, *path: int) -> Any:
+    """``data[path[0]][path[1]]...`` or None when any step is missing."""
+    for index in path:
+        if not isinstance(data, list) or index >= len(data):
+            return None
+        data = data[index]
+    return data
+
+
+def _str(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def load_payload(text: str) -> Any:
+    """Decode a response body, stripping the XSSI prefix and ``{"d": ...}`` wrapper."""
+    text = text.strip()
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX) :]
+    data = json.loads(text)
+    if isinstance(data, dict) and isinstance(data.get("d"), str):
+        return load_payload(data["d"])
+    return data
+
+
+def ids_from_href(href: str) -> Tuple[Optional[str], Optional[str]]:
+    """(feature id, place id) embedded in a ``/maps/place/`` card href."""
+    feature_id = _HREF_FEATURE_ID_RE.search(href)
+    place_id = _HREF_PLACE_ID_RE.search(href)
+    return (
+        feature_id.group(1) if feature_id else None,
+        place_id.group(1) if place_id else None,
+    )
+
+
+def _is_place(node: List) -> bool:
+    return (
+        len(node) > 11
+        and isinstance(node[11], str)
+        and isinstance(_get(node, 10), str)
+        and bool(_FEATURE_ID_RE.match(node[10]))
+    )
+
+
+def parse_place(node: List) -> Dict:
+    """Fields of one place entry, in the shape _DETAILS_JS returns plus ids."""
+    address = _str(_get(node, 39)) or ", ".join(
+        part for part in (_get(node, 2) or []) if isinstance(part, str)
+    )
+    return {
+        "name": _str(node[11]),
+        "address": address,
+        "phone": _str(_get(node, 178, 0, 0)),
+        "url": _str(_get(node, 7, 0)),
+        "feature_id": node[10],
+        "place_id": _str(_get(node, 78)),
+        "latitude": _get(node, 9, 2),
+        "longitude": _get(node, 9, 3),
+        "category": _str(_get(node, 13, 0)),
+    }
+
+
+def iter_places(data: Any) -> Iterator[Dict]:
+    """Walk a decoded payload and yield every place entry in it.
+
+    Strings that are themselves XSSI-prefixed payloads are decoded and
+    walked as well.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            if _is_place(node):
+                yield parse_place(node)
+                continue
+            stack.extend(reversed(node))
+        elif isinstance(node, str) and node.startswith(XSSI_PREFIX):
+            try:
+                stack.append(load_payload(node))
+            except ValueError:
+                continue
+
+
+def places_from_response(text: str) -> List[Dict]:
+    """Places in a search response body; [] if it is not a payload."""
+    try:
+        return list(iter_places(load_payload(text)))
+    except ValueError as e:
+        logger.debug(f"Not a search payload: {e}")
+        return []
+
+
+def places_from_html(html: str) -> List[Dict]:
+    """Places embedded in the search page's ``APP_INITIALIZATION_STATE``."""
+    match = _APP_STATE_RE.search(html)
+    if not match:
+        return []
+    try:
+        return list(iter_places(json.loads(match.group(1))))
+    except ValueError as e:
+        logger.debug(f"Could not decode APP_INITIALIZATION_STATE: {e}")
+        return []
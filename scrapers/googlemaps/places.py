@@ -0,0 +1,83 @@
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from .payload import ids_from_href
+
+logger = logging.getLogger(__name__)
+
+_HREF_COORDINATES_RE = re.compile(r"!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)")
+
+
+def place_key(href: str) -> str:
+    """Stable identity of the place a card links to, read from its href alone.
+
+    The feature id (``0x...:0x...``) is what search payloads use as well;
+    cards without one fall back to the place id, then the embedded
+    coordinates, then the URL path. Unlike the display name, this tells
+    branches of a chain apart.
+    """
+    feature_id, place_id = ids_from_href(href)
+    if feature_id:
+        return feature_id
+    if place_id:
+        return place_id
+    coordinates = _HREF_COORDINATES_RE.search(href)
+    if coordinates:
+        return f"{float(coordinates.group(1)):.6f},{float(coordinates.group(2)):.6f}"
+    return href.split("?", 1)[0]
+
+
+class PlaceIndex:
+    """Persistent set of place keys scraped in earlier runs (SQLite).
+
+    Scrapers check cards against it before opening anything, so re-scraping
+    a city only visits places that were not known yet.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS places ("
+            "place_key TEXT PRIMARY KEY, name TEXT, first_seen TEXT)"
+        )
+        self._conn.commit()
+        self.skipped = 0
+
+    def __contains__(self, key: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM places WHERE place_key = ?", (key,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+
+    def add(self, key: str, name: str = ""):
+        self._conn.execute(
+            "INSERT OR IGNORE INTO places (place_key, name, first_seen) VALUES (?, ?, ?)",
+            (key, name, datetime.now().isoformat()),
+        )
+        self._conn.commit()
+
+    def close(self):
+        if self.skipped:
+            logger.info(f"Skipped {self.skipped} places already in {self.path}")
+        self._conn.close()
+
+    def __reduce__(self):
+        # Worker processes reopen the file; WAL lets them share it
+        return type(self), (self.path,)
+
+    @classmethod
+    def from_config(cls, config) -> Optional["PlaceIndex"]:
+        path = getattr(config, "PLACE_INDEX_DB", None)
+        return cls(path) if path else None
@@ -1,16 +1,169 @@
+from collections import Counter
 from datetime import datetime
-from typing import Optional
-from config.browser import BrowserManager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from config.async_browser import AsyncBrowserManager
+from config.browser import BrowserManager, browser_session
+from config.config import ScraperConfig
+from config.proxy_pool import ProxyPool
+from config.resource_blocker import ResourceBlocker
+from config.shared_rate_limiter import create_rate_limiter
 from .config import GoogleMapsConfig
+from .detail_pool import DetailTabPool
+from .feed import FeedRequests, WaitStats, wait_for_feed, wait_for_feed_async
+from .payload import ids_from_href, places_from_html, places_from_response
+from .places import PlaceIndex, place_key
+from .tiling import Tile, parse_viewport, tile_grid
+import asyncio
 import logging
+import re
 import time
 
 logger = logging.getLogger(__name__)
 
+# Reads name, address, phone and website from a details panel in one round trip.
+_DETAILS_JS = """(selectors) => {
+    const main = document.querySelector(selectors.main);
+    if (!main) {
+        return null;
+    }
+    let address = '';
+    const addressBtn = main.querySelector(selectors.address_btn);
+    if (addressBtn) {
+        address = addressBtn.getAttribute('aria-label') || '';
+        if (address.startsWith('Adresse: ')) {
+            address = address.slice('Adresse: '.length);
+        }
+        address = address.trim();
+    }
+    let phone = '';
+    const phoneBtn = main.querySelector(selectors.phone_btn);
+    if (phoneBtn) {
+        const dataItemId = phoneBtn.getAttribute('data-item-id');
+        if (dataItemId && dataItemId.startsWith('phone:tel:')) {
+            phone = dataItemId.replace('phone:tel:', '');
+        }
+    }
+    const urlElem = main.querySelector(selectors.website_link);
+    return {
+        name: main.getAttribute('aria-label') || '',
+        address,
+        phone,
+        url: urlElem ? urlElem.getAttribute('href') || '' : '',
+    };
+}"""
+
+_SCROLL_FEED_JS = "(el) => { el.scrollBy(0, el.scrollHeight) }"
+
+_CARD_HREFS_JS = "(cards) => cards.map((card) => card.getAttribute('href'))"
+
+_SEARCH_RESPONSE_RE = re.compile(GoogleMapsConfig.SEARCH_RESPONSE_PATTERN)
+
+_VIEWPORT_URL_RE = re.compile(r"/@-?\d")
+
+
+def _build_search_url(query: str, location: str, tile: Optional[Tile] = None) -> str:
+    if tile:
+        # The viewport is the search area, so the location is left out
+        return f"{GoogleMapsConfig.BASE_URL}/search/{query}/{tile.viewport}".replace(
+            " ", "+"
+        )
+    return f"{GoogleMapsConfig.BASE_URL}/search/{query} {location}/".replace(" ", "+")
+
+
+def _place_url(href: str) -> str:
+    """A card's place URL without the per-session query string."""
+    return href.split("?", 1)[0]
+
+
+def _missing_fields(place: Dict) -> List[str]:
+    return [
+        field
+        for field in GoogleMapsConfig.PAYLOAD_REQUIRED_FIELDS
+        if not place.get(field)
+    ]
+
+
+def _has_required_fields(place: Dict) -> bool:
+    return not _missing_fields(place)
+
+
+def _merge_details(place: Optional[Dict], details: Optional[Dict]) -> Optional[Dict]:
+    """Fill the gaps of a payload place with what its details page showed."""
+    if not place:
+        return details
+    if not details:
+        return place
+    return {**place, **{key: value for key, value in details.items() if value}}
+
+
+def _build_result(query: str, details: Dict, href: str = "") -> Dict:
+    """Turn the fields read by _DETAILS_JS (or a search payload) into an output record."""
+    return {
+        "metadata": {
+            "search_query": query,
+            "datetime": datetime.now().isoformat(),
+            "place_url": _place_url(href),
+            "place_id": details.get("place_id") or ids_from_href(href)[1] or "",
+            "place_key": place_key(href) if href else "",
+        },
+        "company_name": details["name"],
+        "company_website": details["url"] or "",
+        "address": details["address"] or "",
+        "phone": details["phone"] or "",
+        "source": "google.com/maps",
+    }
+
 
 class GoogleMapsScraper:
-    def __init__(self, proxy: Optional[str] = None):
+    def __init__(
+        self, proxy: Optional[str] = None, place_index: Optional[PlaceIndex] = None
+    ):
         self.proxy = proxy
+        # Places scraped in earlier runs; their cards are never opened again
+        self.place_index = place_index
+
+    def _is_known(self, key: str) -> bool:
+        if self.place_index is not None and key in self.place_index:
+            self.place_index.skipped += 1
+            return True
+        return False
+
+    def _remember(self, key: str, name: str):
+        if self.place_index is not None:
+            self.place_index.add(key, name)
+
+    def _manager_options(self, requests_per_minute) -> Dict:
+        """Keyword arguments for the browser managers this scraper starts.
+
+        With a proxy pool, ``requests_per_minute`` is each proxy's rate and
+        the domain limiter gets the pool's budget.
+        """
+        proxy_pool = ProxyPool.from_config(GoogleMapsConfig, requests_per_minute)
+        return {
+            "resource_blocker": ResourceBlocker.from_config(GoogleMapsConfig),
+            "proxy_pool": proxy_pool,
+            "rate_limiter": create_rate_limiter(
+                GoogleMapsConfig,
+                (
+                    proxy_pool.domain_requests_per_minute
+                    if proxy_pool
+                    else requests_per_minute
+                ),
+            ),
+            "target_domain": GoogleMapsConfig.TARGET_DOMAIN,
+            "storage_domain": GoogleMapsConfig.STORAGE_DOMAIN,
+        }
+
+    def create_browser(self, requests_per_minute=30) -> BrowserManager:
+        """A BrowserManager set up like the ones this scraper starts itself.
+
+        For callers that own the browser across jobs (e.g. worker processes).
+        """
+        return BrowserManager(
+            requests_per_minute,
+            self.proxy,
+            **self._manager_options(requests_per_minute),
+        )
 
     def scrape(
         self,
@@ -18,208 +171,620 @@ class GoogleMapsScraper:
         location,
         max_entries=None,
         requests_per_minute=30,
-    ):
-        results = []
-        search_url = f"{GoogleMapsConfig.BASE_URL}/search/{query} {location}/".replace(
-            " ", "+"
+        browser: Optional[BrowserManager] = None,
+    ) -> List[Dict]:
+        """Scrape business listings from Google Maps.
+
+        Pass ``browser`` to reuse a BrowserManager owned by the caller;
+        otherwise one is launched and closed for this call.
+        """
+        return list(
+            self.iter_scrape(query, location, max_entries, requests_per_minute, browser)
         )
+
+    def iter_scrape(
+        self,
+        query,
+        location,
+        max_entries=None,
+        requests_per_minute=30,
+        browser: Optional[BrowserManager] = None,
+        skip: Optional[Set[str]] = None,
+    ) -> Iterator[Dict]:
+        """Like scrape(), but yields each business as soon as its details page is read.
+
+        Cards whose place key (see places.place_key) is in ``skip`` (e.g. from
+        a checkpoint) are
+        passed over without opening their details page. The set is read as
+        the scroll goes, so callers may add to it while iterating.
+        """
+        skip = skip if skip is not None else set()
+        collected = 0
+        search_url = _build_search_url(query, location)
+        wait_stats = WaitStats()
+        feed_requests = FeedRequests()
         logger.info(f"Navigating to: {search_url}")
 
-        with BrowserManager(requests_per_minute, self.proxy) as browser:
+        with browser_session(
+            browser,
+            requests_per_minute,
+            self.proxy,
+            manager_options=lambda: self._manager_options(requests_per_minute),
+        ) as browser:
             page = browser.get_page()
-            logger.info("Opening search URL...")
-            page.goto(search_url, timeout=60000)
-            # Handle consent popup if present
+            feed_requests.attach(page)
             try:
-                logger.info("Checking for consent popup...")
-                consent_btn = page.query_selector(
-                    GoogleMapsConfig.SELECTORS["accept_cookies"]
-                )
-                if consent_btn:
-                    logger.info("Consent popup found. Clicking accept.")
-                    consent_btn.click()
-                    time.sleep(2)
-                else:
-                    logger.info("No consent popup found.")
-            except Exception as e:
-                logger.warning(f"Error handling consent popup: {e}")
-
-            logger.info("Waiting for main results container to load...")
-            page.wait_for_selector(GoogleMapsConfig.SELECTORS["main"], timeout=15000)
+                logger.info("Opening search URL...")
+                page.goto(search_url, timeout=60000)
+                # Handle consent popup if present
+                try:
+                    logger.info("Checking for consent popup...")
+                    consent_btn = page.query_selector(
+                        GoogleMapsConfig.SELECTORS["accept_cookies"]
+                    )
+                    if consent_btn:
+                        logger.info("Consent popup found. Clicking accept.")
+                        consent_btn.click()
+                        started = time.perf_counter()
+                        page.wait_for_selector(
+                            GoogleMapsConfig.SELECTORS["accept_cookies"],
+                            state="hidden",
+                            timeout=GoogleMapsConfig.CONSENT_TIMEOUT_MS,
+                        )
+                        wait_stats.record(time.perf_counter() - started)
+                        # Persist the consent cookies so later contexts and runs skip this
+                        browser.save_storage_state(GoogleMapsConfig.STORAGE_DOMAIN)
+                    else:
+                        logger.info("No consent popup found.")
+                except Exception as e:
+                    logger.warning(f"Error handling consent popup: {e}")
 
-            entries_seen = set()
-            scroll_round = 0
-            while True:
-                cards = page.query_selector_all(GoogleMapsConfig.SELECTORS["card"])
-                logger.info(
-                    f"Scroll round {scroll_round}: Found {len(cards)} business cards on the page."
+                logger.info("Waiting for main results container to load...")
+                page.wait_for_selector(
+                    GoogleMapsConfig.SELECTORS["main"], timeout=15000
                 )
-                # Take a screenshot for debugging at each scroll round
-                # try:
-                #     page.screenshot(path=f"debug_gmaps_scroll_{scroll_round}.png")
-                #     logger.info(
-                #         f"Screenshot saved: debug_gmaps_scroll_{scroll_round}.png"
-                #     )
-                # except Exception as e:
-                #     logger.warning(f"Could not take screenshot: {e}")
-                if not cards:
-                    logger.warning(
-                        "No business cards found. The page structure may have changed or results are empty."
+
+                attempted = set()
+                scroll_round = 0
+                while True:
+                    cards = page.query_selector_all(GoogleMapsConfig.SELECTORS["card"])
+                    logger.info(
+                        f"Scroll round {scroll_round}: Found {len(cards)} business cards on the page."
                     )
-                for card in cards:
-                    href = card.get_attribute("href")
-                    if not href or not href.startswith(
-                        "https://www.google.com/maps/place/"
-                    ):
-                        logger.debug("Skipping card with invalid or missing href.")
-                        continue
-                    # Open the business details in a new tab
-                    details_page = page.context.new_page()
-                    try:
-                        logger.info(
-                            f"Opening details page for: {card.get_attribute('aria-label')}"
-                        )
-                        details_page.goto(href, timeout=20000)
-                        details_page.wait_for_selector(
-                            GoogleMapsConfig.SELECTORS["main"], timeout=10000
-                        )
-                        details_main = details_page.query_selector(
-                            GoogleMapsConfig.SELECTORS["main"]
+                    # Details tabs make the renderer grow; track it for the job's peak
+                    browser.memory_watchdog.sample()
+                    # Take a screenshot for debugging at each scroll round
+                    # try:
+                    #     page.screenshot(path=f"debug_gmaps_scroll_{scroll_round}.png")
+                    #     logger.info(
+                    #         f"Screenshot saved: debug_gmaps_scroll_{scroll_round}.png"
+                    #     )
+                    # except Exception as e:
+                    #     logger.warning(f"Could not take screenshot: {e}")
+                    if not cards:
+                        logger.warning(
+                            "No business cards found. The page structure may have changed or results are empty."
                         )
-                    except Exception as e:
-                        logger.warning(f"Failed to open details page for {href}: {e}")
-                        details_page.close()
-                        continue
+                    for card in cards:
+                        href = card.get_attribute("href")
+                        if not href or not href.startswith(
+                            "https://www.google.com/maps/place/"
+                        ):
+                            logger.debug("Skipping card with invalid or missing href.")
+                            continue
+                        # Decide from the href alone, before paying for a navigation
+                        key = place_key(href)
+                        if key in skip or key in attempted:
+                            continue
+                        attempted.add(key)
+                        if self._is_known(key):
+                            continue
+                        # Open the business details in a new tab
+                        details_page = page.context.new_page()
+                        try:
+                            logger.info(
+                                f"Opening details page for: {card.get_attribute('aria-label')}"
+                            )
+                            details_page.goto(href, timeout=20000)
+                            details_page.wait_for_selector(
+                                GoogleMapsConfig.SELECTORS["main"], timeout=10000
+                            )
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to open details page for {href}: {e}"
+                            )
+                            details_page.close()
+                            continue
+
+                        details = self._extract_details(details_page)
+                        name = details["name"] if details else ""
+                        if not name:
+                            logger.debug(f"Skipping card without a name: {href}")
+                            details_page.close()
+                            continue
 
-                    # Name from the new details panel
-                    name = ""
-                    try:
-                        name = details_main.get_attribute("aria-label") or ""
-                    except Exception as e:
-                        logger.warning(f"Could not extract name: {e}")
-                        name = ""
-                    if not name or name in entries_seen:
-                        logger.debug(f"Skipping duplicate or empty name: {name}")
+                        result = _build_result(query, details, href)
+                        logger.info(f"Scraped: {name} ({result['address']})")
+                        self._remember(key, name)
                         details_page.close()
-                        continue
+                        collected += 1
+                        yield result
+                        if max_entries and collected >= max_entries:
+                            logger.info("Reached max_entries limit.")
+                            break
 
-                    # Address
-                    address = ""
-                    try:
-                        address_btn = details_main.query_selector(
-                            GoogleMapsConfig.SELECTORS["address_btn"]
-                        )
-                        if address_btn:
-                            address = address_btn.get_attribute("aria-label") or ""
-                            if address.startswith("Adresse: "):
-                                address = address[len("Adresse: ") :]
-                            address = address.strip()
-                    except Exception as e:
-                        logger.warning(f"Could not extract address for {name}: {e}")
-                        address = ""
-
-                    # Phone
-                    phone = ""
-                    try:
-                        phone_btn = details_main.query_selector(
-                            GoogleMapsConfig.SELECTORS["phone_btn"]
-                        )
-                        if phone_btn:
-                            data_item_id = phone_btn.get_attribute("data-item-id")
-                            if data_item_id and data_item_id.startswith("phone:tel:"):
-                                phone = data_item_id.replace("phone:tel:", "")
-                    except Exception as e:
-                        logger.warning(f"Could not extract phone for {name}: {e}")
-                        phone = ""
-
-                    # Website
-                    url = ""
-                    try:
-                        url_elem = details_main.query_selector(
-                            GoogleMapsConfig.SELECTORS["website_link"]
+                    if max_entries and collected >= max_entries:
+                        logger.info("Reached max_entries limit after scrolling.")
+                        break
+
+                    # Scroll the results container (div[role="feed"]) to load more entries,
+                    # but only if we haven't reached max_entries yet
+                    if not max_entries or collected < max_entries:
+                        prev_count = len(cards)
+                        try:
+                            main_div = page.query_selector(
+                                GoogleMapsConfig.SELECTORS["results_feed"]
+                            )
+                            if main_div:
+                                logger.info(
+                                    "Scrolling results feed to load more entries..."
+                                )
+                                feed_requests.touch()
+                                page.evaluate(_SCROLL_FEED_JS, main_div)
+                            else:
+                                logger.warning("Could not find results feed to scroll.")
+                        except Exception as e:
+                            logger.warning(f"Error while scrolling results feed: {e}")
+
+                        new_count, end_of_feed = wait_for_feed(
+                            page, prev_count, feed_requests, wait_stats
                         )
-                        if url_elem:
-                            url = url_elem.get_attribute("href") or ""
-                    except Exception as e:
-                        logger.warning(f"Could not extract website for {name}: {e}")
-                        url = ""
-
-                    result = {
-                        "metadata": {
-                            "search_query": query,
-                            "datetime": datetime.now().isoformat(),
-                        },
-                        "company_name": name,
-                        "company_website": url or "",
-                        "address": address or "",
-                        "phone": phone or "",
-                        "source": "google.com/maps",
-                    }
-                    results.append(result)
-                    logger.info(f"Scraped: {name} ({address})")
-                    entries_seen.add(name)
-                    details_page.close()
-                    if max_entries and len(results) >= max_entries:
-                        logger.info("Reached max_entries limit.")
+                        logger.info(f"After scrolling: {new_count} cards found.")
+                        if end_of_feed and new_count == prev_count:
+                            logger.info("No more cards to load. Stopping.")
+                            break
+                    else:
+                        logger.info("Max entries reached, stopping scroll.")
                         break
 
-                if max_entries and len(results) >= max_entries:
-                    logger.info("Reached max_entries limit after scrolling.")
+                    scroll_round += 1
+            finally:
+                feed_requests.detach(page)
+
+        wait_stats.log_summary(f"Google Maps '{query}' in '{location}'")
+        logger.info(f"Scraping finished. Total results: {collected}")
+
+    def _extract_details(self, details_page) -> Optional[Dict]:
+        """Read the business fields from an opened details page."""
+        try:
+            return details_page.evaluate(_DETAILS_JS, GoogleMapsConfig.SELECTORS)
+        except Exception as e:
+            logger.warning(f"Could not extract details: {e}")
+            return None
+
+    def scrape_many(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_entries=None,
+        requests_per_minute=30,
+        concurrency: int = ScraperConfig.PAGE_POOL_SIZE,
+    ) -> List[Dict]:
+        """Scrape several (query, location) pairs concurrently in one browser.
+
+        Each job runs on its own page leased from an AsyncBrowserManager
+        pool. Results are returned in job order.
+        """
+        return asyncio.run(
+            self._scrape_many(jobs, max_entries, requests_per_minute, concurrency)
+        )
+
+    async def _scrape_many(self, jobs, max_entries, requests_per_minute, concurrency):
+        async with AsyncBrowserManager(
+            requests_per_minute,
+            self.proxy,
+            pool_size=concurrency,
+            **self._manager_options(requests_per_minute),
+        ) as browser:
+            job_results = await asyncio.gather(
+                *[
+                    self.scrape_async(query, location, max_entries, browser=browser)
+                    for query, location in jobs
+                ],
+                return_exceptions=True,
+            )
+
+        results = []
+        for (query, location), job_result in zip(jobs, job_results):
+            if isinstance(job_result, Exception):
+                logger.error(f"Scraping {query} in {location} failed: {job_result}")
+                continue
+            results.extend(job_result)
+        return results
+
+    async def _accept_consent_async(
+        self,
+        browser: AsyncBrowserManager,
+        page,
+        wait_stats: Optional[WaitStats] = None,
+    ):
+        try:
+            consent_btn = await page.query_selector(
+                GoogleMapsConfig.SELECTORS["accept_cookies"]
+            )
+            if consent_btn:
+                await consent_btn.click()
+                started = time.perf_counter()
+                await page.wait_for_selector(
+                    GoogleMapsConfig.SELECTORS["accept_cookies"],
+                    state="hidden",
+                    timeout=GoogleMapsConfig.CONSENT_TIMEOUT_MS,
+                )
+                if wait_stats is not None:
+                    wait_stats.record(time.perf_counter() - started)
+                await browser.save_storage_state(
+                    page.context, GoogleMapsConfig.STORAGE_DOMAIN
+                )
+        except Exception as e:
+            logger.warning(f"Error handling consent popup: {e}")
+
+    async def locate(
+        self, location: str, browser: AsyncBrowserManager
+    ) -> Optional[Tile]:
+        """The viewport Google Maps centers on for ``location``."""
+        async with browser.lease_page() as page:
+            await page.goto(
+                f"{GoogleMapsConfig.BASE_URL}/search/{location}".replace(" ", "+"),
+                timeout=60000,
+            )
+            await self._accept_consent_async(browser, page)
+            try:
+                # Maps rewrites the URL to the viewport once the map has moved
+                await page.wait_for_url(_VIEWPORT_URL_RE, timeout=15000)
+            except Exception as e:
+                logger.warning(f"No viewport in the URL for {location}: {e}")
+            return parse_viewport(page.url)
+
+    def scrape_tiled(
+        self,
+        query,
+        location,
+        radius_meters=GoogleMapsConfig.DEFAULT_RADIUS_METERS,
+        max_entries=None,
+        requests_per_minute=30,
+        concurrency: int = ScraperConfig.PAGE_POOL_SIZE,
+    ) -> List[Dict]:
+        """Search every tile within ``radius_meters`` of the location and merge the results."""
+
+        async def collect():
+            return [
+                result
+                async for result in self.aiter_scrape_tiled(
+                    query,
+                    location,
+                    radius_meters,
+                    max_entries,
+                    requests_per_minute=requests_per_minute,
+                    concurrency=concurrency,
+                )
+            ]
+
+        return asyncio.run(collect())
+
+    async def aiter_scrape_tiled(
+        self,
+        query,
+        location,
+        radius_meters=GoogleMapsConfig.DEFAULT_RADIUS_METERS,
+        max_entries=None,
+        browser: Optional[AsyncBrowserManager] = None,
+        requests_per_minute=30,
+        concurrency: int = ScraperConfig.PAGE_POOL_SIZE,
+        skip: Optional[Set[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        """Split the area around ``location`` into tiles and search them in parallel.
+
+        A single search stops at the feed's maximum; tiles of
+        ``TILE_STEP_METERS`` each get their own. Businesses found in several
+        tiles are yielded once, and their place keys go into ``skip`` so
+        other tiles pass over their cards without opening them.
+        """
+        skip = skip if skip is not None else set()
+        if browser is None:
+            async with AsyncBrowserManager(
+                requests_per_minute,
+                self.proxy,
+                pool_size=concurrency,
+                **self._manager_options(requests_per_minute),
+            ) as own_browser:
+                async for result in self.aiter_scrape_tiled(
+                    query,
+                    location,
+                    radius_meters,
+                    max_entries,
+                    browser=own_browser,
+                    concurrency=concurrency,
+                    skip=skip,
+                ):
+                    yield result
+            return
+
+        center = await self.locate(location, browser) if radius_meters > 0 else None
+        if center is None:
+            if radius_meters > 0:
+                logger.warning(f"Could not locate {location}, running a single search")
+            async for result in self.aiter_scrape(
+                query, location, max_entries, browser=browser, skip=skip
+            ):
+                yield result
+            return
+
+        tiles = tile_grid(center.latitude, center.longitude, radius_meters)
+        logger.info(
+            f"Searching '{query}' in {len(tiles)} tiles within {radius_meters} m "
+            f"of {location} ({center.viewport})"
+        )
+        results: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(concurrency)
+        done = object()
+
+        async def search_tile(tile: Tile):
+            try:
+                async with semaphore:
+                    async for result in self.aiter_scrape(
+                        query, location, browser=browser, skip=skip, tile=tile
+                    ):
+                        await results.put(result)
+            except Exception as e:
+                logger.error(f"Tile {tile.viewport} failed: {e}")
+            finally:
+                await results.put(done)
+
+        tasks = [asyncio.create_task(search_tile(tile)) for tile in tiles]
+        seen = set()
+        collected = 0
+        remaining = len(tasks)
+        try:
+            while remaining:
+                result = await results.get()
+                if result is done:
+                    remaining -= 1
+                    continue
+                metadata = result["metadata"]
+                key = metadata["place_key"]
+                if key in seen:
+                    continue
+                seen.add(key)
+                skip.add(key)
+                collected += 1
+                yield result
+                if max_entries and collected >= max_entries:
                     break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Tiled search finished: {collected} unique businesses")
 
-                # Scroll the results container (div[role="feed"]) to load more entries,
-                # but only if we haven't reached max_entries yet
-                if not max_entries or len(results) < max_entries:
-                    prev_count = len(cards)
-                    try:
-                        main_div = page.query_selector(
-                            GoogleMapsConfig.SELECTORS["results_feed"]
-                        )
-                        if main_div:
-                            logger.info(
-                                "Scrolling results feed to load more entries..."
-                            )
-                            page.evaluate(
-                                "(el) => { el.scrollBy(0, el.scrollHeight) }", main_div
-                            )
-                        else:
-                            logger.warning("Could not find results feed to scroll.")
-                    except Exception as e:
-                        logger.warning(f"Error while scrolling results feed: {e}")
-
-                    max_scroll_attempts = 3
-                    for attempt in range(max_scroll_attempts):
-                        logger.info(
-                            f"Scroll attempt {attempt + 1}/{max_scroll_attempts} waiting for new cards..."
-                        )
-                        time.sleep(2)  # Warte auf Nachladen
-                        new_cards = page.query_selector_all(
-                            GoogleMapsConfig.SELECTORS["card"]
-                        )
-                        if len(new_cards) > prev_count:
-                            logger.info(
-                                f"New cards loaded: {len(new_cards) - prev_count}"
-                            )
+    async def scrape_async(
+        self,
+        query,
+        location,
+        max_entries=None,
+        browser: Optional[AsyncBrowserManager] = None,
+        requests_per_minute=30,
+    ) -> List[Dict]:
+        """Async variant of scrape() running on a page leased from ``browser``.
+
+        If no browser is given, a single-page AsyncBrowserManager is started
+        for this call.
+        """
+        return [
+            result
+            async for result in self.aiter_scrape(
+                query, location, max_entries, browser, requests_per_minute
+            )
+        ]
+
+    async def aiter_scrape(
+        self,
+        query,
+        location,
+        max_entries=None,
+        browser: Optional[AsyncBrowserManager] = None,
+        requests_per_minute=30,
+        skip: Optional[Set[str]] = None,
+        tile: Optional[Tile] = None,
+    ) -> AsyncIterator[Dict]:
+        """Like scrape_async(), but yields each business as soon as it is read.
+
+        With ``tile``, the query is searched within that map viewport instead
+        of by location name.
+        """
+        skip = skip if skip is not None else set()
+        if browser is None:
+            async with AsyncBrowserManager(
+                requests_per_minute,
+                self.proxy,
+                pool_size=1,
+                **self._manager_options(requests_per_minute),
+            ) as own_browser:
+                async for result in self.aiter_scrape(
+                    query,
+                    location,
+                    max_entries,
+                    browser=own_browser,
+                    skip=skip,
+                    tile=tile,
+                ):
+                    yield result
+            return
+
+        collected = 0
+        search_url = _build_search_url(query, location, tile)
+        wait_stats = WaitStats()
+        feed_requests = FeedRequests()
+
+        network_mode = GoogleMapsConfig.EXTRACTION_MODE == "network"
+        # Places parsed from the responses the feed is built from, by feature id
+        payload_places: Dict[str, Dict] = {}
+        from_payload = 0
+        # Why places went to their details page: a missing field, or no payload
+        fallbacks: Counter = Counter()
+
+        async def capture_places(response):
+            if response.request.resource_type == "document":
+                parse = places_from_html
+            elif _SEARCH_RESPONSE_RE.search(response.url):
+                parse = places_from_response
+            else:
+                return
+            try:
+                places = parse(await response.text())
+            except Exception as e:
+                logger.debug(f"Could not read {response.url}: {e}")
+                return
+            for place in places:
+                payload_places[place["feature_id"]] = place
+
+        async with browser.lease_page() as page:
+            if network_mode:
+                page.on("response", capture_places)
+            feed_requests.attach(page)
+            pending: Dict[asyncio.Task, str] = {}
+            partial: Dict[str, Dict] = {}
+            dispatched = set()
+            deferred = set()
+            end_of_feed = False
+            pool = DetailTabPool(
+                browser, page.context, GoogleMapsConfig.DETAIL_TABS, _DETAILS_JS
+            )
+            try:
+                logger.info(f"Navigating to: {search_url}")
+                await page.goto(search_url, timeout=60000)
+                await self._accept_consent_async(browser, page, wait_stats)
+
+                await page.wait_for_selector(
+                    GoogleMapsConfig.SELECTORS["main"], timeout=15000
+                )
+
+                while True:
+                    # Cards whose search payload has everything become records
+                    # right away; the rest are queued on the detail tabs, leaving
+                    # the main tab free to keep scrolling while they load
+                    hrefs = await page.eval_on_selector_all(
+                        GoogleMapsConfig.SELECTORS["card"], _CARD_HREFS_JS
+                    )
+                    ready: List[Tuple[str, Dict, bool]] = []
+                    for href in hrefs:
+                        in_flight = len(pending) + len(ready)
+                        if max_entries and collected + in_flight >= max_entries:
                             break
-                        else:
-                            logger.info("No new cards yet...")
+                        if not href or not href.startswith(
+                            "https://www.google.com/maps/place/"
+                        ):
+                            continue
+                        # Decide from the href alone, before paying for a navigation
+                        key = place_key(href)
+                        if key in skip or key in dispatched:
+                            continue
+                        if self._is_known(key):
+                            dispatched.add(key)
+                            continue
+                        if network_mode:
+                            place = payload_places.get(ids_from_href(href)[0])
+                            if place is None:
+                                if not end_of_feed and key not in deferred:
+                                    # Its response may still be being parsed
+                                    deferred.add(key)
+                                    continue
+                                fallbacks["no payload"] += 1
+                            elif _has_required_fields(place):
+                                dispatched.add(key)
+                                ready.append((href, place, True))
+                                continue
+                            else:
+                                fallbacks.update(
+                                    f"no {field}" for field in _missing_fields(place)
+                                )
+                                partial[href] = place
+                        dispatched.add(key)
+                        pending[asyncio.create_task(pool.extract(href))] = href
 
-                    # Wait for more cards to load
-                    new_cards = page.query_selector_all(
-                        GoogleMapsConfig.SELECTORS["card"]
+                    saturated = (
+                        max_entries
+                        and collected + len(pending) + len(ready) >= max_entries
                     )
-                    logger.info(f"After scrolling: {len(new_cards)} cards found.")
-                    # If no new cards loaded or all cards already seen, stop scrolling
-                    if len(new_cards) == prev_count:
-                        logger.info(
-                            "No new cards loaded after multiple scroll attempts. Stopping."
+                    done = [task for task in pending if task.done()]
+                    if (
+                        not done
+                        and not ready
+                        and pending
+                        and (end_of_feed or saturated)
+                    ):
+                        finished, _ = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
                         )
+                        done = list(finished)
+                    for task in done:
+                        href = pending.pop(task)
+                        details = _merge_details(partial.pop(href, None), task.result())
+                        ready.append((href, details, False))
+
+                    for href, details, via_payload in ready:
+                        name = details["name"] if details else ""
+                        if not name:
+                            continue
+                        result = _build_result(query, details, href)
+                        self._remember(result["metadata"]["place_key"], name)
+                        if via_payload:
+                            from_payload += 1
+                        logger.info(f"Scraped: {name} ({result['address']})")
+                        collected += 1
+                        yield result
+                        if max_entries and collected >= max_entries:
+                            break
+
+                    if max_entries and collected >= max_entries:
                         break
-                else:
-                    logger.info("Max entries reached, stopping scroll.")
-                    break
+                    if end_of_feed:
+                        if not pending:
+                            break
+                        continue
+                    if saturated:
+                        continue
 
-                scroll_round += 1
+                    prev_count = len(hrefs)
+                    feed = await page.query_selector(
+                        GoogleMapsConfig.SELECTORS["results_feed"]
+                    )
+                    if feed:
+                        feed_requests.touch()
+                        await page.evaluate(_SCROLL_FEED_JS, feed)
 
-        logger.info(f"Scraping finished. Total results: {len(results)}")
-        return results
+                    # Detail tabs keep working while the main tab waits
+                    new_count, feed_ended = await wait_for_feed_async(
+                        page, prev_count, feed_requests, wait_stats
+                    )
+                    if feed_ended and new_count == prev_count:
+                        logger.info("No new cards loaded after scrolling.")
+                        end_of_feed = True
+            finally:
+                if network_mode:
+                    page.remove_listener("response", capture_places)
+                feed_requests.detach(page)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                await pool.close()
+
+        if network_mode:
+            reasons = ", ".join(
+                f"{reason}: {count}" for reason, count in fallbacks.most_common()
+            )
+            logger.info(
+                f"{from_payload}/{collected} businesses read from search payloads, "
+                f"{collected - from_payload} needed their details page"
+                + (f" ({reasons})" if reasons else "")
+            )
+        wait_stats.log_summary(f"Google Maps {search_url}")
+        logger.info(f"Scraping {search_url} finished. Total results: {collected}")
@@ -0,0 +1,74 @@
+import math
+import re
+from typing import List, Optional, Tuple
+
+from .config import GoogleMapsConfig
+
+EARTH_RADIUS_METERS = 6371000
+
+_VIEWPORT_RE = re.compile(r"@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),(\d+(?:\.\d+)?)z")
+
+
+class Tile:
+    """One map viewport searched on its own: a center and a zoom level."""
+
+    def __init__(self, latitude: float, longitude: float, zoom: float):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.zoom = zoom
+
+    @property
+    def viewport(self) -> str:
+        """The ``@lat,lng,zoomz`` part of a Maps URL."""
+        return f"@{self.latitude:.6f},{self.longitude:.6f},{self.zoom:g}z"
+
+    def __repr__(self) -> str:
+        return f"Tile({self.viewport})"
+
+
+def parse_viewport(url: str) -> Optional[Tile]:
+    """The viewport a Maps URL shows, e.g. after searching for a city."""
+    match = _VIEWPORT_RE.search(url)
+    if not match:
+        return None
+    return Tile(float(match.group(1)), float(match.group(2)), float(match.group(3)))
+
+
+def offset(
+    latitude: float, longitude: float, north_meters: float, east_meters: float
+) -> Tuple[float, float]:
+    """Move a coordinate by a distance north and east (flat-earth approximation)."""
+    d_lat = math.degrees(north_meters / EARTH_RADIUS_METERS)
+    d_lng = math.degrees(
+        east_meters / (EARTH_RADIUS_METERS * math.cos(math.radians(latitude)))
+    )
+    return latitude + d_lat, longitude + d_lng
+
+
+def tile_grid(
+    latitude: float,
+    longitude: float,
+    radius_meters: float,
+    step_meters: float = GoogleMapsConfig.TILE_STEP_METERS,
+    zoom: float = GoogleMapsConfig.TILE_ZOOM,
+) -> List[Tile]:
+    """Square grid of tiles whose cells cover the circle around a center.
+
+    Cells are ``step_meters`` wide; a cell is kept when any part of it lies
+    within ``radius_meters``. Tiles are ordered from the center outwards, so
+    the densest area is searched first.
+    """
+    steps = math.ceil(radius_meters / step_meters)
+    half_diagonal = step_meters / math.sqrt(2)
+    cells = []
+    for row in range(-steps, steps + 1):
+        for column in range(-steps, steps + 1):
+            north, east = row * step_meters, column * step_meters
+            distance = math.hypot(north, east)
+            if distance - half_diagonal <= radius_meters:
+                cells.append((distance, north, east))
+    cells.sort()
+    return [
+        Tile(*offset(latitude, longitude, north, east), zoom)
+        for _, north, east in cells
+    ]
@@ -7,6 +7,7 @@ from typing import Dict, Any
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config.base_cli import EnricherCLI
+from scrapers.imprint_data.config import ImprintConfig
 
 
 class ImprintDataCLI(EnricherCLI):
@@ -24,9 +25,17 @@ class ImprintDataCLI(EnricherCLI):
         """Get parameters for imprint data extraction."""
         print("\n📄 Configure imprint data extraction:")
         
+        concurrency = questionary.text(
+            "Websites crawled in parallel (1 = one at a time):",
+            default=str(ImprintConfig.CONCURRENCY)
+        ).ask()
+        
+        if concurrency is None:
+            return None
+        
         delay = questionary.text(
-            "Delay between requests (seconds):",
-            default="1.0"
+            "Delay between requests to the same website (seconds):",
+            default=str(ImprintConfig.HOST_DELAY)
         ).ask()
         
         if delay is None:
@@ -44,6 +53,7 @@ class ImprintDataCLI(EnricherCLI):
             return None
         
         params = {
+            "concurrency": concurrency,
             "delay": delay,
             "method": method
         }
@@ -94,7 +104,7 @@ sys.path.append(os.getcwd())
 from scrapers.imprint_data.scraper import OfficialNameExtractor
 
 extractor = OfficialNameExtractor(llm_model="{params.get('model', 'deepseek-r1:8b')}")
-extractor.run_enrichment(delay={params['delay']}, method="{params['method']}")
+extractor.run_enrichment(delay={params['delay']}, method="{params['method']}", concurrency={params['concurrency']})
 """
         ]
         
@@ -0,0 +1,23 @@
+class ImprintConfig:
+    # Links containing these mark an imprint; "/<keyword>" is probed otherwise
+    IMPRINT_KEYWORDS = ["impressum", "imprint", "legal", "kontakt"]
+
+    # Async crawler (see crawler.py). CONCURRENCY companies are crawled at
+    # once and share as many pooled connections; no host gets more than
+    # CONNECTIONS_PER_HOST of them.
+    CONCURRENCY = 64
+    CONNECTIONS_PER_HOST = 2
+    # Minimum seconds between two requests to the same host (--delay)
+    HOST_DELAY = 1.0
+    TIMEOUT = 15  # seconds per request
+    CONNECT_TIMEOUT = 5  # seconds
+    # Imprints are small; larger bodies are cut off instead of downloaded
+    MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+    # Browser pages for sites that only render with JavaScript, launched on
+    # the first such site
+    BROWSER_PAGES = 4
+    BROWSER_TIMEOUT_MS = 10000
+
+    # Log progress every this many companies
+    PROGRESS_INTERVAL = 100
@@ -0,0 +1,296 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+
+from config.async_browser import AsyncBrowserManager
+from config.config import ScraperConfig
+from config.http_client import FINAL_STATUSES, FetchResult, needs_javascript
+
+from .config import ImprintConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ImprintCrawler:
+    """Finds imprints and extracts official names for many companies at once.
+
+    All sites share one pooled aiohttp session. Its connector caps
+    connections in total and per host, so thousands of different hosts are
+    crawled concurrently without sending more than a few requests to any
+    one of them. Requests to the same host are also spaced ``host_delay``
+    seconds apart. Pages that only render with JavaScript go to a small
+    browser pool that is launched on first use. Names are passed to
+    ``save`` by a single writer task as soon as they are extracted.
+    """
+
+    def __init__(
+        self,
+        extractor,
+        method: str = "regex",
+        concurrency: int = ImprintConfig.CONCURRENCY,
+        save: Optional[Callable[[int, str], None]] = None,
+        connections_per_host: int = ImprintConfig.CONNECTIONS_PER_HOST,
+        proxy: Optional[str] = None,
+        render_javascript: bool = True,
+        host_delay: float = ImprintConfig.HOST_DELAY,
+    ):
+        self.extractor = extractor
+        self.method = method
+        self.concurrency = max(1, concurrency)
+        self.save = save
+        self.connections_per_host = connections_per_host
+        self.proxy = proxy
+        self.render_javascript = render_javascript
+        self.host_delay = max(0.0, host_delay)
+        # Loop time from which each host may get its next request
+        self._next_request: Dict[str, float] = {}
+        self.stats = Counter()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._browser: Optional[AsyncBrowserManager] = None
+        self._browser_lock = asyncio.Lock()
+        self._started = 0.0
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.connections_per_host,
+            ttl_dns_cache=300,
+        )
+        headers = dict(ScraperConfig.BROWSER_HEADERS)
+        # aiohttp only decodes brotli when the brotli package is installed
+        headers["Accept-Encoding"] = "gzip, deflate"
+        headers["User-Agent"] = random.choice(ScraperConfig.USER_AGENTS)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                total=ImprintConfig.TIMEOUT, connect=ImprintConfig.CONNECT_TIMEOUT
+            ),
+        )
+
+    async def _get_browser(self) -> AsyncBrowserManager:
+        async with self._browser_lock:
+            if self._browser is None:
+                logger.info("Launching browser for pages that need JavaScript")
+                self._browser = await AsyncBrowserManager(
+                    proxy=self.proxy, pool_size=ImprintConfig.BROWSER_PAGES
+                ).start()
+        return self._browser
+
+    async def _pace(self, url: str):
+        """Wait for the next free slot of ``url``'s host, ``host_delay`` apart."""
+        if not self.host_delay:
+            return
+        host = urlparse(url).netloc.lower()
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_request.get(host, now))
+        self._next_request[host] = slot + self.host_delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def fetch_http(self, url: str) -> Optional[FetchResult]:
+        """GET ``url``. Returns None when a browser is needed instead.
+
+        Unreachable sites come back as a failed result (status 0) rather than
+        None, so they are not retried in the browser.
+        """
+        await self._pace(url)
+        try:
+            async with self._session.get(url, proxy=self.proxy) as response:
+                if response.status in FINAL_STATUSES:
+                    self.stats["http"] += 1
+                    return FetchResult(str(response.url), "", response.status, "http")
+                content_type = response.headers.get("content-type", "")
+                if response.status >= 400 or "html" not in content_type:
+                    return None
+                body = await response.content.read(ImprintConfig.MAX_PAGE_BYTES)
+                status, final_url = response.status, str(response.url)
+                try:
+                    html = body.decode(response.charset or "utf-8", errors="replace")
+                except LookupError:
+                    html = body.decode("utf-8", errors="replace")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            logger.debug(f"{url} is unreachable: {e!r}")
+            return FetchResult(url, "", 0, "http")
+        except aiohttp.ClientError as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e!r}")
+            return None
+
+        if needs_javascript(html):
+            logger.debug(f"{url} needs JavaScript rendering")
+            return None
+        self.stats["http"] += 1
+        return FetchResult(final_url, html, status, "http")
+
+    async def fetch_with_browser(self, url: str) -> FetchResult:
+        browser = await self._get_browser()
+        await self._pace(url)
+        async with browser.lease_page() as page:
+            response = await page.goto(
+                url,
+                timeout=ImprintConfig.BROWSER_TIMEOUT_MS,
+                wait_until="domcontentloaded",
+            )
+            self.stats["browser"] += 1
+            return FetchResult(
+                page.url,
+                await page.content(),
+                response.status if response else 0,
+                "browser",
+            )
+
+    async def fetch(self, url: str) -> Optional[FetchResult]:
+        """Fetch ``url`` over HTTP, falling back to the browser if enabled."""
+        result = await self.fetch_http(url)
+        if result is None and self.render_javascript:
+            result = await self.fetch_with_browser(url)
+        return result
+
+    async def probe(self, url: str) -> bool:
+        """Return True if ``url`` exists and serves HTML, without reading the body."""
+        await self._pace(url)
+        try:
+            async with self._session.get(url, proxy=self.proxy) as response:
+                return response.status < 400 and "html" in response.headers.get(
+                    "content-type", ""
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def find_imprint_url(self, homepage: FetchResult, url: str) -> Optional[str]:
+        """The imprint linked from the homepage, else the first common path that exists."""
+        hrefs = await asyncio.to_thread(self.extractor._extract_hrefs, homepage.html)
+        imprint_url = self.extractor._find_imprint_link(homepage.url, hrefs)
+        if imprint_url:
+            return imprint_url
+        candidates = [urljoin(url, "/" + kw) for kw in ImprintConfig.IMPRINT_KEYWORDS]
+        found = await asyncio.gather(*(self.probe(c) for c in candidates))
+        return next((c for c, ok in zip(candidates, found) if ok), None)
+
+    async def enrich(self, company: Dict) -> Optional[str]:
+        """The official name from one company's imprint, or None."""
+        url = company["url"]
+        homepage = await self.fetch(url)
+        if homepage is None or not homepage.ok:
+            self.stats["failed"] += 1
+            logger.debug(f"Could not fetch homepage {url}")
+            return None
+
+        imprint_url = await self.find_imprint_url(homepage, url)
+        if not imprint_url:
+            self.stats["not_found"] += 1
+            logger.debug(f"Imprint page not found for {url}")
+            self.extractor._log_imprint_not_found(url)
+            return None
+
+        imprint = await self.fetch(imprint_url)
+        if imprint is None or not imprint.ok:
+            self.stats["failed"] += 1
+            logger.debug(f"Could not fetch imprint {imprint_url}")
+            return None
+
+        official_name = await asyncio.to_thread(
+            self.extractor._extract_official_name, imprint.html, self.method
+        )
+        if not official_name:
+            self.stats["no_name"] += 1
+            logger.debug(f"Could not extract official name from {imprint_url}")
+            self._save_debug(company, imprint.html)
+            return None
+        logger.info(
+            f"Official name for {company['name']} ({self.method}, via {imprint.via}): "
+            f"{official_name}"
+        )
+        return official_name
+
+    def _save_debug(self, company: Dict, html: str):
+        if not html:
+            return
+        path = os.path.join("imprint_debug", f"failed_extract_{company['id']}.html")
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+        except OSError as e:
+            logger.debug(f"Could not save debug output: {e}")
+
+    async def _worker(self, companies: asyncio.Queue, names: asyncio.Queue):
+        while True:
+            company = await companies.get()
+            try:
+                official_name = await self.enrich(company)
+                if official_name:
+                    names.put_nowait((company, official_name))
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.warning(f"Error for {company['url']}: {e!r}")
+            finally:
+                self.stats["processed"] += 1
+                if self.stats["processed"] % ImprintConfig.PROGRESS_INTERVAL == 0:
+                    self.log_stats()
+                companies.task_done()
+
+    async def _write_names(self, names: asyncio.Queue):
+        """Store names one at a time as they arrive, off the event loop."""
+        while True:
+            item = await names.get()
+            if item is None:
+                return
+            company, official_name = item
+            try:
+                if self.save is not None:
+                    await asyncio.to_thread(self.save, company["id"], official_name)
+                self.stats["enriched"] += 1
+            except Exception as e:
+                self.stats["save_failed"] += 1
+                logger.error(f"Could not store name for company {company['id']}: {e}")
+
+    async def crawl(self, companies: Iterable[Dict]) -> int:
+        """Enrich ``companies`` (dicts with id, name, url). Returns the number stored."""
+        os.makedirs("imprint_debug", exist_ok=True)
+        self._started = time.perf_counter()
+        # Bounded, so a huge backlog is fed in as workers free up
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        names: asyncio.Queue = asyncio.Queue()
+        async with self._create_session() as session:
+            self._session = session
+            writer = asyncio.create_task(self._write_names(names))
+            workers = [
+                asyncio.create_task(self._worker(queue, names))
+                for _ in range(self.concurrency)
+            ]
+            try:
+                for company in companies:
+                    if company.get("url"):
+                        await queue.put(company)
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                names.put_nowait(None)
+                await writer
+                if self._browser is not None:
+                    await self._browser.close()
+                    self._browser = None
+                self._session = None
+        self.log_stats()
+        return self.stats["enriched"]
+
+    def log_stats(self):
+        elapsed = time.perf_counter() - self._started
+        processed = self.stats["processed"]
+        logger.info(
+            f"Imprint crawl: {processed} companies in {elapsed:.0f}s "
+            f"({processed / elapsed if elapsed else 0:.1f}/s), "
+            f"{self.stats['enriched']} enriched, "
+            f"{self.stats['not_found']} without imprint, "
+            f"{self.stats['no_name']} without name, {self.stats['failed']} failed; "
+            f"{self.stats['http']} pages over HTTP, {self.stats['browser']} with the browser"
+        )
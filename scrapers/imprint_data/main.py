@@ -16,6 +16,7 @@ sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from scrapers.imprint_data.config import ImprintConfig
 from scrapers.imprint_data.scraper import OfficialNameExtractor
 
 # Configure logging
@@ -44,7 +45,9 @@ def cli_enrich(args):
             print(f"💡 Make sure model is available: ollama pull {args.llm_model}")
 
         print(f"\n🏛️ Configure Imprint Data enrichment:")
-        enriched_count = extractor.run_enrichment(delay=args.delay, method=args.method)
+        enriched_count = extractor.run_enrichment(
+            delay=args.delay, method=args.method, concurrency=args.concurrency
+        )
 
         print(f"\n🎉 Imprint Data Enrichment Complete!")
         print(f"📊 Method: {args.method}")
@@ -68,8 +71,13 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  %(prog)s --method regex --delay 1.0
+  %(prog)s --method regex --concurrency 128
+  %(prog)s --method regex --concurrency 1 --delay 1.0
   %(prog)s --method llm --llm-model "deepseek-r1:8b" --delay 2.0
+
+--delay is the politeness control: the minimum number of seconds between two
+requests to the same website. --concurrency only sets how many different
+websites are crawled at once.
         """,
     )
 
@@ -85,8 +93,17 @@ Examples:
         "--delay",
         "-d",
         type=float,
-        default=1.0,
-        help="Delay between requests in seconds (default: 1.0)",
+        default=ImprintConfig.HOST_DELAY,
+        help="Minimum seconds between requests to the same website "
+        f"(default: {ImprintConfig.HOST_DELAY})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=ImprintConfig.CONCURRENCY,
+        help="Websites crawled in parallel; 1 visits them one at a time "
+        f"(default: {ImprintConfig.CONCURRENCY})",
     )
     parser.add_argument(
         "--llm-model",
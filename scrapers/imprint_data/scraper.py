@@ -1,14 +1,17 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import asyncio
 import re
 import time
 import os
-from config.browser import BrowserManager
+from config.http_client import HybridFetcher
 from utils.db import get_all_raw_companies, update_official_name_for_company
+from .config import ImprintConfig
+from .crawler import ImprintCrawler
 import ollama  # Für lokale LLM-Nutzung
 
-IMPRINT_KEYWORDS = ["impressum", "imprint", "legal", "kontakt"]
+IMPRINT_KEYWORDS = ImprintConfig.IMPRINT_KEYWORDS
 IMPRINT_NOT_FOUND_LOG = "imprint_not_found.txt"
 
 
@@ -118,59 +121,102 @@ class OfficialNameExtractor:
             print(f"❌ LLM extraction failed: {e}")
             return ""
 
-    def run_enrichment(self, delay=1, method="regex"):
+    def _find_imprint_link(self, base_url, hrefs):
+        """Return the first link that looks like an imprint page."""
+        for href_attr in hrefs:
+            if href_attr and any(kw in href_attr.lower() for kw in IMPRINT_KEYWORDS):
+                return urljoin(base_url, href_attr)
+        return None
+
+    def _extract_official_name(self, html, method):
+        if method == "regex":
+            return self.extract_with_regex(html)
+        if method == "llm":
+            return self.extract_with_llm(html)
+        raise ValueError(f"Unknown method: {method}")
+
+    def _log_imprint_not_found(self, url):
+        with open(IMPRINT_NOT_FOUND_LOG, "a", encoding="utf-8") as f:
+            f.write(f"{url}\n")
+
+    def _extract_hrefs(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        return [a["href"] for a in soup.find_all("a", href=True)]
+
+    def _save_debug(self, fetcher, company, reason, url, html=""):
+        """Screenshot ``url`` if the browser loaded it, else keep the fetched HTML."""
+        base_path = f"imprint_debug/{reason}_{company['id']}"
+        try:
+            if fetcher.screenshot(f"{base_path}.png", url):
+                print(f"  📸 Screenshot saved to {base_path}.png")
+            elif html:
+                with open(f"{base_path}.html", "w", encoding="utf-8") as f:
+                    f.write(html)
+                print(f"  📝 HTML saved to {base_path}.html")
+        except Exception as e:
+            print(f"  ❌ Could not save debug output: {e}")
+
+    def run_enrichment(
+        self,
+        delay=ImprintConfig.HOST_DELAY,
+        method="regex",
+        concurrency=ImprintConfig.CONCURRENCY,
+    ):
+        """Visit company websites and store the official name from their imprint.
+
+        Pages are fetched over plain HTTP first; only pages that need
+        JavaScript are rendered in the browser. With ``concurrency`` > 1 the
+        websites are crawled concurrently by ImprintCrawler, with requests to
+        the same host ``delay`` seconds apart; with 1 they are visited one at
+        a time, ``delay`` seconds apart (see HybridFetcher).
+        """
+        if concurrency > 1:
+            return asyncio.run(
+                self.run_enrichment_async(
+                    method=method, concurrency=concurrency, delay=delay
+                )
+            )
+
         companies = get_all_raw_companies()
         enriched_count = 0
         os.makedirs("imprint_debug", exist_ok=True)
 
-        with BrowserManager() as browser:
+        with HybridFetcher() as fetcher:
             for company in companies:
                 url = company.get("url")
                 if not url:
                     continue
 
-                page = browser.get_page()
                 print(f"Processing: {company['name']} ({url})")
+                html = ""
+                current_url = url
 
                 try:
-                    page.goto(url, timeout=10000, wait_until="domcontentloaded")
-
-                    imprint_url = None
-                    links = page.query_selector_all("a[href]")
-                    for link in links:
-                        href_attr = link.get_attribute("href")
-                        if href_attr and any(
-                            kw in href_attr.lower() for kw in IMPRINT_KEYWORDS
-                        ):
-                            imprint_url = urljoin(url, href_attr)
-                            break
+                    homepage = fetcher.fetch(url)
+                    imprint_url = self._find_imprint_link(
+                        homepage.url, self._extract_hrefs(homepage.html)
+                    )
 
                     if not imprint_url:
                         for kw in IMPRINT_KEYWORDS:
                             test_url = urljoin(url, "/" + kw)
-                            try:
-                                resp = page.goto(test_url, timeout=5000)
-                                if resp and resp.ok:
-                                    imprint_url = test_url
-                                    break
-                            except Exception:
-                                continue
+                            if fetcher.probe(test_url):
+                                imprint_url = test_url
+                                break
 
                     if not imprint_url:
                         print("  ❌ Imprint page not found.")
-                        with open(IMPRINT_NOT_FOUND_LOG, "a", encoding="utf-8") as f:
-                            f.write(f"{url}\n")
+                        self._log_imprint_not_found(url)
                         continue
 
-                    page.goto(imprint_url, timeout=10000)
-                    html = page.content()
+                    current_url = imprint_url
+                    imprint = fetcher.fetch(imprint_url)
+                    html = imprint.html
 
-                    if method == "regex":
-                        official_name = self.extract_with_regex(html)
-                    elif method == "llm":
-                        official_name = self.extract_with_llm(html)
-                    else:
-                        print(f"❌ Unknown method: {method}")
+                    try:
+                        official_name = self._extract_official_name(html, method)
+                    except ValueError as e:
+                        print(f"❌ {e}")
                         continue
 
                     if official_name:
@@ -178,7 +224,9 @@ class OfficialNameExtractor:
                             f"  📝 Debug - Official name to save: '{official_name}' (length: {len(official_name)})"
                         )
                         update_official_name_for_company(company["id"], official_name)
-                        print(f"  ✅ Official name found ({method}): {official_name}")
+                        print(
+                            f"  ✅ Official name found ({method}, via {imprint.via}): {official_name}"
+                        )
                         enriched_count += 1
                     else:
                         print(f"  ⚠️ Could not extract official name ({method}).")
@@ -189,24 +237,42 @@ class OfficialNameExtractor:
                         text_snippet = soup.get_text(separator="\n")[:500]
                         print(f"  📝 Debug - Text snippet: {text_snippet}...")
 
-                        screenshot_path = (
-                            f"imprint_debug/failed_extract_{company['id']}.png"
+                        self._save_debug(
+                            fetcher, company, "failed_extract", imprint_url, html
                         )
-                        page.screenshot(path=screenshot_path)
-                        print(f"  📸 Screenshot saved to {screenshot_path}")
 
                 except Exception as e:
                     print(f"  ❌ Error: {e}")
-                    screenshot_path = f"imprint_debug/failed_fetch_{company['id']}.png"
-                    try:
-                        page.screenshot(path=screenshot_path)
-                        print(f"  📸 Screenshot saved to {screenshot_path}")
-                    except Exception as se:
-                        print(f"  ❌ Could not take screenshot: {se}")
+                    self._save_debug(
+                        fetcher, company, "failed_fetch", current_url, html
+                    )
 
                 time.sleep(delay)
 
         print(f"Done. {enriched_count} companies enriched with official names.")
+        return enriched_count
+
+    async def run_enrichment_async(
+        self,
+        method="regex",
+        concurrency=ImprintConfig.CONCURRENCY,
+        delay=ImprintConfig.HOST_DELAY,
+    ):
+        """Async variant of run_enrichment() crawling many websites at once.
+
+        ``delay`` is the minimum interval between requests to one host.
+        Names are written to the database as they are found, not at the end.
+        """
+        crawler = ImprintCrawler(
+            self,
+            method,
+            concurrency,
+            save=update_official_name_for_company,
+            host_delay=delay,
+        )
+        enriched_count = await crawler.crawl(get_all_raw_companies())
+        print(f"Done. {enriched_count} companies enriched with official names.")
+        return enriched_count
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+import pytest
+
+from config.rate_limiter import AdaptiveRateLimiter, domain_key
+
+
+def test_domain_key():
+    assert domain_key("https://www.gelbeseiten.de/suche/friseur") == "gelbeseiten.de"
+    assert domain_key("https://maps.google.com/maps?q=x") == "google.com"
+    assert domain_key("not a url") is None
+
+
+def test_domain_key_keeps_the_registrable_domain_under_country_suffixes():
+    assert domain_key("https://www.example.co.uk/a") == "example.co.uk"
+    assert domain_key("https://shop.other.co.uk/") == "other.co.uk"
+    assert domain_key("https://www.herold.co.at/") == "herold.co.at"
+    assert domain_key("https://example.uk/") == "example.uk"
+
+
+def test_adaptive_backs_off_once_per_episode_and_recovers(clock):
+    limiter = AdaptiveRateLimiter(
+        60, min_requests_per_minute=10, increase=60, decrease=0.5, clock=clock
+    )
+    limiter.record_throttle("a.de", "HTTP 429")
+    assert limiter.current_rate("a.de") == 30
+    # A second signal within the same interval belongs to the same episode
+    limiter.record_throttle("a.de", "HTTP 429")
+    assert limiter.current_rate("a.de") == 30
+    clock.now = 10.0
+    limiter.record_throttle("a.de", "HTTP 429")
+    assert limiter.current_rate("a.de") == 15
+    limiter.record_success("a.de")
+    assert limiter.current_rate("a.de") == pytest.approx(19.0)
+    assert limiter.current_rate("b.de") == 60
+
+
+def test_adaptive_rate_stays_within_bounds(clock):
+    limiter = AdaptiveRateLimiter(
+        10,
+        min_requests_per_minute=4,
+        max_requests_per_minute=12,
+        increase=100,
+        clock=clock,
+    )
+    for _ in range(5):
+        limiter.record_success()
+    assert limiter.current_rate() == 12
+    for step in range(10):
+        clock.now = 100.0 * (step + 1)
+        limiter.record_throttle()
+    assert limiter.current_rate() == 4
+
+
+def test_throttle_drops_saved_up_burst(clock):
+    limiter = AdaptiveRateLimiter(60, decrease=0.5, burst=5, clock=clock)
+    assert limiter.reserve("a.de") == 0.0
+    limiter.record_throttle("a.de")
+    assert limiter.reserve("a.de") == pytest.approx(2.0)
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class FakeRequest:
+    def __init__(self, resource_type, navigation=False, frame=None):
+        self.resource_type = resource_type
+        self.navigation = navigation
+        self.frame = frame or FakeFrame()
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeResponse:
+    def __init__(self, url, request, status=200):
+        self.url = url
+        self.request = request
+        self.status = status
+        self.ok = 200 <= status < 300
+
+
+class FakeContext:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+def test_attach_counts_only_main_frame_navigations_as_success(clock):
+    limiter = AdaptiveRateLimiter(60, increase=60, clock=clock)
+    context = FakeContext()
+    limiter.attach(context)
+    on_response = context.handlers["response"]
+    url = "https://www.gelbeseiten.de/suche/friseur/berlin"
+
+    on_response(FakeResponse(url, FakeRequest("xhr")))
+    on_response(FakeResponse(url, FakeRequest("fetch")))
+    on_response(
+        FakeResponse(url, FakeRequest("document", True, FakeFrame(FakeFrame())))
+    )
+    on_response(FakeResponse(url, FakeRequest("image", True)))
+    assert limiter.rates() == {}
+
+    on_response(FakeResponse(url, FakeRequest("document", True)))
+    assert limiter.current_rate("gelbeseiten.de") == pytest.approx(61.0)
+
+
+def test_attach_backs_off_on_throttled_api_calls(clock):
+    limiter = AdaptiveRateLimiter(60, decrease=0.5, clock=clock)
+    context = FakeContext()
+    limiter.attach(context)
+    context.handlers["response"](
+        FakeResponse("https://www.gelbeseiten.de/ajaxsuche", FakeRequest("xhr"), 429)
+    )
+    assert limiter.current_rate("gelbeseiten.de") == 30
+
+
+def test_adaptive_limiting_is_opt_in():
+    assert AdaptiveRateLimiter.from_config() is None
+
+    class Config:
+        ADAPTIVE_RATE_LIMIT = True
+
+    assert isinstance(AdaptiveRateLimiter.from_config(Config, 30), AdaptiveRateLimiter)
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("psutil")
+
+import config.memory_watchdog as memory_watchdog  # noqa: E402
+from config.async_browser import AsyncBrowserManager, _PoolSlot  # noqa: E402
+from config.memory_watchdog import MemoryWatchdog  # noqa: E402
+from config.rate_limiter import RateLimiter  # noqa: E402
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    def is_closed(self):
+        return False
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = [FakePage(self)]
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        self.browser.contexts.remove(self)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _manager(monkeypatch, readings):
+    monkeypatch.setattr(memory_watchdog, "browser_memory_mb", lambda: readings["mb"])
+    manager = AsyncBrowserManager(
+        pool_size=2,
+        browser_endpoint="",
+        rate_limiter=RateLimiter(0),
+        memory_watchdog=MemoryWatchdog(
+            memory_limit_mb=1000, max_pages=0, check_interval=1
+        ),
+    )
+    manager.prewarm = False
+    manager.launched = []
+
+    async def launch_browser():
+        browser = FakeBrowser()
+        manager.launched.append(browser)
+        return browser
+
+    async def open_context_page():
+        context = FakeContext(manager.browser)
+        manager.browser.contexts.append(context)
+        return context, context.pages[0]
+
+    manager._launch_browser = launch_browser
+    manager._open_context_page = open_context_page
+    manager.browser = FakeBrowser()
+    manager._free_slots = asyncio.Queue()
+    manager._slots = [_PoolSlot(slot_id) for slot_id in range(2)]
+    for slot in manager._slots:
+        manager._free_slots.put_nowait(slot)
+    return manager
+
+
+def test_recycle_waits_for_leased_pages(monkeypatch):
+    readings = {"mb": 200.0}
+    manager = _manager(monkeypatch, readings)
+    first_browser = manager.browser
+
+    async def second_lease(leased):
+        async with manager.lease_page() as page:
+            leased.append(page)
+
+    async def run():
+        leased = []
+        async with manager.lease_page() as page:
+            readings["mb"] = 1500.0
+            waiter = asyncio.create_task(second_lease(leased))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # The recycle must not pull the browser from under a leased page
+            assert not leased
+            assert not first_browser.closed
+            assert not page.context.closed
+        readings["mb"] = 200.0
+        await waiter
+        return page, leased
+
+    page, leased = asyncio.run(run())
+    assert first_browser.closed
+    assert page.context.closed
+    assert manager.launched == [manager.browser]
+    assert leased[0].context.browser is manager.browser
+    assert manager.memory_watchdog.recycles == 1
+    assert manager.memory_watchdog.peak_mb == 1500.0
+
+
+def test_healthy_browser_is_not_recycled(monkeypatch):
+    manager = _manager(monkeypatch, {"mb": 200.0})
+
+    async def run():
+        for _ in range(3):
+            async with manager.lease_page():
+                pass
+
+    asyncio.run(run())
+    assert manager.launched == []
+    assert manager.memory_watchdog.recycles == 0
+
+
+class ClosingLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(0)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_close_closes_the_rate_limiter(monkeypatch):
+    manager = _manager(monkeypatch, {"mb": 200.0})
+    manager.rate_limiter = ClosingLimiter()
+    asyncio.run(manager.close())
+    assert manager.rate_limiter.closed
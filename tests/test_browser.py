@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("playwright")
+
+import config.browser as browser_module  # noqa: E402
+from config.browser import browser_session  # noqa: E402
+
+
+class FakeManager:
+    def __init__(self, requests_per_minute, proxy, **kwargs):
+        self.kwargs = kwargs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+def test_manager_options_are_only_built_for_a_new_manager(monkeypatch):
+    monkeypatch.setattr(browser_module, "BrowserManager", FakeManager)
+    built = []
+
+    def options():
+        built.append(True)
+        return {"target_domain": "gelbeseiten.de"}
+
+    callers_browser = object()
+    with browser_session(callers_browser, manager_options=options) as browser:
+        assert browser is callers_browser
+    assert not built
+
+    with browser_session(None, 30, manager_options=options) as browser:
+        assert browser.kwargs == {"target_domain": "gelbeseiten.de"}
+    assert built == [True]
@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from utils.checkpoint import Checkpoint, checkpoint_path
+from utils.sinks import JsonlSink, jsonl_path, read_jsonl
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / "checkpoints")
+
+
+def test_checkpoint_path_is_safe_and_stable(directory):
+    path = checkpoint_path("googlemaps", "Friseur/Barbier", "Köln Süd", directory)
+    assert os.path.dirname(path) == directory
+    assert os.path.basename(path) == "googlemaps_friseur_barbier_köln_süd.json"
+
+
+def test_fresh_checkpoint_ignores_saved_state(directory):
+    Checkpoint("gelbeseiten", "friseur", "berlin", "out.jsonl", directory).save()
+    checkpoint = Checkpoint.open(
+        "gelbeseiten", "friseur", "berlin", "new.jsonl", directory=directory
+    )
+    assert checkpoint.count == 0
+    assert not checkpoint.resumed
+    assert checkpoint.output_path == "new.jsonl"
+
+
+def test_resume_restores_progress_and_output(directory):
+    checkpoint = Checkpoint(
+        "googlemaps", "friseur", "berlin", "run1.jsonl", directory, interval=2
+    )
+    checkpoint.add({}, "place-1")
+    assert not os.path.exists(checkpoint.path)
+    checkpoint.add({}, "place-2")
+    assert os.path.exists(checkpoint.path)
+
+    resumed = Checkpoint.open(
+        "googlemaps",
+        "friseur",
+        "berlin",
+        "run2.jsonl",
+        resume=True,
+        directory=directory,
+    )
+    assert resumed.resumed
+    assert resumed.count == 2
+    assert resumed.seen == {"place-1", "place-2"}
+    assert resumed.output_path == "run1.jsonl"
+
+
+def test_resume_without_checkpoint_starts_over(directory):
+    checkpoint = Checkpoint.open(
+        "gelbeseiten",
+        "friseur",
+        "berlin",
+        "out.jsonl",
+        resume=True,
+        directory=directory,
+    )
+    assert checkpoint.count == 0
+    assert checkpoint.output_path == "out.jsonl"
+
+
+def test_unreadable_checkpoint_is_ignored(directory):
+    path = checkpoint_path("gelbeseiten", "friseur", "berlin", directory)
+    os.makedirs(directory)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    checkpoint = Checkpoint.open(
+        "gelbeseiten", "friseur", "berlin", resume=True, directory=directory
+    )
+    assert checkpoint.count == 0
+
+
+def test_context_manager_saves_on_error_and_completes_on_success(directory):
+    with pytest.raises(RuntimeError):
+        with Checkpoint("gelbeseiten", "friseur", "berlin", directory=directory) as cp:
+            cp.add({})
+            raise RuntimeError("crash")
+    with open(cp.path, encoding="utf-8") as f:
+        assert json.load(f)["count"] == 1
+
+    with Checkpoint.open(
+        "gelbeseiten", "friseur", "berlin", resume=True, directory=directory
+    ) as cp:
+        assert cp.count == 1
+        cp.add({})
+    assert not os.path.exists(cp.path)
+
+
+def _record(key):
+    return {"metadata": {"place_key": key}, "company_name": key}
+
+
+def test_resume_catches_up_with_records_written_after_the_last_save(
+    directory, tmp_path
+):
+    output = str(tmp_path / "run1.jsonl")
+    checkpoint = Checkpoint(
+        "googlemaps", "friseur", "berlin", output, directory, interval=2
+    )
+    with JsonlSink(output) as sink:
+        for key in ("place-1", "place-2", "place-3"):
+            sink.write(_record(key))
+            checkpoint.add(_record(key), key)
+    # Hard kill: no save for place-3, and a record cut off mid-line
+    with open(output, "a", encoding="utf-8") as f:
+        f.write('{"metadata": {"place_key": "place-4"')
+
+    resumed = Checkpoint.open(
+        "googlemaps", "friseur", "berlin", resume=True, directory=directory
+    )
+    assert resumed.count == 3
+    assert resumed.seen == {"place-1", "place-2", "place-3"}
+
+    with JsonlSink(output) as sink:
+        sink.write(_record("place-4"))
+    assert [r["company_name"] for r in read_jsonl(output)] == [
+        "place-1",
+        "place-2",
+        "place-3",
+        "place-4",
+    ]
+
+
+def test_jsonl_path_is_per_job(tmp_path):
+    path = jsonl_path(str(tmp_path), "googlemaps", "Friseur", "Köln Süd")
+    assert os.path.basename(path).startswith("googlemaps_friseur_köln_süd_")
+    assert path.endswith(".jsonl")
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from scrapers.googlemaps.detail_pool import DetailTabPool  # noqa: E402
+
+
+class FakeTab:
+    def __init__(self, context, fail_hrefs):
+        self.context = context
+        self.fail_hrefs = fail_hrefs
+        self.closed = False
+
+    async def goto(self, href, timeout=None):
+        self.context.active += 1
+        self.context.peak = max(self.context.peak, self.context.active)
+        try:
+            await asyncio.sleep(0.01)
+            if href in self.fail_hrefs:
+                # A crashed tab closes itself
+                self.closed = True
+                self.context.open -= 1
+                raise RuntimeError("Target crashed")
+        finally:
+            self.context.active -= 1
+
+    async def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    async def evaluate(self, script, selectors):
+        return {"name": "Salon Schnitt"}
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        if not self.closed:
+            self.context.open -= 1
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, fail_hrefs=()):
+        self.fail_hrefs = set(fail_hrefs)
+        self.opened = []
+        self.open = 0
+        self.peak_open = 0
+        self.active = 0
+        self.peak = 0
+
+    async def new_page(self):
+        # Opening a tab is a round trip to the browser
+        await asyncio.sleep(0)
+        tab = FakeTab(self, self.fail_hrefs)
+        self.opened.append(tab)
+        self.open += 1
+        self.peak_open = max(self.peak_open, self.open)
+        return tab
+
+
+class FakeBrowser:
+    async def throttle(self, page):
+        pass
+
+
+def _run(pool, hrefs):
+    async def run():
+        try:
+            return await asyncio.gather(*(pool.extract(href) for href in hrefs))
+        finally:
+            await pool.close()
+
+    return asyncio.run(run())
+
+
+def test_pool_never_opens_more_tabs_than_its_size():
+    context = FakeContext()
+    pool = DetailTabPool(FakeBrowser(), context, size=3, details_js="")
+    results = _run(pool, [f"place-{i}" for i in range(20)])
+
+    assert results == [{"name": "Salon Schnitt"}] * 20
+    assert len(context.opened) == 3
+    assert context.peak == 3
+    assert context.open == 0
+
+
+def test_crashed_tabs_are_replaced_within_the_bound():
+    failing = {f"place-{i}" for i in range(0, 20, 4)}
+    context = FakeContext(failing)
+    pool = DetailTabPool(FakeBrowser(), context, size=3, details_js="")
+    results = _run(pool, [f"place-{i}" for i in range(20)])
+
+    assert results.count(None) == len(failing)
+    assert context.peak_open <= 3
+    # A crashed tab is only replaced when another business needs a tab
+    assert len(context.opened) <= 3 + len(failing)
+    assert context.open == 0
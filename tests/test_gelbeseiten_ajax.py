@@ -0,0 +1,139 @@
+import pytest
+
+import scrapers.gelbeseiten.ajax as ajax
+from scrapers.gelbeseiten.ajax import OrderedBatches, batch_offsets, collect_batches
+from scrapers.gelbeseiten.config import GelbeseitenConfig
+
+
+@pytest.fixture(autouse=True)
+def fake_parser(monkeypatch):
+    # One entry per batch, named after the batch's html
+    monkeypatch.setattr(
+        ajax,
+        "parse_entries",
+        lambda html, query: [{"company_name": html}] if html else [],
+    )
+
+
+def _names(entries):
+    return [entry["company_name"] for entry in entries]
+
+
+def test_batch_offsets_cover_the_range(monkeypatch):
+    monkeypatch.setattr(GelbeseitenConfig, "ENTRIES_PER_REQUEST", 10)
+    assert batch_offsets(50, 75) == [(50, 10), (60, 10), (70, 5)]
+    assert batch_offsets(10, 10) == []
+
+
+def test_ordered_batches_release_entries_up_to_the_first_gap():
+    batches = OrderedBatches([(0, 10), (10, 10), (20, 10)])
+    batches.add(10, [{"company_name": "b"}])
+    assert batches.pop_ready() == []
+    batches.add(0, [{"company_name": "a"}])
+    assert _names(batches.pop_ready()) == ["a", "b"]
+    batches.add(20, [{"company_name": "c"}])
+    assert _names(batches.pop_ready()) == ["c"]
+    assert batches.received == 3
+
+
+def test_pop_remaining_skips_batches_given_up_on():
+    batches = OrderedBatches([(0, 10), (10, 10), (20, 10)])
+    batches.add(20, [{"company_name": "c"}])
+    batches.add(0, [{"company_name": "a"}])
+    assert _names(batches.pop_ready()) == ["a"]
+    assert _names(batches.pop_remaining()) == ["c"]
+    assert batches.pop_ready() == []
+
+
+def test_collect_batches_reports_errors_and_early_empty_batches():
+    window = [(0, 10), (10, 10), (20, 10), (30, 10)]
+    responses = [{"html": "a"}, {"error": "HTTP 429"}, None, {"html": ""}]
+    batches = OrderedBatches(window)
+    failed = collect_batches(window, responses, "Friseur", 100, batches)
+    assert failed == [(10, 10), (20, 10), (30, 10)]
+    assert _names(batches.pop_ready()) == ["a"]
+
+
+def test_empty_batch_past_the_end_is_not_a_failure():
+    window = [(90, 10), (100, 10)]
+    batches = OrderedBatches(window)
+    failed = collect_batches(
+        window, [{"html": "z"}, {"html": ""}], "Friseur", 95, batches
+    )
+    assert failed == []
+    assert _names(batches.pop_remaining()) == ["z"]
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.reserved = []
+        self.successes = 0
+        self.throttles = []
+
+    def reserve(self, count):
+        self.reserved.append(count)
+        return [0.0] * count
+
+    def report_success(self, count=1):
+        self.successes += count
+
+    def report_throttle(self, reason):
+        self.throttles.append(reason)
+
+
+class FakePage:
+    """Answers ajaxsuche windows, failing the listed positions on their first try."""
+
+    url = "https://www.gelbeseiten.de/friseur/berlin"
+
+    def __init__(self, fail_once):
+        self.fail_once = set(fail_once)
+        self.windows = []
+
+    def evaluate(self, script, args):
+        requests, base_url = args
+        positions = [int(r["formData"]["position"]) for r in requests]
+        self.windows.append(positions)
+        responses = []
+        for position in positions:
+            if position in self.fail_once:
+                self.fail_once.discard(position)
+                responses.append({"error": "HTTP 503"})
+            else:
+                responses.append({"html": f"entry-{position}"})
+        return responses
+
+
+def test_parallel_windows_retry_failures_and_keep_order(monkeypatch):
+    pytest.importorskip("playwright")
+    from scrapers.gelbeseiten.scraper import GelbeseitenScraper
+
+    monkeypatch.setattr(GelbeseitenConfig, "ENTRIES_PER_REQUEST", 10)
+    monkeypatch.setattr(GelbeseitenConfig, "PAGINATION_CONCURRENCY", 2)
+    monkeypatch.setattr(GelbeseitenConfig, "PAGINATION_RETRIES", 1)
+    browser = FakeBrowser()
+    page = FakePage(fail_once={10, 30})
+
+    records = GelbeseitenScraper()._iter_offsets(
+        browser, page, "friseur", "berlin", batch_offsets(0, 50), 50
+    )
+    assert _names(records) == [f"entry-{p}" for p in range(0, 50, 10)]
+    assert page.windows == [[0, 10], [20, 30], [40], [10, 30]]
+    assert browser.reserved == [2, 2, 1, 2]
+    assert browser.successes == 5
+    assert browser.throttles == ["2 ajaxsuche batches failed"]
+
+
+def test_batches_still_failing_after_retries_are_given_up(monkeypatch):
+    pytest.importorskip("playwright")
+    from scrapers.gelbeseiten.scraper import GelbeseitenScraper
+
+    monkeypatch.setattr(GelbeseitenConfig, "ENTRIES_PER_REQUEST", 10)
+    monkeypatch.setattr(GelbeseitenConfig, "PAGINATION_CONCURRENCY", 5)
+    monkeypatch.setattr(GelbeseitenConfig, "PAGINATION_RETRIES", 0)
+    page = FakePage(fail_once={10})
+
+    records = GelbeseitenScraper()._iter_offsets(
+        FakeBrowser(), page, "friseur", "berlin", batch_offsets(0, 30), 30
+    )
+    assert _names(records) == ["entry-0", "entry-20"]
@@ -0,0 +1,85 @@
+import base64
+
+import pytest
+
+pytest.importorskip("selectolax")
+
+from scrapers.gelbeseiten.parser import (  # noqa: E402
+    decode_website,
+    format_address,
+    parse_entries,
+    parse_total_count,
+    search_query_from_url,
+)
+
+
+def _article(name, website=None, address="", phone=""):
+    link = ""
+    if website is not None:
+        link = (
+            '<span class="mod-WebseiteKompakt__text" data-webseitelink="'
+            f'{base64.b64encode(website.encode()).decode()}">Webseite</span>'
+        )
+    return (
+        '<article class="mod">'
+        f'<h2 data-wipe-name="Titel"> {name} </h2>'
+        f'<div class="mod-AdresseKompakt__adress-text">{address}</div>'
+        f'<a class="mod-TelefonnummerKompakt__phoneNumber"> {phone} </a>'
+        f"{link}</article>"
+    )
+
+
+def test_search_query_from_url():
+    assert (
+        search_query_from_url("https://www.gelbeseiten.de/friseur/berlin") == "Friseur"
+    )
+
+
+def test_format_address():
+    assert (
+        format_address("  Musterstr. 1\n  10115 Berlin, Mitte\n  1,2 km")
+        == "Musterstr. 1, 10115 Berlin"
+    )
+    assert format_address("Musterstr. 1") == "Musterstr. 1"
+    assert format_address("\n\n") == ""
+
+
+def test_decode_website():
+    encoded = base64.b64encode(b"https://friseur.example").decode()
+    assert decode_website(encoded) == "https://friseur.example"
+    assert decode_website(None) == ""
+    assert decode_website("not base64!") == ""
+
+
+def test_parse_total_count():
+    assert parse_total_count('<span id="loadMoreGesamtzahl"> 123 </span>') == 123
+    assert parse_total_count('<span id="loadMoreGesamtzahl">viele</span>') is None
+    assert parse_total_count("<div></div>") is None
+
+
+def test_parse_entries():
+    html = "<div>{}{}</div>".format(
+        _article(
+            "Salon Schnitt",
+            website="https://salon.example",
+            address="Musterstr. 1\n10115 Berlin, Mitte",
+            phone="030 123456",
+        ),
+        _article("Haarwerk"),
+    )
+    first, second = parse_entries(html, "Friseur")
+
+    assert first["company_name"] == "Salon Schnitt"
+    assert first["company_website"] == "https://salon.example"
+    assert first["address"] == "Musterstr. 1, 10115 Berlin"
+    assert first["phone"] == "030 123456"
+    assert first["source"] == "gelbeseiten.de"
+    assert first["metadata"]["search_query"] == "Friseur"
+
+    assert second["company_name"] == "Haarwerk"
+    assert second["company_website"] == ""
+    assert second["address"] == ""
+
+
+def test_parse_entries_without_articles():
+    assert parse_entries("<html><body>Keine Treffer</body></html>", "Friseur") == []
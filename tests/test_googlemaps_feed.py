@@ -0,0 +1,175 @@
+import asyncio
+import types
+
+import pytest
+
+import scrapers.googlemaps.feed as feed
+from scrapers.googlemaps.config import GoogleMapsConfig
+from scrapers.googlemaps.feed import (
+    FeedRequests,
+    WaitStats,
+    wait_for_feed,
+    wait_for_feed_async,
+)
+
+SEARCH_URL = "https://www.google.com/search?tbm=map&q=friseur"
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeHandle:
+    def __init__(self, state):
+        self.state = state
+
+    def json_value(self):
+        return self.state
+
+
+class FakeAsyncHandle(FakeHandle):
+    async def json_value(self):
+        return self.state
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(
+        feed, "time", types.SimpleNamespace(monotonic=clock, perf_counter=clock)
+    )
+    monkeypatch.setattr(GoogleMapsConfig, "FEED_IDLE_MS", 1500)
+    monkeypatch.setattr(GoogleMapsConfig, "FEED_WAIT_TIMEOUT_MS", 10000)
+    return clock
+
+
+class FakePage:
+    """Sync page whose DOM wait either resolves or times out after ``timeout``.
+
+    ``steps`` are consumed one per wait_for_function call: a state dict
+    resolves the wait, anything callable runs (e.g. a request finishing)
+    before the wait times out.
+    """
+
+    def __init__(self, clock, steps):
+        self.clock = clock
+        self.steps = list(steps)
+        self.timeouts = []
+
+    def wait_for_function(self, script, arg, polling, timeout):
+        assert polling == "mutation"
+        self.timeouts.append(timeout)
+        step = self.steps.pop(0) if self.steps else None
+        if isinstance(step, dict):
+            return FakeHandle(step)
+        self.clock.advance(timeout / 1000)
+        if step:
+            step()
+        raise TimeoutError("Timeout exceeded")
+
+
+def test_feed_requests_track_only_search_requests(fake_time):
+    requests = FeedRequests()
+    requests._started(FakeRequest("https://www.google.com/maps/vt?pb=tile"))
+    assert requests.in_flight == 0
+    requests._started(FakeRequest(SEARCH_URL))
+    fake_time.advance(5)
+    assert requests.quiet_for() == 0.0
+    requests._finished(FakeRequest(SEARCH_URL))
+    fake_time.advance(2)
+    assert requests.quiet_for() == 2.0
+    requests._finished(FakeRequest(SEARCH_URL))
+    assert requests.in_flight == 0
+
+
+def test_new_cards_end_the_wait(fake_time):
+    stats = WaitStats()
+    page = FakePage(fake_time, [{"count": 14, "end": False}])
+    assert wait_for_feed(page, 7, FeedRequests(), stats) == (14, False)
+    assert stats.waits == 1
+
+
+def test_end_of_list_marker_ends_the_feed(fake_time):
+    page = FakePage(fake_time, [{"count": 7, "end": True}])
+    assert wait_for_feed(page, 7, FeedRequests(), WaitStats()) == (7, True)
+
+
+def test_idle_feed_ends_after_one_idle_period(fake_time):
+    stats = WaitStats()
+    page = FakePage(fake_time, [])
+    assert wait_for_feed(page, 7, FeedRequests(), stats) == (7, True)
+    assert page.timeouts == [1500]
+    assert stats.wait_seconds == pytest.approx(1.5)
+
+
+def test_request_in_flight_keeps_waiting_for_cards(fake_time):
+    requests = FeedRequests()
+    requests._started(FakeRequest(SEARCH_URL))
+    page = FakePage(
+        fake_time,
+        [
+            None,
+            lambda: requests._finished(FakeRequest(SEARCH_URL)),
+            {"count": 9, "end": False},
+        ],
+    )
+    assert wait_for_feed(page, 7, requests, WaitStats()) == (9, False)
+    assert len(page.timeouts) == 3
+
+
+def test_wait_gives_up_at_the_timeout(fake_time):
+    requests = FeedRequests()
+    requests._started(FakeRequest(SEARCH_URL))
+    stats = WaitStats()
+    page = FakePage(fake_time, [])
+    assert wait_for_feed(page, 7, requests, stats) == (7, True)
+    assert sum(page.timeouts) == pytest.approx(10000)
+    assert page.timeouts[-1] == pytest.approx(10000 - 6 * 1500)
+
+
+class FakeAsyncPage:
+    def __init__(self, state=None):
+        self.state = state
+        self.cancelled = False
+
+    async def wait_for_function(self, script, arg, polling, timeout):
+        if self.state is not None:
+            return FakeAsyncHandle(self.state)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def test_async_new_cards_win_over_a_busy_feed():
+    requests = FeedRequests()
+    requests._started(FakeRequest(SEARCH_URL))
+    page = FakeAsyncPage({"count": 20, "end": False})
+    stats = WaitStats()
+    result = asyncio.run(wait_for_feed_async(page, 7, requests, stats))
+    assert result == (20, False)
+    assert stats.waits == 1
+
+
+def test_async_idle_feed_cancels_the_dom_wait(fake_time):
+    requests = FeedRequests()
+    fake_time.advance(2)
+    page = FakeAsyncPage()
+    result = asyncio.run(wait_for_feed_async(page, 7, requests, WaitStats()))
+    assert result == (7, True)
+    assert page.cancelled
+
+
+def test_wait_idle_waits_for_the_request_in_flight():
+    requests = FeedRequests()
+    requests._started(FakeRequest(SEARCH_URL))
+
+    async def run():
+        idle = asyncio.create_task(requests.wait_idle(0.01))
+        await asyncio.sleep(0.05)
+        assert not idle.done()
+        requests._finished(FakeRequest(SEARCH_URL))
+        await asyncio.wait_for(idle, 1)
+
+    asyncio.run(run())
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from scrapers.googlemaps.payload import (
+    XSSI_PREFIX,
+    ids_from_href,
+    load_payload,
+    parse_place,
+    places_from_html,
+    places_from_response,
+)
+
+FEATURE_ID = "0x47a84e373f035901:0x42120465b5e3b70"
+
+
+def _place(name="Salon Schnitt", feature_id=FEATURE_ID):
+    """A place entry with the fields parse_place reads, everything else None."""
+    node = [None] * 179
+    node[2] = ["Musterstr. 1", "10115 Berlin"]
+    node[7] = ["https://salon.example"]
+    node[9] = [None, None, 52.52, 13.405]
+    node[10] = feature_id
+    node[11] = name
+    node[13] = ["Friseursalon"]
+    node[78] = "ChIJ123"
+    node[178] = [["030 123456"]]
+    return node
+
+
+def test_load_payload_strips_xssi_and_d_wrapper():
+    inner = XSSI_PREFIX + json.dumps([1, [2]])
+    assert load_payload(XSSI_PREFIX + "\n" + json.dumps({"d": inner})) == [1, [2]]
+    assert load_payload("[3]") == [3]
+
+
+def test_ids_from_href():
+    href = (
+        "https://www.google.com/maps/place/Salon/data=!4m7!3m6"
+        f"!1s{FEATURE_ID}!8m2!3d52.52!4d13.405!16s%2Fg%2F11!19sChIJ123?authuser=0"
+    )
+    assert ids_from_href(href) == (FEATURE_ID, "ChIJ123")
+    assert ids_from_href("https://www.google.com/maps/place/Salon") == (None, None)
+
+
+def test_places_from_response_finds_places_at_any_depth():
+    payload = [None, [["wrapper", [_place()]], [_place("Haarwerk", "0x1:0x2")]]]
+    places = places_from_response(XSSI_PREFIX + json.dumps(payload))
+
+    assert [place["name"] for place in places] == ["Salon Schnitt", "Haarwerk"]
+    salon = places[0]
+    assert salon["address"] == "Musterstr. 1, 10115 Berlin"
+    assert salon["phone"] == "030 123456"
+    assert salon["url"] == "https://salon.example"
+    assert salon["feature_id"] == FEATURE_ID
+    assert salon["place_id"] == "ChIJ123"
+    assert (salon["latitude"], salon["longitude"]) == (52.52, 13.405)
+    assert salon["category"] == "Friseursalon"
+
+
+def test_places_from_response_decodes_embedded_payloads():
+    embedded = XSSI_PREFIX + json.dumps([[_place()]])
+    places = places_from_response(json.dumps(["outer", embedded]))
+    assert [place["name"] for place in places] == ["Salon Schnitt"]
+
+
+def test_places_from_response_ignores_other_bodies():
+    assert places_from_response("<html>not json</html>") == []
+    assert places_from_response(json.dumps([["0x1:0x2", "no place"]])) == []
+
+
+def test_places_from_html():
+    state = json.dumps([[None, [_place()]]])
+    html = (
+        f"<script>window.APP_INITIALIZATION_STATE={state};window.APP_FLAGS=[];</script>"
+    )
+    assert [place["name"] for place in places_from_html(html)] == ["Salon Schnitt"]
+    assert places_from_html("<html></html>") == []
+
+
+def test_places_without_website_or_phone_need_their_details_page():
+    pytest.importorskip("playwright")
+    from scrapers.googlemaps.scraper import _has_required_fields, _missing_fields
+
+    place = parse_place(_place())
+    assert _has_required_fields(place)
+    place = {**place, "url": "", "phone": ""}
+    assert _missing_fields(place) == ["phone", "url"]
+    assert not _has_required_fields(place)
@@ -0,0 +1,32 @@
+import pickle
+
+from scrapers.googlemaps.places import PlaceIndex, place_key
+
+FEATURE_ID = "0x47a84e373f035901:0x42120465b5e3b70"
+
+
+def test_place_key_prefers_feature_id_then_place_id_then_coordinates():
+    base = "https://www.google.com/maps/place/Salon/data=!4m7!3m6"
+    assert place_key(f"{base}!1s{FEATURE_ID}!19sChIJ123") == FEATURE_ID
+    assert place_key(f"{base}!19sChIJ123") == "ChIJ123"
+    assert place_key(f"{base}!3d52.52!4d13.405") == "52.520000,13.405000"
+    assert place_key(f"{base}?authuser=0") == base
+
+
+def test_place_index_persists_and_pickles_by_path(tmp_path):
+    path = str(tmp_path / "places.db")
+    index = PlaceIndex(path)
+    index.add(FEATURE_ID, "Salon Schnitt")
+    index.add(FEATURE_ID, "Salon Schnitt")
+    assert FEATURE_ID in index
+    assert len(index) == 1
+
+    copy = pickle.loads(pickle.dumps(index))
+    try:
+        assert copy.path == path
+        assert FEATURE_ID in copy
+        copy.add("ChIJ123")
+    finally:
+        copy.close()
+    assert "ChIJ123" in index
+    index.close()
@@ -0,0 +1,49 @@
+from config.grid_runner import Deduplicator, company_key, expand_grid, read_terms
+
+
+def test_read_terms_from_string_list_and_file(tmp_path):
+    assert read_terms(" friseur, bäcker ,,friseur") == ["friseur", "bäcker"]
+    assert read_terms(["a", " ", "b", "a"]) == ["a", "b"]
+    path = tmp_path / "cities.txt"
+    path.write_text("berlin\n# comment\n\nhamburg  # north\nberlin\n", encoding="utf-8")
+    assert read_terms(str(path)) == ["berlin", "hamburg"]
+
+
+def test_expand_grid_groups_jobs_by_location():
+    jobs = expand_grid("gelbeseiten", ["friseur", "bäcker"], ["berlin", "köln"], 50)
+    assert [(job["query"], job["location"]) for job in jobs] == [
+        ("friseur", "berlin"),
+        ("bäcker", "berlin"),
+        ("friseur", "köln"),
+        ("bäcker", "köln"),
+    ]
+    assert all(job["max_entries"] == 50 for job in jobs)
+
+
+def test_company_key_prefers_place_key():
+    record = {"metadata": {"place_key": "0x1:0x2"}, "company_name": "A"}
+    assert company_key(record) == ("place", "0x1:0x2")
+    assert company_key(
+        {
+            "source": "gelbeseiten.de",
+            "company_name": "Salon-Schnitt GmbH",
+            "address": "X",
+        }
+    ) == company_key(
+        {
+            "source": "gelbeseiten.de",
+            "company_name": "salon schnitt gmbh",
+            "address": "x",
+        }
+    )
+
+
+def test_deduplicator_drops_repeats():
+    deduplicator = Deduplicator()
+    records = [
+        {"source": "s", "company_name": "A", "address": "1"},
+        {"source": "s", "company_name": "a", "address": "1"},
+        {"source": "s", "company_name": "B", "address": "1"},
+    ]
+    assert [r["company_name"] for r in deduplicator.filter(records)] == ["A", "B"]
+    assert deduplicator.duplicates == 1
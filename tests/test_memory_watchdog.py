@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("psutil")
+
+import config.memory_watchdog as memory_watchdog  # noqa: E402
+from config.memory_watchdog import MemoryWatchdog  # noqa: E402
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    readings = {"mb": 0.0}
+    monkeypatch.setattr(memory_watchdog, "browser_memory_mb", lambda: readings["mb"])
+    return readings
+
+
+def test_too_many_pages_recycles_on_every_check(memory):
+    watchdog = MemoryWatchdog(memory_limit_mb=0, max_pages=5, check_interval=100)
+    assert watchdog.recycle_reason(5) is None
+    assert watchdog.recycle_reason(6) == "6 open pages"
+    assert watchdog.recycle_reason(7) == "7 open pages"
+
+
+def test_memory_is_sampled_every_check_interval(memory):
+    watchdog = MemoryWatchdog(memory_limit_mb=1000, max_pages=0, check_interval=3)
+    memory["mb"] = 2000.0
+    assert watchdog.recycle_reason(1) is None
+    assert watchdog.recycle_reason(1) is None
+    assert watchdog.recycle_reason(1) == "browser memory 2000 MB"
+    assert watchdog.peak_mb == 2000.0
+
+
+def test_memory_at_the_limit_is_healthy(memory):
+    watchdog = MemoryWatchdog(memory_limit_mb=1000, max_pages=0, check_interval=1)
+    memory["mb"] = 1000.0
+    assert watchdog.recycle_reason(1) is None
+    memory["mb"] = 1000.5
+    assert watchdog.recycle_reason(1) is not None
+
+
+def test_zero_limits_disable_the_checks(memory):
+    watchdog = MemoryWatchdog(memory_limit_mb=0, max_pages=0, check_interval=1)
+    memory["mb"] = 10_000.0
+    assert watchdog.recycle_reason(500) is None
+
+
+def test_job_peak_resets_but_run_peak_does_not(memory):
+    watchdog = MemoryWatchdog(check_interval=1)
+    memory["mb"] = 800.0
+    watchdog.sample()
+    memory["mb"] = 300.0
+    assert watchdog.reset_job_peak() == 800.0
+    assert watchdog.reset_job_peak() == 300.0
+    assert watchdog.peak_mb == 800.0
@@ -0,0 +1,191 @@
+import pytest
+
+import config.proxy_pool as proxy_pool_module
+from config.proxy_pool import ProxyPool, proxy_settings, reserve_slots, wait_for_slot
+from config.rate_limiter import RateLimiter
+
+
+def _pool(clock, count=2, requests_per_minute=30, **kwargs):
+    return ProxyPool(
+        [f"http://user:pw@proxy{i}:8080" for i in range(count)],
+        requests_per_minute,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _requests_sent(clock, proxies, minutes=10, **kwargs):
+    """Requests one context per proxy gets out in ``minutes`` of fake time."""
+    pool = _pool(clock, proxies, **kwargs)
+    domain = RateLimiter(pool.domain_requests_per_minute, clock=clock)
+    contexts = [pool.acquire() for _ in range(proxies)]
+    ready = [0.0] * proxies
+    end = minutes * 60
+    sent = 0
+    while True:
+        context = min(range(proxies), key=ready.__getitem__)
+        clock.now = ready[context]
+        proxy = contexts[context].rate_limiter
+        (delay,) = reserve_slots(domain, "gelbeseiten.de", proxy)
+        if clock.now + delay >= end:
+            return sent
+        sent += 1
+        ready[context] = clock.now + delay
+
+
+def test_proxy_settings_splits_credentials():
+    assert proxy_settings("http://user:pw@proxy:8080") == {
+        "server": "http://proxy:8080",
+        "username": "user",
+        "password": "pw",
+    }
+    assert proxy_settings("proxy:3128") == {"server": "http://proxy:3128"}
+    assert proxy_settings(None) is None
+
+
+def test_domain_budget_defaults_to_the_proxies_combined(clock):
+    assert _pool(clock, 3, 30).domain_requests_per_minute == 90
+    assert (
+        _pool(clock, 3, 30, domain_requests_per_minute=40).domain_requests_per_minute
+        == 40
+    )
+
+
+def test_more_proxies_give_proportionally_more_throughput(clock):
+    one = _requests_sent(clock, 1)
+    three = _requests_sent(clock, 3)
+    assert one == pytest.approx(330, abs=2)
+    assert three / one == pytest.approx(3, rel=0.05)
+
+
+def test_explicit_domain_budget_caps_the_pool(clock):
+    one = _requests_sent(clock, 1)
+    capped = _requests_sent(clock, 3, domain_requests_per_minute=30)
+    assert capped == pytest.approx(one, rel=0.1)
+
+
+def test_slots_wait_for_the_tighter_limit_not_both(clock):
+    domain = RateLimiter(60, burst=1, clock=clock)
+    proxy = RateLimiter(60, burst=1, clock=clock)
+    assert reserve_slots(domain, "a.de", proxy, count=3) == pytest.approx(
+        [0.0, 1.0, 2.0]
+    )
+    slower = RateLimiter(30, burst=1, clock=clock)
+    assert reserve_slots(domain, "b.de", slower, count=2) == pytest.approx([0.0, 2.0])
+
+
+def test_wait_for_slot_sleeps_once(monkeypatch, clock):
+    slept = []
+    monkeypatch.setattr(proxy_pool_module.time, "sleep", slept.append)
+    domain = RateLimiter(60, burst=1, clock=clock)
+    proxy = RateLimiter(60, burst=1, clock=clock)
+    wait_for_slot(domain, "a.de", proxy)
+    wait_for_slot(domain, "a.de", proxy)
+    assert slept == [pytest.approx(1.0)]
+
+
+def test_blocked_proxy_is_quarantined_and_comes_back(clock):
+    pool = _pool(clock, quarantine_seconds=300)
+    first = pool.acquire()
+    pool.release(first)
+    pool.report_failure(first, blocked=True)
+    assert first.is_quarantined()
+
+    other = pool.acquire()
+    assert other is not first
+    pool.release(other)
+
+    clock.advance(300)
+    assert not first.is_quarantined()
+
+
+def test_consecutive_failures_quarantine_and_successes_reset(clock):
+    pool = _pool(clock, failure_threshold=3)
+    proxy = pool.proxies[0]
+    pool.report_failure(proxy)
+    pool.report_failure(proxy)
+    pool.report_success(proxy)
+    pool.report_failure(proxy)
+    pool.report_failure(proxy)
+    assert not proxy.is_quarantined()
+    pool.report_failure(proxy)
+    assert proxy.is_quarantined()
+
+
+def test_slow_proxy_is_quarantined(clock):
+    pool = _pool(clock, max_latency=5.0)
+    proxy = pool.proxies[0]
+    pool.report_success(proxy, latency=20.0)
+    pool.report_success(proxy, latency=20.0)
+    assert not proxy.is_quarantined()
+    pool.report_success(proxy, latency=20.0)
+    assert proxy.is_quarantined()
+
+
+def test_healthiest_proxy_is_preferred(clock):
+    pool = _pool(clock)
+    good, bad = pool.proxies
+    for _ in range(5):
+        pool.report_success(good, latency=0.2)
+    pool.report_failure(bad)
+    assert pool.acquire() is good
+
+
+def test_all_quarantined_uses_the_one_released_soonest(clock):
+    pool = _pool(clock, quarantine_seconds=100)
+    first, second = pool.proxies
+    pool.report_failure(first, blocked=True)
+    clock.advance(10)
+    pool.report_failure(second, blocked=True)
+    assert pool.acquire() is first
+
+
+class FakeRequest:
+    def __init__(self, resource_type="document", failure=None, timing=None):
+        self.resource_type = resource_type
+        self.failure = failure
+        self.timing = timing or {}
+
+
+class FakeResponse:
+    def __init__(self, status, request):
+        self.status = status
+        self.request = request
+
+
+class FakeContext:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class FakeBlocker:
+    def __init__(self, aborted):
+        self._aborted = aborted
+
+    def aborted(self, request):
+        return request in self._aborted
+
+
+def test_attach_scores_only_real_outcomes(clock):
+    pool = _pool(clock, failure_threshold=10)
+    proxy = pool.proxies[0]
+    blocked_image = FakeRequest("fetch", failure="net::ERR_FAILED")
+    context = FakeContext()
+    pool.attach(context, proxy, FakeBlocker({blocked_image}))
+    on_response = context.handlers["response"]
+    on_request_failed = context.handlers["requestfailed"]
+
+    on_response(FakeResponse(200, FakeRequest(timing={"responseStart": 250})))
+    on_response(FakeResponse(404, FakeRequest("image")))
+    on_request_failed(blocked_image)
+    on_request_failed(FakeRequest(failure="net::ERR_ABORTED"))
+    assert (proxy.successes, proxy.failures) == (1, 0)
+    assert proxy.latency == pytest.approx(0.25)
+
+    on_request_failed(FakeRequest(failure="net::ERR_TIMED_OUT"))
+    assert proxy.failures == 1
+    on_response(FakeResponse(429, FakeRequest("xhr")))
+    assert proxy.is_quarantined()
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from config.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_token_bucket_goes_negative_and_pays_back():
+    bucket = TokenBucket(rate=1.0, capacity=2, now=0.0)
+    assert bucket.reserve(0.0) == 0.0
+    assert bucket.reserve(0.0) == 0.0
+    assert bucket.reserve(0.0) == pytest.approx(1.0)
+    assert bucket.reserve(0.0) == pytest.approx(2.0)
+    assert not bucket.is_idle(0.0)
+    assert bucket.is_idle(10.0)
+
+
+def test_default_burst_is_a_minute_of_requests(clock):
+    limiter = RateLimiter(60, clock=clock)
+    assert limiter.burst == 60
+    delays = [limiter.reserve() for _ in range(61)]
+    assert delays[:60] == [0.0] * 60
+    assert delays[60] == pytest.approx(1.0)
+
+
+def test_burst_of_one_spaces_requests_evenly(clock):
+    limiter = RateLimiter(30, burst=1, clock=clock)
+    assert [limiter.reserve() for _ in range(3)] == pytest.approx([0.0, 2.0, 4.0])
+    clock.now = 4.0
+    assert limiter.reserve() == pytest.approx(2.0)
+
+
+def test_keys_have_separate_buckets(clock):
+    limiter = RateLimiter(60, burst=1, clock=clock)
+    assert limiter.reserve("a.de") == 0.0
+    assert limiter.reserve("b.de") == 0.0
+    assert limiter.reserve("a.de") == pytest.approx(1.0)
+
+
+def test_non_positive_rate_disables_limiting(clock):
+    limiter = RateLimiter(0, clock=clock)
+    assert limiter.burst == 1
+    assert all(limiter.reserve() == 0.0 for _ in range(100))
+
+
+def test_wait_async_sleeps_for_the_reserved_delay(monkeypatch, clock):
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter = RateLimiter(60, burst=1, clock=clock)
+
+    async def run():
+        await limiter.wait_async()
+        await limiter.wait_async()
+
+    asyncio.run(run())
+    assert slept == [pytest.approx(1.0)]
@@ -0,0 +1,107 @@
+import pytest
+
+from config.config import ScraperConfig
+from config.shared_rate_limiter import (
+    RedisBackend,
+    SharedRateLimiter,
+    SQLiteBackend,
+    backend_from_url,
+    create_rate_limiter,
+    gcra_reserve,
+    rate_limit_backend_url,
+)
+
+
+def test_gcra_allows_burst_then_spaces_requests():
+    tat, delays = None, []
+    for _ in range(4):
+        tat, delay = gcra_reserve(tat, now=0.0, interval=1.0, burst=2)
+        delays.append(delay)
+    assert delays == [0.0, 0.0, 1.0, 2.0]
+    assert tat == 4.0
+
+
+def test_gcra_does_not_bank_idle_time():
+    tat, _ = gcra_reserve(None, now=0.0, interval=1.0, burst=1)
+    tat, delay = gcra_reserve(tat, now=100.0, interval=1.0, burst=1)
+    assert delay == 0.0
+    assert tat == 101.0
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "limits" / "rate.db")
+
+
+def test_sqlite_backends_share_one_budget(sqlite_path):
+    first, second = SQLiteBackend(sqlite_path), SQLiteBackend(sqlite_path)
+    try:
+        assert first.reserve("gelbeseiten.de", 0.0, 1.0, 1) == 0.0
+        assert second.reserve("gelbeseiten.de", 0.0, 1.0, 1) == 1.0
+        assert second.reserve("google.com", 0.0, 1.0, 1) == 0.0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_shared_rate_limiter_uses_backend_per_key(sqlite_path):
+    backend = SQLiteBackend(sqlite_path)
+    limiter = SharedRateLimiter(60, backend, burst=1, clock=lambda: 1000.0)
+    try:
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(1.0)
+        assert limiter.reserve("google.com") == 0.0
+        assert SharedRateLimiter(0, backend).reserve() == 0.0
+    finally:
+        backend.close()
+
+
+def test_backend_from_url(sqlite_path):
+    backend = backend_from_url(f"sqlite:///{sqlite_path}")
+    assert isinstance(backend, SQLiteBackend)
+    assert backend.path == sqlite_path
+    backend.close()
+    with pytest.raises(ValueError):
+        backend_from_url("memcached://localhost")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def eval(self, script, numkeys, *args):
+        self.calls.append((numkeys, args))
+        return b"0.5"
+
+    def close(self):
+        self.closed = True
+
+
+def test_redis_backend_decodes_the_script_result():
+    client = FakeRedis()
+    backend = RedisBackend(client, prefix="test:")
+    assert backend.reserve("google.com", 10.0, 2.0, 3) == 0.5
+    assert client.calls == [(1, ("test:google.com", 10.0, 2.0, 3))]
+    backend.close()
+    assert client.closed
+
+
+def test_closing_the_limiter_closes_its_backend():
+    client = FakeRedis()
+    SharedRateLimiter(60, RedisBackend(client)).close()
+    assert client.closed
+
+
+def test_create_rate_limiter_reads_the_scraper_backend(monkeypatch, sqlite_path):
+    monkeypatch.setattr(ScraperConfig, "RATE_LIMIT_BACKEND", None)
+
+    class Config:
+        RATE_LIMIT_BACKEND = f"sqlite:///{sqlite_path}"
+
+    assert rate_limit_backend_url() is None
+    assert rate_limit_backend_url(Config) == Config.RATE_LIMIT_BACKEND
+    limiter = create_rate_limiter(Config, 30)
+    assert isinstance(limiter, SharedRateLimiter)
+    limiter.close()
+    assert create_rate_limiter(None, 30) is None
@@ -0,0 +1,44 @@
+import pytest
+
+from config.config import ScraperConfig
+from config.worker_farm import normalize_job, worker_rates
+from scrapers.gelbeseiten.config import GelbeseitenConfig
+
+
+@pytest.fixture(autouse=True)
+def no_backend(monkeypatch):
+    monkeypatch.setattr(ScraperConfig, "RATE_LIMIT_BACKEND", None)
+
+
+def test_normalize_job():
+    assert normalize_job(("gelbeseiten", "friseur", "berlin")) == {
+        "scraper": "gelbeseiten",
+        "query": "friseur",
+        "location": "berlin",
+        "max_entries": None,
+    }
+    with pytest.raises(ValueError):
+        normalize_job(("yelp", "friseur", "berlin"))
+
+
+def test_budget_is_split_across_workers():
+    assert worker_rates({"gelbeseiten", "googlemaps"}, 120, 4) == {
+        "gelbeseiten": 30,
+        "googlemaps": 30,
+    }
+    assert worker_rates({"gelbeseiten"}, 3, 8) == {"gelbeseiten": 1}
+
+
+def test_scraper_backend_gives_every_worker_the_total(monkeypatch):
+    monkeypatch.setattr(
+        GelbeseitenConfig, "RATE_LIMIT_BACKEND", "sqlite:///limits.db", raising=False
+    )
+    assert worker_rates({"gelbeseiten", "googlemaps"}, 120, 4) == {
+        "gelbeseiten": 120,
+        "googlemaps": 30,
+    }
+
+
+def test_global_backend_gives_every_worker_the_total(monkeypatch):
+    monkeypatch.setattr(ScraperConfig, "RATE_LIMIT_BACKEND", "sqlite:///limits.db")
+    assert worker_rates({"googlemaps"}, 120, 4) == {"googlemaps": 120}
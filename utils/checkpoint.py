@@ -0,0 +1,169 @@
+from datetime import datetime
+import json
+import logging
+import os
+import re
+from typing import Dict, Optional
+
+from config.config import ScraperConfig
+from utils.sinks import read_jsonl
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_path(
+    source: str,
+    query: str,
+    location: str,
+    directory: str = ScraperConfig.CHECKPOINT_DIR,
+) -> str:
+    """File a (source, query, location) job keeps its checkpoint in."""
+    name = "_".join(
+        re.sub(r"[^\w.-]", "_", part.lower()) for part in (source, query, location)
+    )
+    return os.path.join(directory, f"{name}.json")
+
+
+class Checkpoint:
+    """Progress of one scraping job, saved to disk so a crashed run can resume.
+
+    Tracks how many records were written (the Gelbeseiten offset), the keys
+    of the records already scraped (Google Maps place keys) and the partial
+    JSONL output file. The checkpoint is saved every ``interval`` records and
+    when the job stops, and deleted once the job completes. After a hard kill
+    the output file is ahead of the last save, so a resumed checkpoint
+    catches up with it.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        query: str,
+        location: str,
+        output_path: Optional[str] = None,
+        directory: str = ScraperConfig.CHECKPOINT_DIR,
+        interval: int = ScraperConfig.CHECKPOINT_INTERVAL,
+    ):
+        self.source = source
+        self.query = query
+        self.location = location
+        self.output_path = output_path
+        self.path = checkpoint_path(source, query, location, directory)
+        self.interval = interval
+        self.count = 0
+        self.seen = set()
+        self.started = datetime.now().isoformat()
+        self._unsaved = 0
+
+    @classmethod
+    def open(
+        cls,
+        source: str,
+        query: str,
+        location: str,
+        output_path: Optional[str] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> "Checkpoint":
+        """Load the job's checkpoint when resuming, otherwise start a fresh one.
+
+        A fresh checkpoint keeps ``output_path``; a resumed one continues
+        writing to the partial output file of the interrupted run.
+        """
+        checkpoint = cls(source, query, location, output_path, **kwargs)
+        if not resume:
+            return checkpoint
+        try:
+            with open(checkpoint.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            logger.info(
+                f"No checkpoint for {source} {query} in {location}, starting over"
+            )
+            return checkpoint
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {checkpoint.path}: {e}")
+            return checkpoint
+
+        checkpoint.count = state.get("count", 0)
+        checkpoint.seen = set(state.get("seen", []))
+        checkpoint.started = state.get("started", checkpoint.started)
+        checkpoint.output_path = state.get("output_path") or output_path
+        checkpoint._catch_up_with_output()
+        logger.info(
+            f"Resuming {source} {query} in {location} after {checkpoint.count} records"
+        )
+        return checkpoint
+
+    def _catch_up_with_output(self):
+        """Count the records the output file holds beyond the last save."""
+        if not self.output_path:
+            return
+        try:
+            records = read_jsonl(self.output_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Could not read {self.output_path}: {e}")
+            return
+        if len(records) > self.count:
+            logger.info(
+                f"{len(records) - self.count} records in {self.output_path} "
+                "were written after the last checkpoint"
+            )
+            self.count = len(records)
+        for record in records:
+            key = (record.get("metadata") or {}).get("place_key")
+            if key:
+                self.seen.add(key)
+
+    @property
+    def resumed(self) -> bool:
+        return self.count > 0
+
+    def add(self, record: Dict, key: Optional[str] = None):
+        """Count a record that reached the output, saving every ``interval`` records."""
+        self.count += 1
+        if key:
+            self.seen.add(key)
+        self._unsaved += 1
+        if self._unsaved >= self.interval:
+            self.save()
+
+    def save(self):
+        """Write the checkpoint atomically."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        state = {
+            "source": self.source,
+            "query": self.query,
+            "location": self.location,
+            "count": self.count,
+            "seen": sorted(self.seen),
+            "output_path": self.output_path,
+            "started": self.started,
+            "updated": datetime.now().isoformat(),
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+    def complete(self):
+        """Remove the checkpoint of a finished job."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.complete()
+        else:
+            self.save()
+            logger.warning(
+                f"Job stopped after {self.count} records, checkpoint saved to {self.path}"
+            )
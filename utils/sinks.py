@@ -0,0 +1,145 @@
+from datetime import datetime
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+def jsonl_path(path, source, *job: str) -> str:
+    """Timestamped JSONL file name in ``path``, like store_data_as_json uses.
+
+    ``job`` parts (e.g. query and location) are added to the name, so a
+    job's file never holds records of another job started the same second.
+    """
+    name = "_".join([source] + [re.sub(r"[^\w.-]", "_", part.lower()) for part in job])
+    return os.path.join(
+        path, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    )
+
+
+def read_jsonl(path: str) -> List[Dict]:
+    """Read back the records a JsonlSink wrote, skipping a line cut off by a kill."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+class JsonlSink:
+    """Appends records to a JSON Lines file, one line per record.
+
+    Every record is flushed as it is written, so a crashed run keeps
+    everything it scraped up to that point.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        if self._file.tell() and not _ends_with_newline(path):
+            # Keep appended records off a line a killed run left unfinished
+            self._file.write("\n")
+        self.count = 0
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class DatabaseSink:
+    """Inserts records into a database table as they arrive."""
+
+    def __init__(self, table: str, db=None):
+        if db is None:
+            from utils.db import DatabaseManager
+
+            db = DatabaseManager()
+        self.table = table
+        self.db = db
+        self.count = 0
+
+    def write(self, record: Dict):
+        self.db.store_data(self.table, record)
+        self.count += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class MultiSink:
+    """Writes every record to several sinks."""
+
+    def __init__(self, sinks: List):
+        self.sinks = sinks
+        self.count = 0
+
+    def write(self, record: Dict):
+        for sink in self.sinks:
+            sink.write(record)
+        self.count += 1
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def create_sink(
+    storage_type: str,
+    table: str,
+    data_dir: str,
+    source: str,
+    path: Optional[str] = None,
+) -> MultiSink:
+    """Build the sinks for a CLI storage choice ("database", "json" or "both").
+
+    ``path`` overrides the JSONL file, e.g. to append to a resumed run's output.
+    """
+    sinks = []
+    if storage_type in ("database", "both"):
+        sinks.append(DatabaseSink(table))
+    if storage_type in ("json", "both"):
+        sinks.append(JsonlSink(path or jsonl_path(data_dir, source)))
+    return MultiSink(sinks)
+
+
+def drain(records: Iterable[Dict], sink) -> int:
+    """Write ``records`` to ``sink`` one at a time and return how many were written."""
+    count = 0
+    for record in records:
+        sink.write(record)
+        count += 1
+    return count